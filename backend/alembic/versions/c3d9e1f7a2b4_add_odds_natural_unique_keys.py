@@ -0,0 +1,83 @@
+"""add odds natural unique keys
+
+Revision ID: c3d9e1f7a2b4
+Revises: a8f4c2d9b731
+Create Date: 2026-10-18 00:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "c3d9e1f7a2b4"
+down_revision: Union[str, Sequence[str], None] = "a8f4c2d9b731"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Collapse duplicates left by the old select-then-insert writer, repointing
+    # children at the newest parent row before the constraints are added.
+    op.execute(
+        """
+        WITH keepers AS (
+            SELECT id, MAX(id) OVER (PARTITION BY event_id, key) AS keep_id
+            FROM bookmakers
+        )
+        UPDATE markets m
+        SET bookmaker_id = k.keep_id
+        FROM keepers k
+        WHERE m.bookmaker_id = k.id AND k.id <> k.keep_id
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM bookmakers b
+        USING bookmakers newer
+        WHERE b.event_id = newer.event_id AND b.key = newer.key AND b.id < newer.id
+        """
+    )
+    op.execute(
+        """
+        WITH keepers AS (
+            SELECT id, MAX(id) OVER (PARTITION BY bookmaker_id, key) AS keep_id
+            FROM markets
+        )
+        UPDATE player_props p
+        SET market_id = k.keep_id
+        FROM keepers k
+        WHERE p.market_id = k.id AND k.id <> k.keep_id
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM markets m
+        USING markets newer
+        WHERE m.bookmaker_id = newer.bookmaker_id AND m.key = newer.key AND m.id < newer.id
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM player_props p
+        USING player_props newer
+        WHERE p.market_id = newer.market_id
+          AND p.player_name = newer.player_name
+          AND p.side = newer.side
+          AND p.line = newer.line
+          AND p.id < newer.id
+        """
+    )
+
+    op.create_unique_constraint("uq_bookmaker_event_key", "bookmakers", ["event_id", "key"])
+    op.create_unique_constraint("uq_market_bookmaker_key", "markets", ["bookmaker_id", "key"])
+    op.create_unique_constraint(
+        "uq_player_prop_outcome",
+        "player_props",
+        ["market_id", "player_name", "side", "line"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_player_prop_outcome", "player_props", type_="unique")
+    op.drop_constraint("uq_market_bookmaker_key", "markets", type_="unique")
+    op.drop_constraint("uq_bookmaker_event_key", "bookmakers", type_="unique")
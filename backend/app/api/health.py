@@ -1,8 +1,16 @@
 # Health check endpoint
 from fastapi import APIRouter
 
+from app.services.cache import CACHE
+
 router = APIRouter()
 
 @router.get("/health")
 def health():
     return {"status": "ok"}
+
+
+# in-process @cached counters and occupancy for this worker
+@router.get("/health/cache")
+def cache_health():
+    return CACHE.stats()
@@ -1,30 +1,47 @@
+import asyncio
+import heapq
 import math
 import re
 import uuid
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from itertools import combinations
 from threading import Lock
 from zoneinfo import ZoneInfo
 
 import numpy as np
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, HTTPException
 from fastapi.concurrency import run_in_threadpool
 from sqlalchemy import create_engine, select, text
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.db.url_utils import to_sync_db_url
-from app.db.session import get_db
+from app.db.nba.player_lookups import fetch_under_risk_rows
 from app.models.bookmaker import Bookmaker
 from app.models.event import Event
 from app.models.market import Market
 from app.models.player_prop import PlayerProp
-from app.services.lineup_context import fetch_lineups_payload, build_expected_lineup_sets
-from ml.nba.predict import predict_assists, predict_points, predict_rebounds
-from ml.nba.under_side_model import load_latest_under_side_model, predict_under_probability
+from app.services.cache import cached
+from app.services.lineup_context import (
+    _target_et_date_for_day,
+    build_expected_lineup_sets,
+    fetch_lineups_payload,
+    lineup_sets_fingerprint,
+)
+from ml.nba.predict import (
+    latest_model_versions,
+    predict_assists,
+    predict_points,
+    predict_rebounds,
+)
+from ml.nba.under_side_model import (
+    latest_under_side_model_version,
+    load_latest_under_side_model,
+    predict_under_probabilities,
+)
 
 router = APIRouter()
 sync_engine = create_engine(to_sync_db_url(settings.DATABASE_URL))
+leg_table_jobs: dict[str, dict] = {}
 _best_bets_progress_lock = Lock()
 _best_bets_progress: dict[str, object] = {
     "request_id": None,
@@ -152,22 +169,10 @@ def _collect_prediction_player_ids(index: dict[str, dict[str, dict]]) -> list[in
 
 
 def _fetch_under_risk_index(engine, player_ids: list[int]) -> dict[int, dict[str, dict]]:
-    if not player_ids:
-        return {}
-    ids = ",".join(str(int(pid)) for pid in sorted(set(player_ids)))
-    query = text(
-        f"""
-        SELECT player_id, stat_type, under_rate, sample_size
-        FROM player_under_risk
-        WHERE stat_type IN ('points', 'assists', 'rebounds')
-          AND player_id IN ({ids})
-        """
-    )
-    with engine.connect() as conn:
-        rows = conn.execute(query).fetchall()
+    rows = fetch_under_risk_rows(engine, player_ids, ["points", "assists", "rebounds"])
 
     out: dict[int, dict[str, dict]] = {}
-    for player_id, stat_type, under_rate, sample_size in rows:
+    for player_id, stat_type, under_rate, sample_size in rows.itertuples(index=False):
         pid = int(player_id)
         out.setdefault(pid, {})[str(stat_type)] = {
             "under_rate": float(under_rate) if under_rate is not None else None,
@@ -337,30 +342,47 @@ def _compose_under_profile(
     }
 
 
+def _under_side_model_probs(
+    pending: list[tuple[tuple[str, ...], dict, dict | None]],
+    side_model_payload: dict,
+) -> list[list[float]]:
+    """
+    Under-side calibrator probabilities for each (stat_components, pred,
+    under_profile) in `pending`, in stat_components order. Rows are scored
+    with one predict_proba call per stat model.
+    """
+    per_stat: dict[str, list[int]] = {}
+    for i, (stat_components, _, _) in enumerate(pending):
+        for stat in stat_components:
+            per_stat.setdefault(stat, []).append(i)
+
+    by_row: list[dict[str, float]] = [{} for _ in pending]
+    for stat, indices in per_stat.items():
+        probs = predict_under_probabilities(
+            side_model_payload,
+            stat,
+            [pending[i][1] for i in indices],
+            [pending[i][2] for i in indices],
+        )
+        if probs is None:
+            continue
+        for i, prob in zip(indices, probs):
+            by_row[i][stat] = float(prob)
+
+    return [
+        [row_probs[stat] for stat in stat_components if stat in row_probs]
+        for (stat_components, _, _), row_probs in zip(pending, by_row)
+    ]
+
+
 def _apply_under_side_model(
     model_prob: float,
     side: str,
-    stat_components: tuple[str, ...],
     pred: dict,
-    under_risk_index: dict[int, dict[str, dict]],
-    side_model_payload: dict | None,
+    under_profile: dict | None,
+    under_probs: list[float],
+    side_model_payload: dict,
 ) -> tuple[float, dict | None]:
-    if side_model_payload is None:
-        return model_prob, None
-    if not stat_components:
-        return model_prob, None
-
-    under_profile = _compose_under_profile(stat_components, pred, under_risk_index)
-
-    under_probs = []
-    model_stat_keys = side_model_payload.get("models", {}).keys()
-    for stat in stat_components:
-        if stat not in model_stat_keys:
-            continue
-        p_under = predict_under_probability(side_model_payload, stat, pred, under_profile)
-        if p_under is not None:
-            under_probs.append(float(p_under))
-
     if not under_probs:
         return model_prob, None
 
@@ -392,6 +414,489 @@ def _combo_product(values: list[float]) -> float:
     return result
 
 
+# Parlay search: combined odds within [target, target * PARLAY_MAX_OVERSHOOT]
+# are "near target". Only the best PARLAY_TOP_K combos per search are kept, and
+# a search stops expanding after PARLAY_SEARCH_MAX_NODES partial combos (well
+# under a second). The default 30-leg pool is searched in full for 2-6 legs;
+# larger pools at high targets can hit the budget, which the response reports.
+PARLAY_MAX_OVERSHOOT = 1.8
+PARLAY_TOP_K = 250
+PARLAY_SEARCH_MAX_NODES = 300_000
+MAX_PARLAY_CANDIDATES = 60
+
+
+def _parlay_payload(legs: list[dict]) -> dict:
+    combined_odds = _combo_product([leg["price_decimal"] for leg in legs])
+    combined_prob = _combo_product([leg["model_prob"] for leg in legs])
+    expected_value = combined_prob * (combined_odds - 1.0) - (1.0 - combined_prob)
+    return {
+        "legs": legs,
+        "leg_count": len(legs),
+        "combined_odds": round(combined_odds, 4),
+        "combined_probability": round(combined_prob, 4),
+        "expected_value_per_unit": round(expected_value, 4),
+        "_raw_odds": combined_odds,
+    }
+
+
+def _search_parlays(
+    pool: list[dict],
+    leg_count: int,
+    *,
+    lower: float,
+    upper: float,
+    accept,
+    rank_key,
+    min_distinct_events: int,
+    rank_bound=None,
+    top_k: int = PARLAY_TOP_K,
+    on_progress=None,
+) -> tuple[list[tuple[tuple, dict]], int, bool]:
+    """
+    Branch-and-bound over leg_count-sized combos of `pool`.
+
+    Legs are expanded in descending price order, so the best and worst odds a
+    partial combo can still reach are products of the next / last prices; a
+    branch is cut once it can no longer land in [lower, upper]. Duplicate legs
+    and the distinct-event rule are checked while expanding. Accepted combos
+    are kept to the top_k by rank_key(payload) plus their position
+    in `pool` (the old enumeration order, used as tie-break).
+
+    Once top_k combos are kept, rank_bound(legs, remaining, low, high) is
+    asked for a lower bound on the leading rank_key fields of any completion
+    of a partial combo whose odds can still reach [low, high]; branches that
+    cannot beat the worst kept combo are cut.
+
+    Returns ([(key, payload)] best first, combos scored, truncated).
+    """
+    n = len(pool)
+    if leg_count > n:
+        return [], 0, False
+
+    order = sorted(
+        range(n),
+        key=lambda i: (pool[i]["price_decimal"], pool[i]["model_prob"]),
+        reverse=True,
+    )
+    prices = [pool[i]["price_decimal"] for i in order]
+    # best[j][r]: product of the r largest prices from sorted position j on.
+    best = [[1.0] * (leg_count + 1) for _ in range(n + 1)]
+    for j in range(n - 1, -1, -1):
+        for r in range(1, leg_count + 1):
+            best[j][r] = prices[j] * best[j + 1][r - 1] if n - j >= r else 0.0
+    # worst[r]: product of the r smallest prices overall (any remaining r legs
+    # cost at least this much).
+    worst = [1.0] * (leg_count + 1)
+    for r in range(1, leg_count + 1):
+        worst[r] = worst[r - 1] * prices[n - r]
+
+    # products below are taken in a different order than the payload's, so
+    # the cuts leave a little slack and accept() makes the exact call
+    lower *= 1 - 1e-9
+    upper *= 1 + 1e-9
+
+    kept: list[tuple[tuple, dict]] = []
+    threshold: tuple | None = None
+    scored = 0
+    nodes = 0
+    truncated = False
+    chosen: list[int] = []
+    chosen_legs: list[dict] = []
+    leg_keys: set[tuple] = set()
+
+    def expand(start: int, odds: float, events: frozenset):
+        nonlocal scored, nodes, truncated, threshold
+        remaining = leg_count - len(chosen)
+        if remaining == 0:
+            if len(events) < min_distinct_events:
+                return
+            indices = sorted(order[pos] for pos in chosen)
+            payload = _parlay_payload([pool[i] for i in indices])
+            scored += 1
+            if on_progress is not None and (scored == 1 or scored % 100 == 0):
+                on_progress(payload, scored)
+            if not accept(payload["_raw_odds"]):
+                return
+            kept.append(((*rank_key(payload), tuple(indices)), payload))
+            if len(kept) == top_k:
+                threshold = max(key for key, _ in kept)
+            elif len(kept) >= 2 * top_k:
+                kept[:] = heapq.nsmallest(top_k, kept, key=lambda item: item[0])
+                threshold = kept[-1][0]
+            return
+
+        for pos in range(start, n - remaining + 1):
+            nodes += 1
+            if nodes > PARLAY_SEARCH_MAX_NODES:
+                truncated = True
+                return
+            if odds * best[pos][remaining] < lower:
+                # later positions are cheaper still
+                return
+            leg = pool[order[pos]]
+            next_odds = odds * leg["price_decimal"]
+            if next_odds * worst[remaining - 1] > upper:
+                continue
+            leg_key = (leg["event_id"], leg["player_name"], leg["market"], leg["side"], leg["line"])
+            if leg_key in leg_keys:
+                continue
+            next_events = events | {leg["event_id"]}
+            # the last leg must bring the combo up to the distinct-event minimum
+            if remaining == 1 and len(next_events) < min_distinct_events:
+                continue
+            chosen_legs.append(leg)
+            if threshold is not None and rank_bound is not None:
+                bound = rank_bound(
+                    chosen_legs,
+                    remaining - 1,
+                    next_odds * worst[remaining - 1],
+                    next_odds * best[pos + 1][remaining - 1],
+                )
+                if bound > threshold[: len(bound)]:
+                    chosen_legs.pop()
+                    continue
+            chosen.append(pos)
+            leg_keys.add(leg_key)
+            expand(pos + 1, next_odds, next_events)
+            chosen.pop()
+            chosen_legs.pop()
+            leg_keys.discard(leg_key)
+            if truncated:
+                return
+
+    expand(0, 1.0, frozenset())
+    return heapq.nsmallest(top_k, kept, key=lambda item: item[0]), scored, truncated
+
+
+# Scored-legs table: every stored prop row for a bookmaker, scored once per
+# slate. /bets/best only filters it and runs the parlay search, so requests
+# that differ in thresholds or leg counts reuse the same table.
+LEG_TABLE_TTL_SECONDS = 60 * 30
+LEG_TABLE_DAYS = ("today", "tomorrow", "yesterday", "auto")
+LEG_TABLE_BOOKMAKER = "sportsbet"
+LEG_TABLE_STATS = ("points", "assists", "rebounds")
+SINGLE_STAT_MARKETS = ("player_points", "player_assists", "player_rebounds")
+PROPS_LOOKBACK = timedelta(hours=2)
+
+# Changes whenever a prop sync adds, reprices or moves a line for the
+# bookmaker, or under-risk profiles are recalculated.
+PROPS_WATERMARK_SQL = text(
+    """
+    SELECT count(pp.id),
+           coalesce(sum(pp.price), 0),
+           coalesce(sum(pp.line), 0),
+           max(m.last_update),
+           (SELECT max(computed_at) FROM player_under_risk)
+    FROM events e
+    JOIN bookmakers b ON b.event_id = e.id
+    JOIN markets m ON m.bookmaker_id = b.id
+    JOIN player_props pp ON pp.market_id = m.id
+    WHERE b.key = :bookmaker
+      AND m.key = ANY(CAST(:markets AS text[]))
+      AND e.commence_time >= :since
+    """
+)
+
+# Changes whenever game logs are ingested (the predictions' rolling history)
+# or games are added to the schedule from the target date on.
+PREDICTION_INPUTS_WATERMARK_SQL = text(
+    """
+    SELECT (SELECT count(*) FROM player_game_stats),
+           (SELECT max(game_date) FROM player_game_stats),
+           (SELECT count(*) FROM game_schedule WHERE game_date >= :target_date),
+           (SELECT max(game_date) FROM game_schedule)
+    """
+)
+
+
+@dataclass(slots=True)
+class ScoredLeg:
+    event_id: str
+    market: str
+    commence_time: datetime
+    status: str  # "scored", "no_prediction" or "invalid"
+    confidence: float | None = None
+    # unrounded, for the same threshold checks as before
+    model_prob: float | None = None
+    edge: float | None = None
+    leg: dict | None = None
+
+
+@dataclass(slots=True)
+class LegTable:
+    legs: list[ScoredLeg]
+    under_model_loaded: bool
+    built_at: str
+
+
+def _no_progress(**_updates):
+    return None
+
+
+def _set_leg_probability(entry: ScoredLeg, model_prob: float) -> None:
+    price = entry.leg["price_decimal"]
+    entry.model_prob = model_prob
+    entry.edge = model_prob - 1.0 / price
+    entry.leg["model_prob"] = round(model_prob, 4)
+    entry.leg["edge"] = round(entry.edge, 4)
+    entry.leg["ev_per_unit"] = round(model_prob * (price - 1.0) - (1.0 - model_prob), 4)
+
+
+def _score_prop_rows(
+    rows,
+    prediction_index: dict[str, dict[str, dict]],
+    under_risk_index: dict[int, dict[str, dict]],
+    under_side_model_payload: dict | None,
+    use_under_overlay: bool,
+    progress=_no_progress,
+) -> list[ScoredLeg]:
+    scored: list[ScoredLeg] = []
+    # rows waiting on the under-side model, scored in one batch per stat below
+    pending: list[tuple[ScoredLeg, tuple[str, ...], dict, dict | None]] = []
+    current_matchup = None
+    for idx, row in enumerate(rows, start=1):
+        (
+            event_id,
+            commence_time,
+            home_team,
+            away_team,
+            book_key,
+            market_key,
+            player_name,
+            side,
+            line,
+            price,
+        ) = row
+        matchup = f"{away_team} @ {home_team}"
+        if matchup != current_matchup or idx == 1 or idx % 50 == 0:
+            current_matchup = matchup
+            progress(
+                current_matchup=matchup,
+                rows_processed=idx,
+                message=f"Scoring candidate legs for {matchup}",
+            )
+
+        entry = ScoredLeg(event_id, market_key, commence_time, "invalid")
+        scored.append(entry)
+        if line is None or price is None or price <= 1.0:
+            continue
+        stat_components = MARKET_TO_STATS.get(market_key)
+        if not stat_components:
+            continue
+
+        normalized = _normalize_name(player_name or "")
+        if len(stat_components) == 1:
+            pred = prediction_index.get(stat_components[0], {}).get(normalized)
+        else:
+            pred = _compose_prediction_row(stat_components, normalized, prediction_index)
+        if not pred:
+            entry.status = "no_prediction"
+            continue
+
+        confidence = pred.get("confidence")
+        raw_prob, model_prob = _model_probability(pred, float(line), str(side))
+        overlay_meta = None
+        if use_under_overlay:
+            model_prob, overlay_meta = _apply_under_overlay(
+                model_prob=model_prob,
+                side=str(side),
+                stat_components=stat_components,
+                pred=pred,
+                under_risk_index=under_risk_index,
+            )
+        implied_prob = 1.0 / float(price)
+
+        entry.status = "scored"
+        entry.confidence = float(confidence) if confidence is not None else None
+        entry.leg = {
+            "event_id": event_id,
+            "commence_time": commence_time.isoformat(),
+            "matchup": matchup,
+            "bookmaker": book_key,
+            "market": market_key,
+            "stat_type": "+".join(stat_components),
+            "player_name": player_name,
+            "side": side,
+            "line": float(line),
+            "price_decimal": float(price),
+            "implied_prob": round(implied_prob, 4),
+            "model_prob_raw": round(raw_prob, 4),
+            # model_prob / edge / ev_per_unit filled by _set_leg_probability
+            "model_prob": None,
+            "edge": None,
+            "ev_per_unit": None,
+            "under_overlay": overlay_meta,
+            "under_side_model": None,
+            "prediction": {
+                "pred_value": pred.get("pred_value"),
+                "pred_p10": pred.get("pred_p10"),
+                "pred_p50": pred.get("pred_p50"),
+                "pred_p90": pred.get("pred_p90"),
+                "confidence": pred.get("confidence"),
+                "player_id": pred.get("player_id"),
+                "team_abbreviation": pred.get("team_abbreviation"),
+            },
+        }
+        _set_leg_probability(entry, model_prob)
+        if under_side_model_payload is not None:
+            pending.append(
+                (
+                    entry,
+                    stat_components,
+                    pred,
+                    _compose_under_profile(stat_components, pred, under_risk_index),
+                )
+            )
+
+    if pending:
+        progress(message="Scoring under-side model")
+        under_probs = _under_side_model_probs(
+            [(stat_components, pred, profile) for _, stat_components, pred, profile in pending],
+            under_side_model_payload,
+        )
+        for (entry, _, pred, profile), probs in zip(pending, under_probs):
+            model_prob, under_model_meta = _apply_under_side_model(
+                model_prob=entry.model_prob,
+                side=str(entry.leg["side"]),
+                pred=pred,
+                under_profile=profile,
+                under_probs=probs,
+                side_model_payload=under_side_model_payload,
+            )
+            entry.leg["under_side_model"] = under_model_meta
+            _set_leg_probability(entry, model_prob)
+    return scored
+
+
+# Keyed on the slate's inputs (model files, lineup sets, props, under-risk,
+# game-log and schedule watermarks), so a prop sync, lineup change, game-log
+# ingest or retrain lands on a new key. Edits the watermarks cannot see, such
+# as a player's team changing in place, are only picked up when the entry
+# expires after LEG_TABLE_TTL_SECONDS.
+@cached(
+    ttl_seconds=LEG_TABLE_TTL_SECONDS,
+    max_entries=16,
+    ignore_kwargs=("expected_map", "excluded_map", "progress"),
+)
+def _build_leg_table(
+    day: str,
+    bookmaker: str,
+    use_under_overlay: bool,
+    use_under_model: bool,
+    target_date: str,
+    model_versions: tuple,
+    lineup_fingerprint: str,
+    props_watermark: tuple,
+    inputs_watermark: tuple,
+    *,
+    expected_map: dict,
+    excluded_map: dict,
+    progress=_no_progress,
+) -> LegTable:
+    progress(phase="predictions", message="Building prediction index")
+    prediction_index = _build_prediction_index(day, expected_map, excluded_map)
+
+    under_risk_index: dict[int, dict[str, dict]] = {}
+    if use_under_overlay or use_under_model:
+        progress(phase="risk", message="Loading under-risk profiles")
+        under_risk_index = _fetch_under_risk_index(
+            sync_engine, _collect_prediction_player_ids(prediction_index)
+        )
+    under_side_model_payload: dict | None = None
+    if use_under_model:
+        progress(phase="risk", message="Loading under-side model")
+        try:
+            under_side_model_payload, _ = load_latest_under_side_model()
+        except FileNotFoundError:
+            under_side_model_payload = None
+
+    progress(phase="props", message="Loading stored props")
+    stmt = (
+        select(
+            Event.id,
+            Event.commence_time,
+            Event.home_team,
+            Event.away_team,
+            Bookmaker.key,
+            Market.key,
+            PlayerProp.player_name,
+            PlayerProp.side,
+            PlayerProp.line,
+            PlayerProp.price,
+        )
+        .join(Bookmaker, Bookmaker.event_id == Event.id)
+        .join(Market, Market.bookmaker_id == Bookmaker.id)
+        .join(PlayerProp, PlayerProp.market_id == Market.id)
+        .where(
+            Bookmaker.key == bookmaker,
+            Market.key.in_(tuple(MARKET_TO_STATS)),
+            Event.commence_time >= datetime.now(ZoneInfo("UTC")) - PROPS_LOOKBACK,
+        )
+        .order_by(Event.commence_time.asc())
+    )
+    with sync_engine.connect() as conn:
+        rows = conn.execute(stmt).all()
+
+    progress(phase="scoring", message="Scoring candidate legs", rows_total=len(rows))
+    legs = _score_prop_rows(
+        rows,
+        prediction_index,
+        under_risk_index,
+        under_side_model_payload,
+        use_under_overlay,
+        progress=progress,
+    )
+    return LegTable(
+        legs=legs,
+        under_model_loaded=under_side_model_payload is not None,
+        built_at=datetime.now(ZoneInfo("UTC")).isoformat(),
+    )
+
+
+def _load_leg_table(
+    day: str,
+    bookmaker: str,
+    use_under_overlay: bool,
+    use_under_model: bool,
+    progress=_no_progress,
+) -> LegTable:
+    progress(phase="lineups", message="Loading lineup context")
+    lineups_payload = fetch_lineups_payload(sync_engine, day)
+    expected_map, excluded_map = build_expected_lineup_sets(lineups_payload)
+
+    target_date = _target_et_date_for_day(day)
+    with sync_engine.connect() as conn:
+        watermark = conn.execute(
+            PROPS_WATERMARK_SQL,
+            {
+                "bookmaker": bookmaker,
+                "markets": list(MARKET_TO_STATS),
+                "since": datetime.now(ZoneInfo("UTC")) - PROPS_LOOKBACK,
+            },
+        ).one()
+        inputs_watermark = conn.execute(
+            PREDICTION_INPUTS_WATERMARK_SQL, {"target_date": target_date}
+        ).one()
+    model_versions = tuple(latest_model_versions(stat) for stat in LEG_TABLE_STATS)
+    if use_under_model:
+        model_versions += (latest_under_side_model_version(),)
+
+    return _build_leg_table(
+        day,
+        bookmaker,
+        use_under_overlay,
+        use_under_model,
+        str(target_date),
+        model_versions,
+        lineup_sets_fingerprint(expected_map, excluded_map),
+        tuple(str(value) for value in watermark),
+        tuple(str(value) for value in inputs_watermark),
+        expected_map=expected_map,
+        excluded_map=excluded_map,
+        progress=progress,
+    )
+
+
 @router.get("/best")
 async def get_best_bets(
     target_multiplier: float = 2.0,
@@ -408,9 +913,13 @@ async def get_best_bets(
     use_under_model: bool = False,
     use_under_overlay: bool = True,
     max_candidates: int = 30,
-    db: AsyncSession = Depends(get_db),
 ):
     request_id = _start_best_bets_progress()
+    if max_candidates < 1 or max_candidates > MAX_PARLAY_CANDIDATES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"max_candidates must be between 1 and {MAX_PARLAY_CANDIDATES}",
+        )
     if leg_count < 1 or leg_count > 6:
         raise HTTPException(status_code=400, detail="leg_count must be between 1 and 6")
     if leg_mode not in {"exact", "up_to"}:
@@ -427,89 +936,28 @@ async def get_best_bets(
         )
 
     try:
-        _set_best_bets_progress(
-            phase="lineups",
-            message="Loading lineup context",
-        )
-        lineups_payload = await run_in_threadpool(fetch_lineups_payload, sync_engine, day)
-        expected_map, excluded_map = build_expected_lineup_sets(lineups_payload)
-        _set_best_bets_progress(
-            phase="predictions",
-            message="Building prediction index",
-        )
-        prediction_index = await run_in_threadpool(
-            _build_prediction_index, day, expected_map, excluded_map
-        )
-        under_risk_index: dict[int, dict[str, dict]] = {}
-        under_side_model_payload: dict | None = None
-        if use_under_overlay or use_under_model:
-            _set_best_bets_progress(
-                phase="risk",
-                message="Loading under-risk profiles",
-            )
-            player_ids = await run_in_threadpool(_collect_prediction_player_ids, prediction_index)
-            under_risk_index = await run_in_threadpool(
-                _fetch_under_risk_index, sync_engine, player_ids
-            )
-        if use_under_model:
-            _set_best_bets_progress(
-                phase="risk",
-                message="Loading under-side model",
-            )
-            try:
-                under_side_model_payload, _ = await run_in_threadpool(load_latest_under_side_model)
-            except FileNotFoundError:
-                under_side_model_payload = None
-
-        now_utc = datetime.now(ZoneInfo("UTC")) - timedelta(hours=2)
-        markets_to_use = [
-            "player_points",
-            "player_assists",
-            "player_rebounds",
-        ]
-        if include_combos:
-            markets_to_use.extend(
-                [
-                    "player_points_rebounds_assists",
-                    "player_points_rebounds",
-                    "player_points_assists",
-                    "player_rebounds_assists",
-                ]
-            )
-
-        stmt = (
-            select(
-                Event.id,
-                Event.commence_time,
-                Event.home_team,
-                Event.away_team,
-                Bookmaker.key,
-                Market.key,
-                PlayerProp.player_name,
-                PlayerProp.side,
-                PlayerProp.line,
-                PlayerProp.price,
-            )
-            .join(Bookmaker, Bookmaker.event_id == Event.id)
-            .join(Market, Market.bookmaker_id == Bookmaker.id)
-            .join(PlayerProp, PlayerProp.market_id == Market.id)
-            .where(
-                Bookmaker.key == bookmaker,
-                Market.key.in_(tuple(markets_to_use)),
-                Event.commence_time >= now_utc,
-            )
-            .order_by(Event.commence_time.asc())
+        table = await run_in_threadpool(
+            _load_leg_table,
+            day,
+            bookmaker,
+            use_under_overlay,
+            use_under_model,
+            _set_best_bets_progress,
         )
 
+        markets_to_use = set(SINGLE_STAT_MARKETS)
+        if include_combos:
+            markets_to_use.update(MARKET_TO_STATS)
         selected_ids = [eid.strip() for eid in (event_ids or "").split(",") if eid.strip()]
-        if selected_ids:
-            stmt = stmt.where(Event.id.in_(tuple(selected_ids)))
-
-        _set_best_bets_progress(
-            phase="props",
-            message="Loading stored props",
-        )
-        rows = (await db.execute(stmt)).all()
+        selected_set = set(selected_ids)
+        cutoff = datetime.now(ZoneInfo("UTC")) - PROPS_LOOKBACK
+        rows = [
+            entry
+            for entry in table.legs
+            if entry.market in markets_to_use
+            and entry.commence_time >= cutoff
+            and (not selected_set or entry.event_id in selected_set)
+        ]
         if not rows:
             _finish_best_bets_progress(
                 request_id,
@@ -530,118 +978,28 @@ async def get_best_bets(
         skipped_low_edge = 0
         overlay_applied = 0
         under_model_applied = 0
-        current_matchup = None
         _set_best_bets_progress(
             phase="scoring",
-            message="Scoring candidate legs",
+            message="Filtering scored legs",
             rows_total=len(rows),
         )
-
-        for idx, row in enumerate(rows, start=1):
-            (
-                event_id,
-                commence_time,
-                home_team,
-                away_team,
-                book_key,
-                market_key,
-                player_name,
-                side,
-                line,
-                price,
-            ) = row
-            matchup = f"{away_team} @ {home_team}"
-            if matchup != current_matchup or idx == 1 or idx % 50 == 0:
-                current_matchup = matchup
-                _set_best_bets_progress(
-                    current_matchup=matchup,
-                    rows_processed=idx,
-                    candidates_kept=len(candidates),
-                    message=f"Scoring candidate legs for {matchup}",
-                )
-
-            if line is None or price is None or price <= 1.0:
-                continue
-            stat_components = MARKET_TO_STATS.get(market_key)
-            if not stat_components:
-                continue
-
-            normalized = _normalize_name(player_name or "")
-            if len(stat_components) == 1:
-                pred = prediction_index.get(stat_components[0], {}).get(normalized)
-            else:
-                pred = _compose_prediction_row(stat_components, normalized, prediction_index)
-            if not pred:
+        for entry in rows:
+            if entry.status == "no_prediction":
                 skipped_no_prediction += 1
                 continue
-
-            confidence = pred.get("confidence")
-            if confidence is not None and float(confidence) < min_confidence:
+            if entry.status != "scored":
+                continue
+            if entry.confidence is not None and entry.confidence < min_confidence:
                 skipped_low_confidence += 1
                 continue
-
-            raw_prob, model_prob = _model_probability(pred, float(line), str(side))
-            overlay_meta = None
-            if use_under_overlay:
-                model_prob, overlay_meta = _apply_under_overlay(
-                    model_prob=model_prob,
-                    side=str(side),
-                    stat_components=stat_components,
-                    pred=pred,
-                    under_risk_index=under_risk_index,
-                )
-                if overlay_meta is not None:
-                    overlay_applied += 1
-            under_model_meta = None
-            if use_under_model and under_side_model_payload is not None:
-                model_prob, under_model_meta = _apply_under_side_model(
-                    model_prob=model_prob,
-                    side=str(side),
-                    stat_components=stat_components,
-                    pred=pred,
-                    under_risk_index=under_risk_index,
-                    side_model_payload=under_side_model_payload,
-                )
-                if under_model_meta is not None:
-                    under_model_applied += 1
-            implied_prob = 1.0 / float(price)
-            edge = model_prob - implied_prob
-            if model_prob < min_prob or edge < min_edge:
+            if entry.leg["under_overlay"] is not None:
+                overlay_applied += 1
+            if entry.leg["under_side_model"] is not None:
+                under_model_applied += 1
+            if entry.model_prob < min_prob or entry.edge < min_edge:
                 skipped_low_edge += 1
                 continue
-
-            expected_value = model_prob * (float(price) - 1.0) - (1.0 - model_prob)
-            stat_type = "+".join(stat_components)
-            candidates.append(
-                {
-                    "event_id": event_id,
-                    "commence_time": commence_time.isoformat(),
-                    "matchup": matchup,
-                    "bookmaker": book_key,
-                    "market": market_key,
-                    "stat_type": stat_type,
-                    "player_name": player_name,
-                    "side": side,
-                    "line": float(line),
-                    "price_decimal": float(price),
-                    "implied_prob": round(implied_prob, 4),
-                    "model_prob_raw": round(raw_prob, 4),
-                    "model_prob": round(model_prob, 4),
-                    "edge": round(edge, 4),
-                    "ev_per_unit": round(expected_value, 4),
-                    "under_overlay": overlay_meta,
-                    "under_side_model": under_model_meta,
-                    "prediction": {
-                        "pred_value": pred.get("pred_value"),
-                        "pred_p10": pred.get("pred_p10"),
-                        "pred_p50": pred.get("pred_p50"),
-                        "pred_p90": pred.get("pred_p90"),
-                        "confidence": pred.get("confidence"),
-                        "player_id": pred.get("player_id"),
-                        "team_abbreviation": pred.get("team_abbreviation"),
-                    },
-                }
-            )
+            candidates.append(entry.leg)
 
         if not candidates:
             _finish_best_bets_progress(
@@ -672,7 +1030,7 @@ async def get_best_bets(
                     "under_overlay_enabled": use_under_overlay,
                     "under_overlay_applied": overlay_applied,
                     "under_model_enabled": use_under_model,
-                    "under_model_loaded": under_side_model_payload is not None,
+                    "under_model_loaded": table.under_model_loaded,
                     "under_model_applied": under_model_applied,
                 },
             }
@@ -691,8 +1049,6 @@ async def get_best_bets(
         )[: max(leg_count, max_candidates)]
 
         parlay_options = []
-        all_combo_candidates = []
-        max_target_overshoot = 1.8
         target_leg_max = max_legs if max_legs is not None else leg_count
         if leg_mode == "up_to":
             leg_counts = [n for n in range(2, target_leg_max + 1)]
@@ -702,103 +1058,133 @@ async def get_best_bets(
             leg_counts = [leg_count]
 
         combos_considered = 0
-        for active_leg_count in leg_counts:
-            if active_leg_count == 1:
-                for leg in ranked[: min(8, len(ranked))]:
-                    payout = leg["price_decimal"]
-                    parlay_options.append(
-                        {
-                            "legs": [leg],
-                            "leg_count": 1,
-                            "combined_odds": round(payout, 4),
-                            "combined_probability": leg["model_prob"],
-                            "expected_value_per_unit": leg["ev_per_unit"],
-                            "meets_target": payout >= target_multiplier,
-                        }
-                    )
-                continue
+        search_truncated = False
+        pool = ranked
 
-            pool = ranked[: min(len(ranked), 18)]
-            min_distinct_events = 2 if len(selected_ids) >= 2 and active_leg_count >= 2 else 1
-            for combo in combinations(pool, active_leg_count):
-                combos_considered += 1
-                if combos_considered == 1 or combos_considered % 100 == 0:
-                    focus_leg = combo[0] if combo else None
-                    _set_best_bets_progress(
-                        phase="ranking",
-                        message="Ranking parlay combinations",
-                        current_matchup=focus_leg.get("matchup") if focus_leg else None,
-                        combos_considered=combos_considered,
-                        candidates_kept=len(candidates),
-                    )
-                combo_keys = {
-                    (leg["event_id"], leg["player_name"], leg["market"], leg["side"], leg["line"])
-                    for leg in combo
-                }
-                if len(combo_keys) != len(combo):
-                    continue
+        def report_progress(payload: dict, scored: int):
+            _set_best_bets_progress(
+                phase="ranking",
+                message="Ranking parlay combinations",
+                current_matchup=payload["legs"][0].get("matchup"),
+                combos_considered=combos_considered + scored,
+                candidates_kept=len(candidates),
+            )
 
-                distinct_events = {leg["event_id"] for leg in combo}
-                if len(distinct_events) < min_distinct_events:
-                    continue
+        def over_legs(legs: list[dict]) -> int:
+            return sum(1 for leg in legs if str(leg.get("side", "")).lower() == "over")
 
-                combined_odds = _combo_product([leg["price_decimal"] for leg in combo])
-                combined_prob = _combo_product([leg["model_prob"] for leg in combo])
-                expected_value = combined_prob * (combined_odds - 1.0) - (1.0 - combined_prob)
-                parlay_payload = {
-                    "legs": list(combo),
-                    "leg_count": active_leg_count,
-                    "combined_odds": round(combined_odds, 4),
-                    "combined_probability": round(combined_prob, 4),
-                    "expected_value_per_unit": round(expected_value, 4),
-                    "meets_target": combined_odds >= target_multiplier,
-                }
-                all_combo_candidates.append(parlay_payload)
+        def odds_distance_bound(low: float, high: float) -> float:
+            # slack covers combined_odds being rounded to 4 places in the key
+            return max(0.0, low - target_multiplier, target_multiplier - high) - 1e-4
 
-                if combined_odds < target_multiplier:
+        def run_search(
+            lower: float, upper: float, accept, rank_key, rank_bound
+        ) -> list[tuple[tuple, dict]]:
+            nonlocal combos_considered, search_truncated
+            found = []
+            for position, active_leg_count in enumerate(leg_counts):
+                if active_leg_count == 1:
                     continue
-                if combined_odds > target_multiplier * max_target_overshoot:
-                    continue
-                parlay_options.append(parlay_payload)
-
-        ranked_parlays = sorted(
-            parlay_options,
-            key=lambda p: (
+                min_distinct_events = 2 if len(selected_ids) >= 2 else 1
+                results, scored, truncated = _search_parlays(
+                    pool,
+                    active_leg_count,
+                    lower=lower,
+                    upper=upper,
+                    accept=accept,
+                    rank_key=rank_key,
+                    rank_bound=rank_bound,
+                    min_distinct_events=min_distinct_events,
+                    on_progress=report_progress,
+                )
+                combos_considered += scored
+                search_truncated = search_truncated or truncated
+                # leg-count position slots in ahead of the pool-index tie-break
+                found.extend(((*key[:-1], position, key[-1]), payload) for key, payload in results)
+            return found
+
+        def near_target_key(p: dict) -> tuple:
+            return (
                 abs(p["combined_odds"] - target_multiplier),
                 -p["combined_probability"],
                 -p["expected_value_per_unit"],
-            ),
+            )
+
+        def near_target_bound(legs: list[dict], remaining: int, low: float, high: float) -> tuple:
+            return (odds_distance_bound(low, high),)
+
+        def fallback_key(p: dict) -> tuple:
+            return (
+                -over_legs(p["legs"]),
+                abs(p["combined_odds"] - target_multiplier),
+                -p["combined_probability"],
+            )
+
+        def fallback_bound(legs: list[dict], remaining: int, low: float, high: float) -> tuple:
+            return (-(over_legs(legs) + remaining), odds_distance_bound(low, high))
+
+        near_target = []
+        if 1 in leg_counts:
+            for index, leg in enumerate(ranked[: min(8, len(ranked))]):
+                payout = leg["price_decimal"]
+                single = {
+                    "legs": [leg],
+                    "leg_count": 1,
+                    "combined_odds": round(payout, 4),
+                    "combined_probability": leg["model_prob"],
+                    "expected_value_per_unit": leg["ev_per_unit"],
+                    "meets_target": payout >= target_multiplier,
+                }
+                near_target.append(((*near_target_key(single), leg_counts.index(1), (index,)), single))
+        # the searches are CPU-bound; keep them off the event loop
+        near_target.extend(
+            await run_in_threadpool(
+                run_search,
+                target_multiplier,
+                target_multiplier * PARLAY_MAX_OVERSHOOT,
+                lambda odds: target_multiplier <= odds <= target_multiplier * PARLAY_MAX_OVERSHOOT,
+                near_target_key,
+                near_target_bound,
+            )
         )
+        ranked_parlays = [payload for _, payload in sorted(near_target, key=lambda item: item[0])]
 
     # Fallback path: if no near-target parlays, show best available combos.
     # Preference order:
     # 1) combos above target with more "Over" legs
     # 2) if none above target, combos below target with more "Over" legs
-        if not ranked_parlays and max(leg_counts) > 1 and all_combo_candidates:
-            above_target = [p for p in all_combo_candidates if p["combined_odds"] >= target_multiplier]
-            below_target = [p for p in all_combo_candidates if p["combined_odds"] < target_multiplier]
-
-            def over_count(parlay: dict) -> int:
-                return sum(1 for leg in parlay["legs"] if str(leg.get("side", "")).lower() == "over")
-
+        if not ranked_parlays and max(leg_counts) > 1:
+            above_target = await run_in_threadpool(
+                run_search,
+                target_multiplier,
+                math.inf,
+                lambda odds: odds >= target_multiplier,
+                fallback_key,
+                fallback_bound,
+            )
             if above_target:
-                ranked_parlays = sorted(
-                    above_target,
-                    key=lambda p: (
-                        -over_count(p),
-                        abs(p["combined_odds"] - target_multiplier),
-                        -p["combined_probability"],
-                    ),
-                )
-            elif below_target:
-                ranked_parlays = sorted(
-                    below_target,
-                    key=lambda p: (
-                        -over_count(p),
-                        abs(p["combined_odds"] - target_multiplier),
-                        -p["combined_probability"],
-                    ),
+                fallback = above_target
+            else:
+                fallback = await run_in_threadpool(
+                    run_search,
+                    0.0,
+                    target_multiplier,
+                    lambda odds: odds < target_multiplier,
+                    fallback_key,
+                    fallback_bound,
                 )
+            ranked_parlays = [payload for _, payload in sorted(fallback, key=lambda item: item[0])]
+
+        warnings = []
+        if search_truncated:
+            warnings.append(
+                "Parlay search stopped at its node limit, so some combinations were not "
+                "checked. Lower max_candidates for a complete search."
+            )
+
+        for parlay in ranked_parlays:
+            if "_raw_odds" in parlay:
+                parlay["meets_target"] = parlay.pop("_raw_odds") >= target_multiplier
 
     # Diversify recommendations so the same player does not repeat across parlays.
         parlay_options = []
@@ -849,6 +1235,7 @@ async def get_best_bets(
             "pool_size": len(candidates),
             "top_single_legs": top_single_legs,
             "recommended_parlays": parlay_options,
+            "warnings": warnings,
             "debug": {
                 "rows_loaded": len(rows),
                 "skipped_no_prediction": skipped_no_prediction,
@@ -857,8 +1244,10 @@ async def get_best_bets(
                 "under_overlay_enabled": use_under_overlay,
                 "under_overlay_applied": overlay_applied,
                 "under_model_enabled": use_under_model,
-                "under_model_loaded": under_side_model_payload is not None,
+                "under_model_loaded": table.under_model_loaded,
                 "under_model_applied": under_model_applied,
+                "combos_considered": combos_considered,
+                "parlay_search_truncated": search_truncated,
             },
         }
     except Exception as exc:
@@ -869,3 +1258,104 @@ async def get_best_bets(
             phase="failed",
         )
         raise
+
+
+def _run_leg_table_precompute_job(
+    job_id: str,
+    days: list[str],
+    bookmaker: str,
+    use_under_overlay: bool,
+    use_under_model: bool,
+):
+    leg_table_jobs[job_id]["status"] = "running"
+    results: dict[str, dict] = {}
+    try:
+        for step, day in enumerate(days, start=1):
+            leg_table_jobs[job_id]["current_day"] = day
+            table = _load_leg_table(day, bookmaker, use_under_overlay, use_under_model)
+            results[day] = {
+                "rows": len(table.legs),
+                "scored": sum(1 for entry in table.legs if entry.status == "scored"),
+                "built_at": table.built_at,
+            }
+            leg_table_jobs[job_id]["steps_done"] = step
+
+        leg_table_jobs[job_id]["status"] = "completed"
+        leg_table_jobs[job_id]["result"] = results
+        leg_table_jobs[job_id]["finished_at"] = datetime.utcnow().isoformat()
+    except Exception as exc:
+        leg_table_jobs[job_id]["status"] = "failed"
+        leg_table_jobs[job_id]["error"] = str(exc)
+        leg_table_jobs[job_id]["finished_at"] = datetime.utcnow().isoformat()
+
+
+def _create_leg_table_job(days: list[str], bookmaker: str) -> str:
+    job_id = datetime.utcnow().strftime("legs-%Y%m%d%H%M%S%f")
+    leg_table_jobs[job_id] = {
+        "job_id": job_id,
+        "status": "queued",
+        "days": days,
+        "bookmaker": bookmaker,
+        "steps_done": 0,
+        "steps_total": len(days),
+        "current_day": None,
+        "result": None,
+        "error": None,
+        "created_at": datetime.utcnow().isoformat(),
+    }
+    return job_id
+
+
+def queue_leg_table_precompute(
+    days: list[str],
+    bookmaker: str,
+    use_under_overlay: bool = True,
+    use_under_model: bool = False,
+) -> str:
+    """Build the leg tables for `days` in the background; returns the job id."""
+    job_id = _create_leg_table_job(days, bookmaker)
+    asyncio.create_task(
+        run_in_threadpool(
+            _run_leg_table_precompute_job,
+            job_id,
+            days,
+            bookmaker,
+            use_under_overlay,
+            use_under_model,
+        )
+    )
+    return job_id
+
+
+def run_leg_table_precompute(days: list[str], bookmaker: str) -> str:
+    """Build the default-variant leg tables for `days` in the calling thread."""
+    job_id = _create_leg_table_job(days, bookmaker)
+    _run_leg_table_precompute_job(job_id, days, bookmaker, True, False)
+    return job_id
+
+
+# Prop syncs and the prediction precompute job queue this for the default
+# request variant; the endpoint covers other bookmakers and flags.
+@router.post("/best/legs/precompute/start")
+async def start_leg_table_precompute(
+    days: str = "auto",
+    bookmaker: str = "sportsbet",
+    use_under_overlay: bool = True,
+    use_under_model: bool = False,
+):
+    day_values = [value.strip() for value in days.split(",") if value.strip()]
+    if any(day not in LEG_TABLE_DAYS for day in day_values):
+        raise HTTPException(
+            status_code=400, detail="days must be among today, tomorrow, yesterday, auto"
+        )
+
+    job_id = queue_leg_table_precompute(day_values, bookmaker, use_under_overlay, use_under_model)
+    return {"status": "queued", "job_id": job_id, "days": day_values, "bookmaker": bookmaker}
+
+
+@router.get("/best/legs/precompute/jobs/{job_id}")
+async def get_leg_table_precompute_job(job_id: str):
+    job = leg_table_jobs.get(job_id)
+    if not job:
+        return {"status": "not_found", "job_id": job_id}
+    return job
@@ -2,19 +2,25 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi.concurrency import run_in_threadpool
 from sqlalchemy import create_engine
+from app.api.nba.best_bets import queue_leg_table_precompute
 from app.db.session import get_db, AsyncSessionLocal
 from app.core.config import settings
 from app.db.url_utils import to_sync_db_url
 from app.services.theodds_client import TheOddsClient
 from app.services.nba_client import NBAClient
+from app.services.nba_ingest_worker import NBAIngestWorker
 from app.db.nba.store_odds import save_event_odds
-from app.db.nba.store_player_game_stats import save_last_n_games
+from app.db.nba.store_player_game_stats import save_last_n_games, save_last_n_games_many
 from app.db.nba.store_team_game_stats import save_team_game_stats
 from app.db.nba.store_lineup_stats import save_lineup_stats
 from app.db.nba.store_teams import load_teams
 from app.db.nba.store_schedule import load_schedule
-from app.db.nba.under_risk import compute_under_risk
-from app.db.nba.store_prediction_logs import update_prediction_actuals, log_predictions
+from app.db.nba.under_risk import compute_under_risk, compute_under_risk_all
+from app.db.nba.store_prediction_logs import (
+    update_prediction_actuals,
+    update_prediction_actuals_all,
+    log_predictions,
+)
 from nba_api.stats.static import players
 from nba_api.stats.static import teams as nba_teams
 from sqlalchemy import select, func, text
@@ -87,6 +93,10 @@ sync_engine = create_engine(to_sync_db_url(settings.DATABASE_URL))
 throttler = Throttler(rate_limit=2, period=1)
 # Boxscore endpoint is more fragile; keep this much slower.
 boxscore_throttler = Throttler(rate_limit=1, period=30)
+# Player game-log ingest: blocking nba_api calls run on a dedicated thread pool
+# behind a token bucket, with a bounded number of requests in flight.
+nba_ingest_worker = NBAIngestWorker(nba_client, max_workers=4, rate_per_second=2.0)
+PLAYER_INGEST_CHUNK_SIZE = 25
 update_jobs: dict[str, dict] = {}
 
 GAME_INGEST_MAX_ATTEMPTS = 4
@@ -145,6 +155,57 @@ async def _record_ingest_run(
         logger.warning(f"Failed to record ingestion run: {e}")
 
 
+async def _save_player_game_log_chunk(chunk, db: AsyncSession) -> dict:
+    counts = {"saved": 0, "skipped": 0, "failed": 0, "new_games": 0}
+    entries = []
+    for item in chunk:
+        if item.error is not None:
+            counts["failed"] += 1
+        elif item.df is None or item.df.empty:
+            counts["skipped"] += 1
+        else:
+            entries.append(
+                {
+                    "player_id": item.player_id,
+                    "player_name": item.player_name,
+                    "team_abbr": item.team_abbr,
+                    "df": item.df,
+                }
+            )
+    if not entries:
+        return counts
+
+    written: dict[int, int] = {}
+
+    async def _write_entries(batch: list[dict]) -> None:
+        try:
+            written.update(await save_last_n_games_many(batch, db))
+            return
+        except Exception as e:
+            await db.rollback()
+            if len(batch) == 1:
+                logger.warning(f"Failed saving {batch[0]['player_name']}: {e}")
+                counts["failed"] += 1
+                return
+            logger.warning(
+                f"Failed saving chunk of {len(batch)} players "
+                f"({batch[0]['player_name']}...): {e}; retrying one by one"
+            )
+        # Fall back to per-player writes so one bad frame does not sink the chunk.
+        for entry in batch:
+            await _write_entries([entry])
+
+    await _write_entries(entries)
+
+    for new_games in written.values():
+        if new_games > 0:
+            counts["saved"] += 1
+            counts["new_games"] += new_games
+        else:
+            counts["skipped"] += 1
+    return counts
+
+
 # store player points props for a single event (game)
 @router.post("/player-points/{event_id}")
 async def refresh_player_points_event(
@@ -286,6 +347,17 @@ async def refresh_all_player_points(
             total_estimated_cost += int(response.get("estimated_cost") or 0)
             last_usage = response.get("usage") or last_usage
 
+        # Re-score the best-bets legs for the slate this sync refreshed (the
+        # same day the best-bets view requests for the sync mode).
+        leg_table_job_ids = {}
+        if events_processed:
+            leg_day = {"night": "tomorrow", "morning": "today"}.get(mode, "auto")
+            for bookmaker in (bookmakers or "").split(","):
+                if bookmaker.strip():
+                    leg_table_job_ids[bookmaker.strip()] = queue_leg_table_precompute(
+                        [leg_day], bookmaker.strip()
+                    )
+
         return {
             "status": "success",
             "events_processed": events_processed,
@@ -302,6 +374,7 @@ async def refresh_all_player_points(
             "selected_event_count": len(selected_ids),
             "timezone": "Australia/Sydney",
             "sync_local_hour": au_hour,
+            "leg_table_jobs": leg_table_job_ids,
         }
     except Exception as e:
         logger.error(f"Error fetching/storing all events: {e}")
@@ -350,83 +423,14 @@ async def store_last_n_games_all_players(
     failed = 0
     total_new_games = 0
 
-    for p in active_players:
-        player_id = p["id"]
-        player_name = p["full_name"]
-
-        # Retry logic to try up to 3 times if fetch fails
-        for attempt in range(3):
-            try:
-                # rate limiting to max 5 requests per second
-                async with throttler:
-                    df = nba_client.fetch_player_game_log(player_id, season)
-                break
-            except Exception as e:
-                logger.warning(f"Attempt {attempt + 1} failed for {player_name}: {e}")
-                await asyncio.sleep(0.5)
-        else:
-            logger.error(f"All retries failed for {player_name}")
-            failed += 1
-            continue
-
-        if df.empty:
-            skipped += 1
-            continue
-
-        team_abbr = (
-            df.iloc[0]["TEAM_ABBREVIATION"]
-            if "TEAM_ABBREVIATION" in df.columns
-            else None
-        )
-        if not team_abbr:
-            for attempt in range(2):
-                try:
-                    async with throttler:
-                        info_df, _ = nba_client.fetch_player_info(player_id)
-                    if not info_df.empty and "TEAM_ABBREVIATION" in info_df.columns:
-                        team_abbr = info_df.iloc[0]["TEAM_ABBREVIATION"]
-                    break
-                except Exception as e:
-                    logger.warning(
-                        f"Attempt {attempt + 1} failed for player info {player_name}: {e}"
-                    )
-                    await asyncio.sleep(0.5)
-        if not team_abbr:
-            for attempt in range(2):
-                try:
-                    async with throttler:
-                        info_df, _ = nba_client.fetch_player_info(player_id)
-                    if not info_df.empty and "TEAM_ABBREVIATION" in info_df.columns:
-                        team_abbr = info_df.iloc[0]["TEAM_ABBREVIATION"]
-                    break
-                except Exception as e:
-                    logger.warning(
-                        f"Attempt {attempt + 1} failed for player info {player_name}: {e}"
-                    )
-                    await asyncio.sleep(0.5)
-
-        try:
-            new_games = await save_last_n_games(
-                player_id=player_id,
-                player_name=player_name,
-                team_abbr=team_abbr,
-                df=df,
-                db=db,
-            )
-
-            if new_games > 0:
-                saved += 1
-                total_new_games += new_games
-            else:
-                skipped += 1
-
-        except Exception as e:
-            logger.warning(f"Failed saving {player_name}: {e}")
-            failed += 1
-            continue
-
-        # small delay for safety
-        await asyncio.sleep(0.05)
+    async for chunk in nba_ingest_worker.iter_player_game_logs(
+        active_players, season, chunk_size=PLAYER_INGEST_CHUNK_SIZE
+    ):
+        counts = await _save_player_game_log_chunk(chunk, db)
+        saved += counts["saved"]
+        skipped += counts["skipped"]
+        failed += counts["failed"]
+        total_new_games += counts["new_games"]
 
     return {
         "status": "completed",
@@ -479,33 +483,33 @@ async def _run_last_n_update(
         await _record_ingest_run(db, since_date, season, result, "no_games")
         return result
 
-    if game_rows:
-        for game_id, _game_date, home_abbr, away_abbr in game_rows:
-            if not game_id:
-                continue
-            if home_abbr:
-                team_abbrs.add(str(home_abbr))
-            if away_abbr:
-                team_abbrs.add(str(away_abbr))
-            for attempt in range(3):
-                try:
-                    async with throttler:
-                        game_players = nba_client.fetch_game_players(game_id)
-                    break
-                except Exception as e:
-                    logger.warning(
-                        f"Attempt {attempt + 1} failed for game {game_id}: {e}"
-                    )
-                    await asyncio.sleep(0.5)
-            else:
-                logger.error(f"All retries failed for game {game_id}")
-                continue
+    game_ids = []
+    for game_id, _game_date, home_abbr, away_abbr in game_rows:
+        if not game_id:
+            continue
+        if home_abbr:
+            team_abbrs.add(str(home_abbr))
+        if away_abbr:
+            team_abbrs.add(str(away_abbr))
+        game_ids.append(game_id)
 
-            for p in game_players:
-                pid = p.get("PLAYER_ID")
-                name = p.get("PLAYER_NAME")
-                if pid:
-                    player_map[int(pid)] = name or player_map.get(int(pid)) or str(pid)
+    async def _fetch_game_players(game_id):
+        try:
+            return await nba_ingest_worker.call(
+                f"game {game_id}", nba_client.fetch_game_players, game_id
+            )
+        except Exception:
+            logger.error(f"All retries failed for game {game_id}")
+            return []
+
+    for game_players in await asyncio.gather(
+        *(_fetch_game_players(game_id) for game_id in game_ids)
+    ):
+        for p in game_players:
+            pid = p.get("PLAYER_ID")
+            name = p.get("PLAYER_NAME")
+            if pid:
+                player_map[int(pid)] = name or player_map.get(int(pid)) or str(pid)
 
     if player_map:
         active_players = [
@@ -569,81 +573,40 @@ async def _run_last_n_update(
     failed = 0
     total_new_games = 0
 
-    for idx, p in enumerate(active_players, start=1):
-        player_id = p["id"]
-        player_name = p["full_name"]
-
-        if job_id and job_id in update_jobs:
-            update_jobs[job_id]["players_done"] = idx - 1
-            update_jobs[job_id]["players_total"] = len(active_players)
-
-        result = await db.execute(
-            select(func.max(PlayerGameStat.game_date)).where(
-                PlayerGameStat.player_id == player_id
-            )
-        )
-        last_game_date = result.scalar_one_or_none()
+    if job_id and job_id in update_jobs:
+        update_jobs[job_id]["players_done"] = 0
+        update_jobs[job_id]["players_total"] = len(active_players)
+
+    # One grouped query instead of a MAX(game_date) lookup per player.
+    last_dates_result = await db.execute(
+        select(PlayerGameStat.player_id, func.max(PlayerGameStat.game_date))
+        .where(PlayerGameStat.player_id.in_([p["id"] for p in active_players]))
+        .group_by(PlayerGameStat.player_id)
+    )
+    last_game_dates = {int(pid): last for pid, last in last_dates_result.all()}
+    pending_players = []
+    for p in active_players:
+        last_game_date = last_game_dates.get(int(p["id"]))
         if last_game_date and last_game_date >= since_date:
             skipped += 1
             continue
+        pending_players.append(p)
 
-        for attempt in range(3):
-            try:
-                async with throttler:
-                    df = nba_client.fetch_player_game_log(player_id, season)
-                break
-            except Exception as e:
-                logger.warning(f"Attempt {attempt + 1} failed for {player_name}: {e}")
-                await asyncio.sleep(0.5)
-        else:
-            logger.error(f"All retries failed for {player_name}")
-            failed += 1
-            continue
-
-        if df.empty:
-            skipped += 1
-            continue
-
-        team_abbr = (
-            df.iloc[0]["TEAM_ABBREVIATION"]
-            if "TEAM_ABBREVIATION" in df.columns
-            else None
-        )
-        if not team_abbr:
-            for attempt in range(2):
-                try:
-                    async with throttler:
-                        info_df, _ = nba_client.fetch_player_info(player_id)
-                    if not info_df.empty and "TEAM_ABBREVIATION" in info_df.columns:
-                        team_abbr = info_df.iloc[0]["TEAM_ABBREVIATION"]
-                    break
-                except Exception as e:
-                    logger.warning(
-                        f"Attempt {attempt + 1} failed for player info {player_name}: {e}"
-                    )
-                    await asyncio.sleep(0.5)
-
-        try:
-            new_games = await save_last_n_games(
-                player_id=player_id,
-                player_name=player_name,
-                team_abbr=team_abbr,
-                df=df,
-                db=db,
-            )
-
-            if new_games > 0:
-                saved += 1
-                total_new_games += new_games
-            else:
-                skipped += 1
-
-        except Exception as e:
-            logger.warning(f"Failed saving {player_name}: {e}")
-            failed += 1
-            continue
+    # End the read transaction before the long-running nba_api fetches.
+    await db.rollback()
 
-        await asyncio.sleep(0.05)
+    players_done = skipped
+    async for chunk in nba_ingest_worker.iter_player_game_logs(
+        pending_players, season, chunk_size=PLAYER_INGEST_CHUNK_SIZE
+    ):
+        counts = await _save_player_game_log_chunk(chunk, db)
+        saved += counts["saved"]
+        skipped += counts["skipped"]
+        failed += counts["failed"]
+        total_new_games += counts["new_games"]
+        players_done += len(chunk)
+        if job_id and job_id in update_jobs:
+            update_jobs[job_id]["players_done"] = players_done
 
     result = {
         "status": "completed",
@@ -1153,14 +1116,9 @@ async def _run_nightly_pipeline_job(
             update_jobs[job_id]["refresh_result"] = refresh_result
 
         set_step("evaluate_actuals", 3)
-        evaluate_result = {
-            "points": await run_in_threadpool(update_prediction_actuals, sync_engine, "points"),
-            "assists": await run_in_threadpool(update_prediction_actuals, sync_engine, "assists"),
-            "rebounds": await run_in_threadpool(update_prediction_actuals, sync_engine, "rebounds"),
-            "minutes": await run_in_threadpool(update_prediction_actuals, sync_engine, "minutes"),
-            "threept": await run_in_threadpool(update_prediction_actuals, sync_engine, "threept"),
-            "threepa": await run_in_threadpool(update_prediction_actuals, sync_engine, "threepa"),
-        }
+        evaluate_result = await run_in_threadpool(
+            update_prediction_actuals_all, sync_engine
+        )
         update_jobs[job_id]["evaluate_result"] = evaluate_result
 
         set_step("rolling_update", 4)
@@ -2045,17 +2003,18 @@ async def recalc_under_risk_all(
     Recalculate under-risk for all supported stat types.
     """
     stat_types = ["points", "assists", "rebounds", "threept", "threepa"]
-    results = {}
 
-    for stat_type in stat_types:
-        try:
-            results[stat_type] = await compute_under_risk(db, stat_type, window_n)
-        except Exception as e:
-            logger.error(f"Error computing under-risk for {stat_type}: {e}")
-            results[stat_type] = {
+    try:
+        results = await compute_under_risk_all(db, window_n, stat_types)
+    except Exception as e:
+        logger.error(f"Error computing under-risk for {stat_types}: {e}")
+        results = {
+            stat_type: {
                 "status": "error",
                 "detail": "Failed to compute under-risk.",
             }
+            for stat_type in stat_types
+        }
 
     return {
         "status": "completed",
@@ -19,7 +19,11 @@ from ml.nba.training import (
     train_threept_model,
     train_threepa_model,
 )
-from app.db.nba.store_prediction_logs import update_prediction_actuals, delete_walkforward_logs
+from app.db.nba.store_prediction_logs import (
+    update_prediction_actuals,
+    update_prediction_actuals_all,
+    delete_walkforward_logs,
+)
 from app.db.nba.store_first_basket import update_first_basket_actuals
 from ml.nba.backtest import walk_forward_backtest
 from app.db.nba.store_prediction_logs import log_predictions
@@ -100,20 +104,15 @@ async def train_all():
 
 @router.post("/evaluate/all")
 async def evaluate_all():
-    points = await run_in_threadpool(update_prediction_actuals, sync_engine, "points")
-    assists = await run_in_threadpool(update_prediction_actuals, sync_engine, "assists")
-    rebounds = await run_in_threadpool(update_prediction_actuals, sync_engine, "rebounds")
-    minutes = await run_in_threadpool(update_prediction_actuals, sync_engine, "minutes")
-    threept = await run_in_threadpool(update_prediction_actuals, sync_engine, "threept")
-    threepa = await run_in_threadpool(update_prediction_actuals, sync_engine, "threepa")
+    updated = await run_in_threadpool(update_prediction_actuals_all, sync_engine)
     return {
         "status": "updated",
-        "points": points,
-        "assists": assists,
-        "rebounds": rebounds,
-        "minutes": minutes,
-        "threept": threept,
-        "threepa": threepa,
+        "points": updated["points"],
+        "assists": updated["assists"],
+        "rebounds": updated["rebounds"],
+        "minutes": updated["minutes"],
+        "threept": updated["threept"],
+        "threepa": updated["threepa"],
     }
 
 
@@ -7,9 +7,26 @@ from fastapi.concurrency import run_in_threadpool
 from app.services.rotowire_lineups_client import RotoWireLineupsClient
 from app.services.jedibets_first_basket_client import JediBetsFirstBasketClient
 from app.services.lineup_resolver import LineupResolver
-from app.services.lineup_context import fetch_lineups_payload, build_expected_lineup_sets
+from app.services.lineup_context import (
+    build_expected_lineup_sets,
+    fetch_lineups_payload,
+    lineup_sets_fingerprint,
+)
+from app.api.nba.best_bets import (
+    LEG_TABLE_BOOKMAKER,
+    LEG_TABLE_DAYS,
+    LEG_TABLE_STATS,
+    run_leg_table_precompute,
+)
 from app.db.nba.store_first_basket import upsert_first_basket_prediction_logs
+from app.db.nba.player_lookups import (
+    bind_ids,
+    fetch_player_games_for_stat,
+    fetch_prediction_lookups,
+    fetch_recent_points_avgs,
+)
 from app.db.url_utils import to_sync_db_url
+from app.services.cache import cached
 import sys
 from pathlib import Path
 import pandas as pd
@@ -34,6 +51,7 @@ from ml.nba.predict import (
     predict_rebounds,
     predict_threept,
     predict_threepa,
+    latest_model_versions,
 )
 from ml.nba.first_basket_model import predict_first_basket_with_models
 from app.db.nba.store_prediction_logs import log_predictions
@@ -46,6 +64,9 @@ jedi_client = JediBetsFirstBasketClient(timeout=20)
 lineup_resolver = LineupResolver(sync_engine)
 prediction_precompute_jobs: dict[str, dict] = {}
 
+# On-demand prediction results, keyed by slate inputs (see _get_or_compute_predictions).
+PREDICTION_RESULT_TTL_SECONDS = 60 * 30
+
 
 # Helper function to convert DataFrame to list of dicts for API response
 def df_to_dict(df):
@@ -106,30 +127,22 @@ def _attach_prediction_tipoffs(df_preds: pd.DataFrame, lineups_payload: dict | N
     return df_preds
 
 
-def fetch_under_risk(engine, stat_type: str, player_ids: list[int]):
-    if not player_ids:
-        return {}
-    ids = ",".join(str(int(pid)) for pid in set(player_ids))
-    query = text(
-        f"""
-        SELECT player_id, under_rate, sample_size
-        FROM player_under_risk
-        WHERE stat_type = :stat_type
-          AND player_id IN ({ids})
-        """
-    )
-    with engine.connect() as conn:
-        rows = conn.execute(query, {"stat_type": stat_type}).fetchall()
-    return {int(r[0]): {"under_rate": r[1], "sample_size": r[2]} for r in rows}
+LAST_UNDER_COLUMNS = [
+    "player_id",
+    "last_under_date",
+    "last_under_value",
+    "last_under_games_ago",
+    "last_under_matchup",
+    "last_under_minutes",
+]
 
 
 def fetch_last_under(engine, stat_type: str, player_ids: list[int]):
     if not player_ids:
         return {}
     threshold_type = "midpoint" if stat_type == "points" else "pred_p10"
-    ids = ",".join(str(int(pid)) for pid in set(player_ids))
     query = text(
-        f"""
+        """
         WITH ranked AS (
             SELECT player_id, game_date, actual_value, pred_value, pred_p10, game_id,
                    ROW_NUMBER() OVER (PARTITION BY player_id ORDER BY game_date DESC) AS rn
@@ -141,7 +154,7 @@ def fetch_last_under(engine, stat_type: str, player_ids: list[int]):
                     (:threshold_type = 'midpoint' AND pred_value IS NOT NULL AND pred_p10 IS NOT NULL)
                  OR (:threshold_type = 'pred_p10' AND pred_p10 IS NOT NULL)
               )
-              AND player_id IN ({ids})
+              AND player_id = ANY(CAST(:player_ids AS integer[]))
         ),
         undered AS (
             SELECT player_id, game_date, actual_value, rn, game_id,
@@ -178,7 +191,12 @@ def fetch_last_under(engine, stat_type: str, player_ids: list[int]):
     )
     with engine.connect() as conn:
         rows = conn.execute(
-            query, {"stat_type": stat_type, "threshold_type": threshold_type}
+            query,
+            {
+                "stat_type": stat_type,
+                "threshold_type": threshold_type,
+                "player_ids": bind_ids(player_ids),
+            },
         ).fetchall()
     result = {}
     for r in rows:
@@ -197,79 +215,61 @@ def fetch_last_under(engine, stat_type: str, player_ids: list[int]):
     return result
 
 
-def fetch_player_games_for_stat(engine, stat_type: str, player_ids: list[int]):
-    stat_column = {
-        "points": "points",
-        "assists": "assists",
-        "rebounds": "rebounds",
-        "threept": "fg3m",
-        "threepa": "fg3a",
-    }.get(stat_type)
-    if not stat_column or not player_ids:
-        return pd.DataFrame()
-
-    ids = ",".join(str(int(pid)) for pid in set(player_ids))
-    query = f"""
-    SELECT player_id, game_date, matchup, minutes, {stat_column} AS stat_value
-    FROM player_game_stats
-    WHERE player_id IN ({ids})
-      AND game_date IS NOT NULL
-      AND {stat_column} IS NOT NULL
-    """
-    return pd.read_sql(query, engine)
-
-
 def compute_last_under_by_threshold(
     engine,
     df_preds: pd.DataFrame,
     stat_type: str,
-):
+    games: pd.DataFrame | None = None,
+) -> pd.DataFrame:
+    """
+    Most recent game per player below their current under threshold. Pass
+    `games` (fetch_player_games_for_stat rows) to skip the query.
+    """
+    empty = pd.DataFrame(columns=LAST_UNDER_COLUMNS)
     if df_preds.empty:
-        return {}
+        return empty
 
     if stat_type == "points":
-        thresholds = df_preds.apply(
-            lambda r: (r["pred_p10"] + r["pred_value"]) / 2.0
-            if pd.notnull(r.get("pred_p10")) and pd.notnull(r.get("pred_value"))
-            else np.nan,
-            axis=1,
-        )
+        thresholds = (df_preds["pred_p10"] + df_preds["pred_value"]) / 2.0
     else:
         thresholds = df_preds["pred_p10"]
+    threshold_frame = (
+        pd.DataFrame(
+            {
+                "player_id": df_preds["player_id"].astype("int64").to_numpy(),
+                "threshold": pd.to_numeric(thresholds, errors="coerce").to_numpy(),
+            }
+        )
+        .dropna(subset=["threshold"])
+        .drop_duplicates("player_id", keep="last")
+    )
+    if threshold_frame.empty:
+        return empty
 
-    player_ids = df_preds["player_id"].tolist()
-    games = fetch_player_games_for_stat(engine, stat_type, player_ids)
+    if games is None:
+        games = fetch_player_games_for_stat(engine, stat_type, df_preds["player_id"].tolist())
     if games.empty:
-        return {}
-
-    games["game_date"] = pd.to_datetime(games["game_date"])
-    games = games.sort_values(["player_id", "game_date"], ascending=[True, False])
-
-    threshold_map = {
-        int(pid): float(thresholds.iloc[idx])
-        for idx, pid in enumerate(df_preds["player_id"].tolist())
-        if pd.notnull(thresholds.iloc[idx])
-    }
+        return empty
 
-    result = {}
-    for pid, group in games.groupby("player_id"):
-        threshold = threshold_map.get(int(pid))
-        if threshold is None:
-            continue
-        group = group.reset_index(drop=True)
-        under_rows = group[group["stat_value"] < threshold]
-        if under_rows.empty:
-            continue
-        row = under_rows.iloc[0]
-        result[int(pid)] = {
-            "last_under_date": row["game_date"].date(),
-            "last_under_value": row["stat_value"],
-            "last_under_games_ago": int(under_rows.index[0]),
-            "last_under_matchup": row["matchup"],
-            "last_under_minutes": row["minutes"],
+    games = games.assign(
+        game_date=pd.to_datetime(games["game_date"]),
+        player_id=games["player_id"].astype("int64"),
+    )
+    games = games.sort_values(["player_id", "game_date"], ascending=[True, False], kind="mergesort")
+    games["last_under_games_ago"] = games.groupby("player_id").cumcount()
+    games = games.merge(threshold_frame, on="player_id", how="inner")
+
+    under = games[games["stat_value"] < games["threshold"]].drop_duplicates("player_id", keep="first")
+    return pd.DataFrame(
+        {
+            "player_id": under["player_id"].to_numpy(),
+            "last_under_date": under["game_date"].dt.date.to_numpy(),
+            "last_under_value": under["stat_value"].to_numpy(),
+            "last_under_games_ago": under["last_under_games_ago"].to_numpy(),
+            "last_under_matchup": under["matchup"].to_numpy(),
+            "last_under_minutes": under["minutes"].to_numpy(),
         }
-
-    return result
+    )
 
 
 def fetch_good_player_ids(engine, stat_type: str):
@@ -347,18 +347,16 @@ def apply_under_risk_boost(df, stat_type: str, good_ids: set[int]):
         "threepa": 0.01,
     }
     delta = boosts.get(stat_type, 0)
-    if not delta:
+    if not delta or df.empty:
         return
 
-    def adjust(row):
-        base = row.get("under_risk")
-        if base is None:
-            return base
-        if row.get("last_under_games_ago") == 0 and row.get("player_id") in good_ids:
-            return max(0.0, float(base) - delta)
-        return base
-
-    df["under_risk"] = df.apply(adjust, axis=1)
+    under_risk = pd.to_numeric(df["under_risk"], errors="coerce")
+    mask = (
+        under_risk.notna()
+        & df["last_under_games_ago"].eq(0)
+        & df["player_id"].isin(good_ids)
+    )
+    df["under_risk"] = under_risk.where(~mask, (under_risk - delta).clip(lower=0.0))
 
 
 def _load_stored_predictions(engine, stat_type: str, day: str) -> pd.DataFrame:
@@ -415,30 +413,21 @@ def _enrich_prediction_frame(
     if lineups_payload is not None:
         df_preds = _attach_prediction_tipoffs(df_preds, lineups_payload)
 
-    under_risk = fetch_under_risk(sync_engine, stat_type, df_preds["player_id"].tolist())
-    last_under = compute_last_under_by_threshold(sync_engine, df_preds, stat_type)
-    good_ids = fetch_good_player_ids(sync_engine, stat_type)
-    df_preds["under_risk"] = df_preds["player_id"].map(
-        lambda pid: under_risk.get(int(pid), {}).get("under_rate")
-    )
-    df_preds["under_risk_n"] = df_preds["player_id"].map(
-        lambda pid: under_risk.get(int(pid), {}).get("sample_size")
-    )
-    df_preds["last_under_date"] = df_preds["player_id"].map(
-        lambda pid: last_under.get(int(pid), {}).get("last_under_date")
-    )
-    df_preds["last_under_value"] = df_preds["player_id"].map(
-        lambda pid: last_under.get(int(pid), {}).get("last_under_value")
-    )
-    df_preds["last_under_games_ago"] = df_preds["player_id"].map(
-        lambda pid: last_under.get(int(pid), {}).get("last_under_games_ago")
+    under_risk, games = fetch_prediction_lookups(
+        sync_engine, stat_type, df_preds["player_id"].tolist()
     )
-    df_preds["last_under_matchup"] = df_preds["player_id"].map(
-        lambda pid: last_under.get(int(pid), {}).get("last_under_matchup")
-    )
-    df_preds["last_under_minutes"] = df_preds["player_id"].map(
-        lambda pid: last_under.get(int(pid), {}).get("last_under_minutes")
+    last_under = compute_last_under_by_threshold(sync_engine, df_preds, stat_type, games=games)
+    good_ids = fetch_good_player_ids(sync_engine, stat_type)
+    lookups = under_risk.merge(last_under, on="player_id", how="outer").rename(
+        columns={"player_id": "_lookup_player_id"}
     )
+    lookup_cols = [col for col in lookups.columns if col != "_lookup_player_id"]
+    df_preds = df_preds.drop(columns=lookup_cols, errors="ignore")
+    df_preds = df_preds.assign(_lookup_player_id=df_preds["player_id"].astype("int64")).merge(
+        lookups,
+        on="_lookup_player_id",
+        how="left",
+    ).drop(columns="_lookup_player_id")
     apply_under_risk_boost(df_preds, stat_type, good_ids)
     return df_preds.sort_values("pred_value", ascending=False)
 
@@ -457,20 +446,25 @@ def _predictor_for_stat(stat_type: str):
     return predictor
 
 
-def _get_or_compute_predictions(stat_type: str, day: str) -> tuple[list[dict], str]:
-    stored_df = _load_stored_predictions(sync_engine, stat_type, day)
-    if not stored_df.empty:
-        enriched = _enrich_prediction_frame(
-            stored_df,
-            stat_type,
-            day,
-            lineups_payload=None,
-            apply_lineup_filters_flag=False,
-        )
-        return df_to_dict(enriched), "stored"
-
-    lineups_payload = fetch_lineups_payload(sync_engine, day)
-    expected_map, excluded_map = build_expected_lineup_sets(lineups_payload)
+# Keyed on everything the computed result depends on, so a lineup change or a
+# newly trained model file lands on a new key; concurrent misses for the same
+# slate share one predictor run.
+@cached(
+    ttl_seconds=PREDICTION_RESULT_TTL_SECONDS,
+    max_entries=64,
+    ignore_kwargs=("lineups_payload", "expected_map", "excluded_map"),
+)
+def _compute_predictions_for_slate(
+    stat_type: str,
+    day: str,
+    target_date: str,
+    model_versions: tuple[str | None, str | None],
+    lineup_fingerprint: str,
+    *,
+    lineups_payload: dict,
+    expected_map: dict,
+    excluded_map: dict,
+) -> tuple[list[dict], str]:
     predictor = _predictor_for_stat(stat_type)
     df_preds = predictor(
         sync_engine,
@@ -496,6 +490,32 @@ def _get_or_compute_predictions(stat_type: str, day: str) -> tuple[list[dict], s
     )
     return df_to_dict(enriched), "computed"
 
+
+def _get_or_compute_predictions(stat_type: str, day: str) -> tuple[list[dict], str]:
+    stored_df = _load_stored_predictions(sync_engine, stat_type, day)
+    if not stored_df.empty:
+        enriched = _enrich_prediction_frame(
+            stored_df,
+            stat_type,
+            day,
+            lineups_payload=None,
+            apply_lineup_filters_flag=False,
+        )
+        return df_to_dict(enriched), "stored"
+
+    lineups_payload = fetch_lineups_payload(sync_engine, day)
+    expected_map, excluded_map = build_expected_lineup_sets(lineups_payload)
+    return _compute_predictions_for_slate(
+        stat_type,
+        day,
+        str(_target_et_date_for_day(day)),
+        latest_model_versions(stat_type),
+        lineup_sets_fingerprint(expected_map, excluded_map),
+        lineups_payload=lineups_payload,
+        expected_map=expected_map,
+        excluded_map=excluded_map,
+    )
+
 @router.get("/top_scorers")
 def top_scorers(season: str = "2025-26", top_n: int = 10):
     df = client.fetch_player_stats(
@@ -648,6 +668,13 @@ def _run_prediction_precompute_job(job_id: str, days: list[str], stat_types: lis
                 payload, source = _get_or_compute_predictions(stat_type, day)
                 results[day][stat_type] = {"rows": len(payload), "source": source}
 
+        # re-score the best-bets legs on the fresh predictions
+        leg_days = [day for day in days if day in LEG_TABLE_DAYS]
+        if leg_days and set(stat_types) & set(LEG_TABLE_STATS):
+            prediction_precompute_jobs[job_id]["leg_table_job_id"] = run_leg_table_precompute(
+                leg_days, LEG_TABLE_BOOKMAKER
+            )
+
         prediction_precompute_jobs[job_id]["status"] = "completed"
         prediction_precompute_jobs[job_id]["result"] = results
         prediction_precompute_jobs[job_id]["finished_at"] = datetime.utcnow().isoformat()
@@ -859,31 +886,6 @@ async def predict_doubles_api(
     }
 
 
-def fetch_recent_points_avgs(engine, player_ids: list[int], n_games: int = 10):
-    if not player_ids:
-        return {}
-    ids = ",".join(str(int(pid)) for pid in set(player_ids))
-    query = text(
-        f"""
-        WITH ranked AS (
-            SELECT player_id, points, game_date,
-                   ROW_NUMBER() OVER (PARTITION BY player_id ORDER BY game_date DESC) AS rn
-            FROM player_game_stats
-            WHERE player_id IN ({ids})
-              AND points IS NOT NULL
-              AND game_date IS NOT NULL
-        )
-        SELECT player_id, AVG(points) AS avg_points
-        FROM ranked
-        WHERE rn <= :n_games
-        GROUP BY player_id
-        """
-    )
-    with engine.connect() as conn:
-        rows = conn.execute(query, {"n_games": n_games}).fetchall()
-    return {int(r[0]): float(r[1]) for r in rows if r[1] is not None}
-
-
 def _injury_multiplier(injury_tag: str | None):
     if not injury_tag:
         return 1.0
@@ -1044,46 +1046,66 @@ def _apply_lineup_filters(
     if not injury_index:
         return df_preds
 
-    adjusted_rows = []
-    for _, row in df_preds.iterrows():
-        game_id = row.get("game_id")
-        pid = row.get("player_id")
-        if pd.isnull(game_id) or pd.isnull(pid):
-            adjusted_rows.append(row)
-            continue
-        game_info = injury_index.get(str(game_id))
-        if not game_info:
-            adjusted_rows.append(row)
-            continue
-        info = game_info.get(int(pid))
-        if not info:
-            # If lineup data exists for this game and player is not listed,
-            # treat them as unavailable for this slate.
-            continue
-
-        injury_tag = info.get("injury_tag")
+    def multiplier(info: dict) -> float:
+        mult = _injury_multiplier(info.get("injury_tag"))
         play_pct = info.get("play_pct")
-        mult = _injury_multiplier(injury_tag)
         if play_pct is not None:
             try:
                 mult *= float(play_pct) / 100.0
             except (TypeError, ValueError):
                 pass
+        return mult
 
-        if mult <= 0:
-            continue
-
-        for col in ["pred_value", "pred_p10", "pred_p50", "pred_p90"]:
-            val = row.get(col)
-            if pd.notnull(val):
-                row[col] = float(val) * mult
-
-        row["lineup_injury_tag"] = injury_tag
-        row["lineup_play_pct"] = play_pct
-        row["lineup_status"] = info.get("lineup_status")
-        adjusted_rows.append(row)
+    # One row per listed (game, player); the index is small, the frame is not.
+    lineup = pd.DataFrame(
+        [
+            {
+                "_game_key": game_key,
+                "_pid": pid,
+                "_mult": multiplier(info),
+                "lineup_injury_tag": info.get("injury_tag"),
+                "lineup_play_pct": info.get("play_pct"),
+                "lineup_status": info.get("lineup_status"),
+            }
+            for game_key, players in injury_index.items()
+            for pid, info in players.items()
+        ],
+        columns=["_game_key", "_pid", "_mult", "lineup_injury_tag", "lineup_play_pct", "lineup_status"],
+    )
+    lineup["_pid"] = lineup["_pid"].astype("Int64")
+
+    game_key = df_preds["game_id"].astype(str).where(df_preds["game_id"].notna())
+    pid = pd.to_numeric(df_preds["player_id"], errors="coerce").astype("Int64")
+    # (game, player) pairs are unique in the index, so a left merge keeps row order.
+    matched = pd.DataFrame({"_game_key": game_key, "_pid": pid}).merge(
+        lineup,
+        on=["_game_key", "_pid"],
+        how="left",
+    )
+    matched.index = df_preds.index
+
+    # Rows in a game with lineup data must be listed there (not listed means
+    # unavailable for this slate) and have a positive multiplier. A game whose
+    # lineup resolved no players has no lineup data; its rows are kept as-is.
+    lineup_games = [key for key, players in injury_index.items() if players]
+    in_lineup_game = game_key.isin(lineup_games) & pid.notna()
+    listed = matched["_mult"].notna()
+    keep = ~in_lineup_game | (listed & (matched["_mult"] > 0))
+    adjust = (in_lineup_game & listed & keep).to_numpy()
+
+    df_preds = df_preds[keep.to_numpy()].copy()
+    matched = matched[keep.to_numpy()]
+    adjust = adjust[keep.to_numpy()]
+    if not adjust.any():
+        return df_preds
 
-    return pd.DataFrame(adjusted_rows)
+    for col in ["pred_value", "pred_p10", "pred_p50", "pred_p90"]:
+        if col in df_preds.columns:
+            values = pd.to_numeric(df_preds[col], errors="coerce")
+            df_preds[col] = values.where(~adjust, values * matched["_mult"])
+    for col in ["lineup_injury_tag", "lineup_play_pct", "lineup_status"]:
+        df_preds[col] = matched[col].where(adjust)
+    return df_preds
 
 
 TEAM_ABBR_ALIAS = {
@@ -22,6 +22,11 @@ class Settings(BaseSettings):
     PROPLINE_API_KEY: str | None = None
     PROPLINE_BASE_URL: str = "https://api.prop-line.com/v1"
 
+    # @cached storage: "memory" (per worker) or "sqlite" (shared across
+    # workers on this host; SHARED_CACHE_PATH defaults under data/cache/)
+    CACHE_BACKEND: str = "memory"
+    SHARED_CACHE_PATH: str | None = None
+
     model_config = SettingsConfigDict(
         env_file=BASE_DIR / ".env",
         env_file_encoding="utf-8",
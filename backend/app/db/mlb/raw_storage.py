@@ -1,14 +1,34 @@
 from __future__ import annotations
 
+import asyncio
+import gzip
+import hashlib
+import io
 import json
+import os
 import re
+import tempfile
+import threading
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import IO, Iterator
+
+try:
+    import zstandard
+except ImportError:  # optional; fall back to gzip
+    zstandard = None
 
 
 ROOT_DIR = Path(__file__).resolve().parents[4]
 RAW_ROOT = ROOT_DIR / "data" / "raw" / "mlb"
+OBJECTS_ROOT = RAW_ROOT / "objects"
+MANIFEST_PATH = RAW_ROOT / "manifest.jsonl"
+
+ZSTD_LEVEL = 10
+GZIP_LEVEL = 6
+
+_manifest_lock = threading.Lock()
 
 
 @dataclass(slots=True)
@@ -16,11 +36,10 @@ class RawFileRecord:
     relative_path: str
     absolute_path: Path
     fetched_at: datetime
-
-
-def _timestamp_slug(value: datetime | None = None) -> str:
-    current = value or datetime.now(timezone.utc)
-    return current.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    sha256: str | None = None
+    size_bytes: int | None = None
+    stored_bytes: int | None = None
+    deduplicated: bool = False
 
 
 def _safe_slug(value: str) -> str:
@@ -28,25 +47,98 @@ def _safe_slug(value: str) -> str:
     return slug.strip("._-") or "payload"
 
 
-def write_json_payload(
+def _codec_suffix() -> str:
+    return ".zst" if zstandard is not None else ".gz"
+
+
+def _compress(data: bytes) -> bytes:
+    if zstandard is not None:
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    return gzip.compress(data, compresslevel=GZIP_LEVEL)
+
+
+def _object_path(digest: str, extension: str) -> Path:
+    return OBJECTS_ROOT / digest[:2] / f"{digest}.{_safe_slug(extension)}{_codec_suffix()}"
+
+
+def _existing_object(digest: str, extension: str) -> Path | None:
+    # an object written under the other codec is still a valid copy
+    for suffix in (".zst", ".gz"):
+        path = OBJECTS_ROOT / digest[:2] / f"{digest}.{_safe_slug(extension)}{suffix}"
+        if path.exists():
+            return path
+    return None
+
+
+def _append_manifest(entry: dict) -> None:
+    line = json.dumps(entry, ensure_ascii=True, separators=(",", ":")) + "\n"
+    with _manifest_lock:
+        MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+        # one append-mode write per line keeps entries whole across processes
+        with open(MANIFEST_PATH, "a", encoding="utf-8") as manifest:
+            manifest.write(line)
+
+
+def _store_payload(
     source: str,
     resource_type: str,
     name: str,
-    payload: object,
+    data: bytes,
+    extension: str,
 ) -> RawFileRecord:
+    """
+    Store `data` once under its sha256 (compressed) and record the fetch in
+    the manifest. Byte-identical refetches only add a manifest line.
+    """
     fetched_at = datetime.now(timezone.utc)
-    target_dir = RAW_ROOT / _safe_slug(source) / _safe_slug(resource_type)
-    target_dir.mkdir(parents=True, exist_ok=True)
-    absolute_path = target_dir / f"{_safe_slug(name)}_{_timestamp_slug(fetched_at)}.json"
-    absolute_path.write_text(
-        json.dumps(payload, ensure_ascii=True, separators=(",", ":")),
-        encoding="utf-8",
-    )
-    return RawFileRecord(
+    digest = hashlib.sha256(data).hexdigest()
+
+    absolute_path = _existing_object(digest, extension)
+    deduplicated = absolute_path is not None
+    if absolute_path is None:
+        absolute_path = _object_path(digest, extension)
+        absolute_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=absolute_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(_compress(data))
+            os.replace(tmp_name, absolute_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    record = RawFileRecord(
         relative_path=str(absolute_path.relative_to(ROOT_DIR)),
         absolute_path=absolute_path,
         fetched_at=fetched_at,
+        sha256=digest,
+        size_bytes=len(data),
+        stored_bytes=absolute_path.stat().st_size,
+        deduplicated=deduplicated,
+    )
+    _append_manifest(
+        {
+            "source": _safe_slug(source),
+            "resource_type": _safe_slug(resource_type),
+            "name": _safe_slug(name),
+            "fetched_at": fetched_at.isoformat(),
+            "sha256": digest,
+            "path": record.relative_path,
+            "size_bytes": record.size_bytes,
+            "stored_bytes": record.stored_bytes,
+        }
     )
+    return record
+
+
+def write_json_payload(
+    source: str,
+    resource_type: str,
+    name: str,
+    payload: object,
+) -> RawFileRecord:
+    data = json.dumps(payload, ensure_ascii=True, separators=(",", ":")).encode("utf-8")
+    return _store_payload(source, resource_type, name, data, "json")
 
 
 def write_text_payload(
@@ -56,13 +148,74 @@ def write_text_payload(
     text: str,
     extension: str = "csv",
 ) -> RawFileRecord:
-    fetched_at = datetime.now(timezone.utc)
-    target_dir = RAW_ROOT / _safe_slug(source) / _safe_slug(resource_type)
-    target_dir.mkdir(parents=True, exist_ok=True)
-    absolute_path = target_dir / f"{_safe_slug(name)}_{_timestamp_slug(fetched_at)}.{_safe_slug(extension)}"
-    absolute_path.write_text(text, encoding="utf-8")
-    return RawFileRecord(
-        relative_path=str(absolute_path.relative_to(ROOT_DIR)),
-        absolute_path=absolute_path,
-        fetched_at=fetched_at,
+    return _store_payload(source, resource_type, name, text.encode("utf-8"), extension)
+
+
+async def write_json_payload_async(
+    source: str,
+    resource_type: str,
+    name: str,
+    payload: object,
+) -> RawFileRecord:
+    return await asyncio.to_thread(write_json_payload, source, resource_type, name, payload)
+
+
+async def write_text_payload_async(
+    source: str,
+    resource_type: str,
+    name: str,
+    text: str,
+    extension: str = "csv",
+) -> RawFileRecord:
+    return await asyncio.to_thread(
+        write_text_payload, source, resource_type, name, text, extension
     )
+
+
+def open_raw_payload(path: str | Path) -> IO[bytes]:
+    """
+    Open an archived payload for streaming reads, decompressing on the fly.
+    Accepts a path relative to the repo root (as stored in `local_path`).
+    Legacy uncompressed files are opened as-is.
+    """
+    absolute_path = Path(path)
+    if not absolute_path.is_absolute():
+        absolute_path = ROOT_DIR / absolute_path
+    if absolute_path.suffix == ".gz":
+        return gzip.open(absolute_path, "rb")
+    if absolute_path.suffix == ".zst":
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read .zst raw payloads")
+        return zstandard.ZstdDecompressor().stream_reader(open(absolute_path, "rb"), closefd=True)
+    return open(absolute_path, "rb")
+
+
+def read_json_payload(path: str | Path) -> object:
+    with open_raw_payload(path) as stream:
+        return json.load(io.TextIOWrapper(stream, encoding="utf-8"))
+
+
+def read_text_payload(path: str | Path) -> str:
+    with open_raw_payload(path) as stream:
+        return stream.read().decode("utf-8")
+
+
+def iter_manifest(
+    source: str | None = None,
+    resource_type: str | None = None,
+    name: str | None = None,
+) -> Iterator[dict]:
+    if not MANIFEST_PATH.exists():
+        return
+    with open(MANIFEST_PATH, encoding="utf-8") as manifest:
+        for line in manifest:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if source is not None and entry["source"] != _safe_slug(source):
+                continue
+            if resource_type is not None and entry["resource_type"] != _safe_slug(resource_type):
+                continue
+            if name is not None and entry["name"] != _safe_slug(name):
+                continue
+            yield entry
@@ -1,15 +1,26 @@
 from __future__ import annotations
 
+import asyncio
+import logging
+import multiprocessing
 import re
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
 from typing import Any
 
 import pandas as pd
-from sqlalchemy import delete, select
+from sqlalchemy import delete, select, text
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.mlb.raw_storage import write_json_payload, write_text_payload
+from app.db.mlb.raw_storage import (
+    RawFileRecord,
+    write_json_payload,
+    write_json_payload_async,
+    write_text_payload_async,
+)
 from app.models.mlb import (
     MlbBatTrackingBatterSeason,
     MlbBattedBallEvent,
@@ -42,6 +53,22 @@ from app.services.open_meteo_client import OpenMeteoClient
 
 
 UTC = timezone.utc
+logger = logging.getLogger(__name__)
+
+GAME_FEED_FETCH_CONCURRENCY = 8
+GAME_FEED_PARSE_WORKERS = 4
+GAME_FEED_WRITE_BATCH_GAMES = 10
+
+MAX_QUERY_ARGS = 32767
+QUERY_ARG_HEADROOM = 512
+
+# Row counts at which _upsert_rows switches from multi-VALUES inserts to
+# COPY into a temp table followed by one INSERT ... SELECT merge.
+COPY_LOAD_THRESHOLDS: dict[str, int] = {
+    "mlb_pitch_events": 2000,
+    "mlb_batted_ball_events": 2000,
+    "mlb_player_game_batting": 2000,
+}
 
 
 def _daterange(start_value: date, end_value: date) -> list[date]:
@@ -359,8 +386,7 @@ def _build_roster_snapshot_row(
     return player_row, roster_row
 
 
-async def _create_source_pull(
-    db: AsyncSession,
+def _build_source_pull(
     *,
     source: str,
     resource_type: str,
@@ -377,7 +403,7 @@ async def _create_source_pull(
     notes: str | None = None,
     fetched_at: datetime | None = None,
 ) -> MlbSourcePull:
-    pull = MlbSourcePull(
+    return MlbSourcePull(
         source=source,
         resource_type=resource_type,
         request_url=request_url,
@@ -393,11 +419,87 @@ async def _create_source_pull(
         notes=notes,
         fetched_at=fetched_at or datetime.now(UTC),
     )
+
+
+async def _create_source_pull(db: AsyncSession, **kwargs: Any) -> MlbSourcePull:
+    pull = _build_source_pull(**kwargs)
     db.add(pull)
     await db.flush()
     return pull
 
 
+def _quote_ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+async def _asyncpg_connection(db: AsyncSession):
+    connection = await db.connection()
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = getattr(raw_connection, "driver_connection", None)
+    if driver_connection is None or not hasattr(driver_connection, "copy_records_to_table"):
+        return None
+    return driver_connection
+
+
+async def _copy_merge_rows(
+    db: AsyncSession,
+    model: type,
+    rows: list[dict[str, Any]],
+    *,
+    conflict_columns: list[str] | None,
+    constraint: str | None,
+    update_columns: list[str],
+) -> bool:
+    """
+    COPY `rows` into a session temp table and merge them into the model's
+    table with one INSERT ... SELECT ... ON CONFLICT. Returns False when the
+    session is not backed by asyncpg so the caller can fall back.
+    """
+    driver_connection = await _asyncpg_connection(db)
+    if driver_connection is None:
+        return False
+
+    table_name = model.__tablename__
+    columns = list(rows[0].keys())
+    column_list = ", ".join(_quote_ident(column) for column in columns)
+    temp_table = f"tmp_copy_{table_name}_{uuid.uuid4().hex[:8]}"
+
+    # the temp table only mirrors the copied columns, with no constraints
+    await db.execute(
+        text(
+            f"CREATE TEMP TABLE {_quote_ident(temp_table)} ON COMMIT DROP AS "
+            f"SELECT {column_list} FROM {_quote_ident(table_name)} WITH NO DATA"
+        )
+    )
+    await driver_connection.copy_records_to_table(
+        temp_table,
+        records=[tuple(row.get(column) for column in columns) for row in rows],
+        columns=columns,
+    )
+
+    if constraint:
+        conflict_target = f"ON CONSTRAINT {_quote_ident(constraint)}"
+    else:
+        conflict_target = "(" + ", ".join(_quote_ident(column) for column in conflict_columns or []) + ")"
+    if update_columns:
+        conflict_action = "DO UPDATE SET " + ", ".join(
+            f"{_quote_ident(column)} = EXCLUDED.{_quote_ident(column)}"
+            for column in update_columns
+        )
+    else:
+        conflict_action = "DO NOTHING"
+
+    await db.execute(
+        text(
+            f"INSERT INTO {_quote_ident(table_name)} ({column_list}) "
+            f"SELECT {column_list} FROM {_quote_ident(temp_table)} "
+            f"ON CONFLICT {conflict_target} {conflict_action}"
+        )
+    )
+    await db.execute(text(f"DROP TABLE {_quote_ident(temp_table)}"))
+    return True
+
+
 async def _upsert_rows(
     db: AsyncSession,
     model: type,
@@ -405,10 +507,12 @@ async def _upsert_rows(
     *,
     conflict_columns: list[str] | None = None,
     constraint: str | None = None,
+    copy_threshold: int | None = None,
 ) -> int:
-    MAX_QUERY_ARGS = 32767
-    QUERY_ARG_HEADROOM = 512
-
+    """
+    `copy_threshold` overrides COPY_LOAD_THRESHOLDS for this call; batches at
+    or above it are loaded with COPY instead of bind-parameter inserts.
+    """
     if not rows:
         return 0
 
@@ -437,14 +541,32 @@ async def _upsert_rows(
         return 0
 
     sample = deduped_rows[0]
-    column_count = max(len(sample), 1)
-    max_rows_per_batch = max(1, (MAX_QUERY_ARGS - QUERY_ARG_HEADROOM) // column_count)
     update_columns = [
         key
         for key in sample.keys()
         if key not in set(conflict_columns or []) and key != "id"
     ]
 
+    threshold = (
+        copy_threshold
+        if copy_threshold is not None
+        else COPY_LOAD_THRESHOLDS.get(model.__tablename__)
+    )
+    if threshold is not None and len(deduped_rows) >= threshold:
+        copied = await _copy_merge_rows(
+            db,
+            model,
+            deduped_rows,
+            conflict_columns=conflict_columns,
+            constraint=constraint,
+            update_columns=update_columns,
+        )
+        if copied:
+            return len(deduped_rows)
+
+    column_count = max(len(sample), 1)
+    max_rows_per_batch = max(1, (MAX_QUERY_ARGS - QUERY_ARG_HEADROOM) // column_count)
+
     for start_index in range(0, len(deduped_rows), max_rows_per_batch):
         batch_rows = deduped_rows[start_index : start_index + max_rows_per_batch]
         stmt = insert(model).values(batch_rows)
@@ -570,7 +692,7 @@ def _extract_schedule_game_rows(
 
 def _extract_lineup_rows(
     *,
-    snapshot_id: int,
+    snapshot_id: int | None,
     game_pk: int,
     home_team_id: int,
     away_team_id: int,
@@ -620,7 +742,7 @@ def _extract_lineup_rows(
 
 def _extract_official_assignment_rows(
     *,
-    snapshot_id: int,
+    snapshot_id: int | None,
     game_pk: int,
     officials: list[dict[str, Any]] | None,
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
@@ -984,7 +1106,7 @@ async def ingest_teams(
 ) -> dict[str, Any]:
     stats_client = client or MlbStatsApiClient()
     teams_payload, teams_url = await stats_client.get_teams(season=season, hydrate="venue")
-    raw_teams = write_json_payload("statsapi", "teams", f"season_{season}", teams_payload)
+    raw_teams = await write_json_payload_async("statsapi", "teams", f"season_{season}", teams_payload)
 
     team_rows = [
         row
@@ -1024,7 +1146,7 @@ async def ingest_teams(
 
     for venue_chunk in _chunked(venue_ids, 25):
         venue_payload, venue_url = await stats_client.get_venues(venue_ids=venue_chunk, season=season)
-        raw_venues = write_json_payload(
+        raw_venues = await write_json_payload_async(
             "statsapi",
             "venues",
             f"season_{season}_{venue_chunk[0]}_{venue_chunk[-1]}",
@@ -1085,7 +1207,7 @@ async def ingest_team_roster(
         date=roster_date_value.isoformat(),
         hydrate="person",
     )
-    raw_roster = write_json_payload(
+    raw_roster = await write_json_payload_async(
         "statsapi",
         "team_roster",
         f"{team_id}_{roster_type}_{roster_date_value.isoformat()}",
@@ -1217,7 +1339,7 @@ async def ingest_schedule(
         game_types="R,F,D,L,W",
         hydrate="probablePitcher,team,venue,weather,linescore",
     )
-    raw_schedule = write_json_payload(
+    raw_schedule = await write_json_payload_async(
         "statsapi",
         "schedule",
         f"season_{season}_{start_date or 'full'}_{end_date or 'full'}",
@@ -1287,16 +1409,33 @@ async def ingest_schedule(
     }
 
 
-async def ingest_game_feed(
-    db: AsyncSession,
-    *,
+@dataclass(slots=True)
+class ParsedGameFeed:
+    game_pk: int
+    request_url: str
+    raw_feed: RawFileRecord
+    venue_rows: list[dict[str, Any]]
+    team_rows: list[dict[str, Any]]
+    player_rows: list[dict[str, Any]]
+    game_row: dict[str, Any]
+    source_pull: dict[str, Any]
+    snapshot: dict[str, Any]
+    umpire_rows: list[dict[str, Any]]
+    official_rows: list[dict[str, Any]]
+    lineup_rows: list[dict[str, Any]]
+    batting_rows: list[dict[str, Any]]
+    pitching_rows: list[dict[str, Any]]
+    pitch_rows: list[dict[str, Any]]
+    batted_ball_rows: list[dict[str, Any]]
+
+
+def _parse_game_feed(
     game_pk: int,
-    client: MlbStatsApiClient | None = None,
-) -> dict[str, Any]:
-    stats_client = client or MlbStatsApiClient()
-    payload, request_url = await stats_client.get_game_feed(game_pk=game_pk)
-    raw_feed = write_json_payload("statsapi", "feed_live", f"game_{game_pk}", payload)
-
+    payload: dict[str, Any],
+    request_url: str,
+    raw_feed: RawFileRecord,
+) -> ParsedGameFeed:
+    """Turn a feed/live payload into table rows. Pure CPU work, no DB access."""
     game_data = payload.get("gameData") or {}
     live_data = payload.get("liveData") or {}
     officials = ((live_data.get("boxscore") or {}).get("officials") or [])
@@ -1321,12 +1460,6 @@ async def ingest_game_feed(
         )
         if row
     ]
-    if venue_row:
-        await _upsert_rows(db, MlbVenue, [venue_row], conflict_columns=["id"])
-    if team_rows:
-        await _upsert_rows(db, MlbTeam, team_rows, conflict_columns=["id"])
-    if player_rows:
-        await _upsert_rows(db, MlbPlayer, player_rows, conflict_columns=["id"])
 
     home_team = (game_data.get("teams") or {}).get("home") or {}
     away_team = (game_data.get("teams") or {}).get("away") or {}
@@ -1371,53 +1504,143 @@ async def ingest_game_feed(
         "roof_type": _safe_text(_candidate(game_data.get("venue") or {}, "roofType", "roof_type")),
         "last_ingested_at": raw_feed.fetched_at,
     }
-    source_pull = await _create_source_pull(
-        db,
-        source="statsapi",
-        resource_type="feed_live",
-        request_url=request_url,
-        request_params={"gamePk": game_pk},
-        local_path=raw_feed.relative_path,
-        response_format="json",
-        season=_safe_int(game_data.get("season")),
-        game_pk=game_pk,
-        start_date=game_row["official_date"],
-        end_date=game_row["official_date"],
-        row_count=len(all_plays),
-        fetched_at=raw_feed.fetched_at,
-    )
-    await _upsert_rows(db, MlbGame, [game_row], conflict_columns=["game_pk"])
-
-    snapshot = MlbGameSnapshot(
-        game_pk=game_pk,
-        source_pull_id=source_pull.id,
-        snapshot_type=_game_snapshot_type(status_payload),
-        captured_at=raw_feed.fetched_at,
-        status_code=game_row["status_code"],
-        detailed_state=game_row["detailed_state"],
-        weather_condition=game_row["weather_condition"],
-        temperature_f=game_row["temperature_f"],
-        wind_text=game_row["wind_text"],
-        roof_type=game_row["roof_type"],
-        probable_home_pitcher_id=game_row["probable_home_pitcher_id"],
-        probable_away_pitcher_id=game_row["probable_away_pitcher_id"],
-        payload={"request_url": request_url, "raw_path": raw_feed.relative_path},
-    )
-    db.add(snapshot)
-    await db.flush()
+    source_pull = {
+        "source": "statsapi",
+        "resource_type": "feed_live",
+        "request_url": request_url,
+        "request_params": {"gamePk": game_pk},
+        "local_path": raw_feed.relative_path,
+        "response_format": "json",
+        "season": _safe_int(game_data.get("season")),
+        "game_pk": game_pk,
+        "start_date": game_row["official_date"],
+        "end_date": game_row["official_date"],
+        "row_count": len(all_plays),
+        "fetched_at": raw_feed.fetched_at,
+    }
+    snapshot = {
+        "game_pk": game_pk,
+        "snapshot_type": _game_snapshot_type(status_payload),
+        "captured_at": raw_feed.fetched_at,
+        "status_code": game_row["status_code"],
+        "detailed_state": game_row["detailed_state"],
+        "weather_condition": game_row["weather_condition"],
+        "temperature_f": game_row["temperature_f"],
+        "wind_text": game_row["wind_text"],
+        "roof_type": game_row["roof_type"],
+        "probable_home_pitcher_id": game_row["probable_home_pitcher_id"],
+        "probable_away_pitcher_id": game_row["probable_away_pitcher_id"],
+        "payload": {"request_url": request_url, "raw_path": raw_feed.relative_path},
+    }
 
+    # snapshot_id is filled in by the writer once the snapshot row exists.
     lineup_rows = _extract_lineup_rows(
-        snapshot_id=snapshot.id,
+        snapshot_id=None,
         game_pk=game_pk,
         home_team_id=home_team_id,
         away_team_id=away_team_id,
         boxscore_teams=boxscore_teams,
     )
     umpire_rows, official_rows = _extract_official_assignment_rows(
-        snapshot_id=snapshot.id,
+        snapshot_id=None,
         game_pk=game_pk,
         officials=officials,
     )
+    batting_rows, pitching_rows = _extract_player_game_rows(
+        game_pk=game_pk,
+        home_team_id=home_team_id,
+        away_team_id=away_team_id,
+        boxscore_teams=boxscore_teams,
+    )
+    pitch_rows, batted_ball_rows = _extract_event_rows(game_pk=game_pk, all_plays=all_plays)
+
+    return ParsedGameFeed(
+        game_pk=game_pk,
+        request_url=request_url,
+        raw_feed=raw_feed,
+        venue_rows=[venue_row] if venue_row else [],
+        team_rows=team_rows,
+        player_rows=player_rows,
+        game_row=game_row,
+        source_pull=source_pull,
+        snapshot=snapshot,
+        umpire_rows=umpire_rows,
+        official_rows=official_rows,
+        lineup_rows=lineup_rows,
+        batting_rows=batting_rows,
+        pitching_rows=pitching_rows,
+        pitch_rows=pitch_rows,
+        batted_ball_rows=batted_ball_rows,
+    )
+
+
+def _archive_and_parse_game_feed(
+    game_pk: int,
+    payload: dict[str, Any],
+    request_url: str,
+) -> ParsedGameFeed:
+    raw_feed = write_json_payload("statsapi", "feed_live", f"game_{game_pk}", payload)
+    return _parse_game_feed(game_pk, payload, request_url, raw_feed)
+
+
+async def _write_game_feeds(
+    db: AsyncSession,
+    feeds: list[ParsedGameFeed],
+) -> list[dict[str, Any]]:
+    """Write a batch of parsed feeds with one upsert per table across games."""
+    if not feeds:
+        return []
+
+    def _gather(attr: str) -> list[dict[str, Any]]:
+        return [row for feed in feeds for row in getattr(feed, attr)]
+
+    # Venue/team/player/umpire rows repeat across games and _upsert_rows keeps
+    # the first row per key, so gather those newest game first: the latest
+    # feed wins regardless of the order feeds finished parsing in.
+    newest_first = sorted(
+        feeds,
+        key=lambda feed: (feed.game_row.get("official_date") or date.min, feed.game_pk),
+        reverse=True,
+    )
+
+    def _gather_latest(attr: str) -> list[dict[str, Any]]:
+        return [row for feed in newest_first for row in getattr(feed, attr)]
+
+    venue_rows = _gather_latest("venue_rows")
+    team_rows = _gather_latest("team_rows")
+    player_rows = _gather_latest("player_rows")
+    if venue_rows:
+        await _upsert_rows(db, MlbVenue, venue_rows, conflict_columns=["id"])
+    if team_rows:
+        await _upsert_rows(db, MlbTeam, team_rows, conflict_columns=["id"])
+    if player_rows:
+        await _upsert_rows(db, MlbPlayer, player_rows, conflict_columns=["id"])
+
+    source_pulls = [_build_source_pull(**feed.source_pull) for feed in feeds]
+    db.add_all(source_pulls)
+    await db.flush()
+    await _upsert_rows(
+        db,
+        MlbGame,
+        [feed.game_row for feed in feeds],
+        conflict_columns=["game_pk"],
+    )
+
+    snapshots = [
+        MlbGameSnapshot(source_pull_id=source_pull.id, **feed.snapshot)
+        for feed, source_pull in zip(feeds, source_pulls)
+    ]
+    db.add_all(snapshots)
+    await db.flush()
+    for feed, snapshot in zip(feeds, snapshots):
+        for row in feed.lineup_rows:
+            row["snapshot_id"] = snapshot.id
+        for row in feed.official_rows:
+            row["snapshot_id"] = snapshot.id
+
+    umpire_rows = _gather_latest("umpire_rows")
+    official_rows = _gather("official_rows")
+    lineup_rows = _gather("lineup_rows")
     if umpire_rows:
         await _upsert_rows(db, MlbUmpire, umpire_rows, conflict_columns=["id"])
     if official_rows:
@@ -1435,19 +1658,16 @@ async def ingest_game_feed(
             constraint="uq_mlb_lineup_snapshot_player",
         )
 
-    batting_rows, pitching_rows = _extract_player_game_rows(
-        game_pk=game_pk,
-        home_team_id=home_team_id,
-        away_team_id=away_team_id,
-        boxscore_teams=boxscore_teams,
-    )
-    pitch_rows, batted_ball_rows = _extract_event_rows(game_pk=game_pk, all_plays=all_plays)
-
-    await db.execute(delete(MlbPlayerGameBatting).where(MlbPlayerGameBatting.game_pk == game_pk))
-    await db.execute(delete(MlbPlayerGamePitching).where(MlbPlayerGamePitching.game_pk == game_pk))
-    await db.execute(delete(MlbPitchEvent).where(MlbPitchEvent.game_pk == game_pk))
-    await db.execute(delete(MlbBattedBallEvent).where(MlbBattedBallEvent.game_pk == game_pk))
+    game_pks = [feed.game_pk for feed in feeds]
+    await db.execute(delete(MlbPlayerGameBatting).where(MlbPlayerGameBatting.game_pk.in_(game_pks)))
+    await db.execute(delete(MlbPlayerGamePitching).where(MlbPlayerGamePitching.game_pk.in_(game_pks)))
+    await db.execute(delete(MlbPitchEvent).where(MlbPitchEvent.game_pk.in_(game_pks)))
+    await db.execute(delete(MlbBattedBallEvent).where(MlbBattedBallEvent.game_pk.in_(game_pks)))
 
+    batting_rows = _gather("batting_rows")
+    pitching_rows = _gather("pitching_rows")
+    pitch_rows = _gather("pitch_rows")
+    batted_ball_rows = _gather("batted_ball_rows")
     if batting_rows:
         await _upsert_rows(
             db,
@@ -1478,19 +1698,35 @@ async def ingest_game_feed(
         )
 
     await db.commit()
-    return {
-        "status": "success",
-        "game_pk": game_pk,
-        "source_pull_id": source_pull.id,
-        "snapshot_id": snapshot.id,
-        "official_rows": len(official_rows),
-        "lineup_rows": len(lineup_rows),
-        "batting_rows": len(batting_rows),
-        "pitching_rows": len(pitching_rows),
-        "pitch_events": len(pitch_rows),
-        "batted_ball_events": len(batted_ball_rows),
-        "snapshot_type": snapshot.snapshot_type,
-    }
+    return [
+        {
+            "status": "success",
+            "game_pk": feed.game_pk,
+            "source_pull_id": source_pull.id,
+            "snapshot_id": snapshot.id,
+            "official_rows": len(feed.official_rows),
+            "lineup_rows": len(feed.lineup_rows),
+            "batting_rows": len(feed.batting_rows),
+            "pitching_rows": len(feed.pitching_rows),
+            "pitch_events": len(feed.pitch_rows),
+            "batted_ball_events": len(feed.batted_ball_rows),
+            "snapshot_type": snapshot.snapshot_type,
+        }
+        for feed, source_pull, snapshot in zip(feeds, source_pulls, snapshots)
+    ]
+
+
+async def ingest_game_feed(
+    db: AsyncSession,
+    *,
+    game_pk: int,
+    client: MlbStatsApiClient | None = None,
+) -> dict[str, Any]:
+    stats_client = client or MlbStatsApiClient()
+    payload, request_url = await stats_client.get_game_feed(game_pk=game_pk)
+    feed = await asyncio.to_thread(_archive_and_parse_game_feed, game_pk, payload, request_url)
+    results = await _write_game_feeds(db, [feed])
+    return results[0]
 
 
 async def ingest_game_feeds(
@@ -1501,6 +1737,9 @@ async def ingest_game_feeds(
     end_date: str,
     final_only: bool = False,
     client: MlbStatsApiClient | None = None,
+    fetch_concurrency: int = GAME_FEED_FETCH_CONCURRENCY,
+    parse_workers: int = GAME_FEED_PARSE_WORKERS,
+    write_batch_games: int = GAME_FEED_WRITE_BATCH_GAMES,
 ) -> dict[str, Any]:
     stats_client = client or MlbStatsApiClient()
     schedule_result = await ingest_schedule(
@@ -1526,11 +1765,85 @@ async def ingest_game_feeds(
     target_stmt = target_stmt.order_by(MlbGame.official_date, MlbGame.game_pk)
     target_result = await db.execute(target_stmt)
     target_game_pks = [int(game_pk) for game_pk in target_result.scalars().all()]
+    # Release the read transaction while feeds download.
+    await db.commit()
 
-    per_game_results = []
-    for game_pk in target_game_pks:
-        per_game_results.append(await ingest_game_feed(db, game_pk=game_pk, client=stats_client))
-
+    # Pipeline: a fixed set of fetch_concurrency workers pull game_pks, fetch
+    # and archive + parse each feed in a process pool, and hand it to a single
+    # writer that batches upserts across games per table. A worker only moves
+    # to its next game once the writer's bounded queue has taken the last one,
+    # so at most fetch_concurrency + queue size feeds are held in memory.
+    loop = asyncio.get_running_loop()
+    parsed_queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, write_batch_games) * 2)
+    per_game_results: list[dict[str, Any]] = []
+    failed_games: list[dict[str, Any]] = []
+    pending_game_pks = iter(target_game_pks)
+
+    async def _produce(parse_pool: ProcessPoolExecutor) -> None:
+        # the iterator is shared by every worker on this event loop
+        for game_pk in pending_game_pks:
+            try:
+                payload, request_url = await stats_client.get_game_feed(game_pk=game_pk)
+                feed = await loop.run_in_executor(
+                    parse_pool,
+                    _archive_and_parse_game_feed,
+                    game_pk,
+                    payload,
+                    request_url,
+                )
+                del payload
+            except Exception as exc:
+                logger.warning("MLB game feed %s failed before write: %s", game_pk, exc)
+                failed_games.append({"status": "failed", "game_pk": game_pk, "error": str(exc)})
+                feed = None
+            await parsed_queue.put(feed)
+
+    async def _write_batch(batch: list[ParsedGameFeed]) -> None:
+        try:
+            per_game_results.extend(await _write_game_feeds(db, batch))
+            return
+        except Exception as exc:
+            await db.rollback()
+            if len(batch) == 1:
+                logger.warning("MLB game feed %s failed to write: %s", batch[0].game_pk, exc)
+                failed_games.append(
+                    {"status": "failed", "game_pk": batch[0].game_pk, "error": str(exc)}
+                )
+                return
+        # Fall back to per-game writes so one bad feed does not sink the batch.
+        for feed in batch:
+            await _write_batch([feed])
+
+    async def _consume(total: int) -> None:
+        batch: list[ParsedGameFeed] = []
+        for _ in range(total):
+            feed = await parsed_queue.get()
+            if feed is not None:
+                batch.append(feed)
+            if len(batch) >= write_batch_games or (batch and parsed_queue.empty()):
+                await _write_batch(batch)
+                batch = []
+        if batch:
+            await _write_batch(batch)
+
+    if target_game_pks:
+        with ProcessPoolExecutor(
+            max_workers=max(1, parse_workers),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as parse_pool:
+            producers = [
+                asyncio.create_task(_produce(parse_pool))
+                for _ in range(min(max(1, fetch_concurrency), len(target_game_pks)))
+            ]
+            try:
+                await _consume(len(target_game_pks))
+            finally:
+                for task in producers:
+                    task.cancel()
+                await asyncio.gather(*producers, return_exceptions=True)
+
+    target_order = {game_pk: index for index, game_pk in enumerate(target_game_pks)}
+    per_game_results.sort(key=lambda item: target_order[item["game_pk"]])
     return {
         "status": "success",
         "season": season,
@@ -1539,8 +1852,10 @@ async def ingest_game_feeds(
         "scheduled_games": len(schedule_result.get("game_pks") or []),
         "target_games": len(target_game_pks),
         "games_ingested": len(per_game_results),
+        "games_failed": len(failed_games),
         "schedule": schedule_result,
         "games": per_game_results,
+        "failures": failed_games,
     }
 
 
@@ -1553,7 +1868,7 @@ async def ingest_umpire_roster(
 ) -> dict[str, Any]:
     stats_client = client or MlbStatsApiClient()
     payload, request_url = await stats_client.get_umpires(date=date_value, sport_id=sport_id)
-    raw_payload = write_json_payload("statsapi", "umpires", f"date_{date_value}", payload)
+    raw_payload = await write_json_payload_async("statsapi", "umpires", f"date_{date_value}", payload)
 
     umpire_rows = [
         row
@@ -1637,7 +1952,7 @@ async def ingest_weather_for_game(
             end_date=end_date,
         )
 
-    raw_payload = write_json_payload("open_meteo", target_dataset, f"game_{game_pk}", payload)
+    raw_payload = await write_json_payload_async("open_meteo", target_dataset, f"game_{game_pk}", payload)
     weather_rows = [
         row
         for row in _extract_weather_snapshot_rows(
@@ -1839,7 +2154,7 @@ async def ingest_savant_statcast_batters(
         minimum=minimum,
     )
     normalized = _normalize_dataframe(dataframe)
-    raw_csv = write_text_payload("savant", "custom_batter", f"season_{season}", csv_text)
+    raw_csv = await write_text_payload_async("savant", "custom_batter", f"season_{season}", csv_text)
     source_pull = await _create_source_pull(
         db,
         source="savant",
@@ -1935,7 +2250,7 @@ async def ingest_savant_statcast_pitchers(
         minimum=minimum,
     )
     normalized = _normalize_dataframe(dataframe)
-    raw_csv = write_text_payload("savant", "custom_pitcher", f"season_{season}", csv_text)
+    raw_csv = await write_text_payload_async("savant", "custom_pitcher", f"season_{season}", csv_text)
     source_pull = await _create_source_pull(
         db,
         source="savant",
@@ -2017,7 +2332,7 @@ async def ingest_savant_bat_tracking(
         min_swings=min_swings,
     )
     normalized = _normalize_dataframe(dataframe)
-    raw_csv = write_text_payload("savant", "bat_tracking", f"season_{season}", csv_text)
+    raw_csv = await write_text_payload_async("savant", "bat_tracking", f"season_{season}", csv_text)
     source_pull = await _create_source_pull(
         db,
         source="savant",
@@ -2114,7 +2429,7 @@ async def ingest_savant_swing_path(
         min_swings=min_swings,
     )
     normalized = _normalize_dataframe(dataframe)
-    raw_csv = write_text_payload("savant", "swing_path", f"season_{season}", csv_text)
+    raw_csv = await write_text_payload_async("savant", "swing_path", f"season_{season}", csv_text)
     source_pull = await _create_source_pull(
         db,
         source="savant",
@@ -2221,7 +2536,7 @@ async def ingest_savant_park_factors(
                 ],
             )
         )
-        raw_csv = write_text_payload("savant", "park_factors", f"season_{season}_{combo_slug}", csv_text)
+        raw_csv = await write_text_payload_async("savant", "park_factors", f"season_{season}_{combo_slug}", csv_text)
         source_pull = await _create_source_pull(
             db,
             source="savant",
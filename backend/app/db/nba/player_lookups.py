@@ -0,0 +1,156 @@
+from collections.abc import Iterable
+
+import pandas as pd
+from sqlalchemy import text
+
+
+# Stat type -> player_game_stats column holding the realised value.
+STAT_COLUMNS = {
+    "points": "points",
+    "assists": "assists",
+    "rebounds": "rebounds",
+    "threept": "fg3m",
+    "threepa": "fg3a",
+}
+
+
+def bind_ids(player_ids: Iterable) -> list[int]:
+    """Distinct, sorted int ids for binding as one integer[] parameter."""
+    return sorted({int(pid) for pid in player_ids if pid is not None and pd.notna(pid)})
+
+
+# Every lookup binds its id list as a single array parameter
+# (`= ANY(CAST(:player_ids AS integer[]))`), so the statement text is the same
+# for every slate instead of embedding a fresh IN (...) list each time.
+UNDER_RISK_SQL = text(
+    """
+    SELECT player_id, stat_type, under_rate, sample_size
+    FROM player_under_risk
+    WHERE stat_type = ANY(CAST(:stat_types AS text[]))
+      AND player_id = ANY(CAST(:player_ids AS integer[]))
+    """
+)
+
+RECENT_POINTS_AVG_SQL = text(
+    """
+    WITH ranked AS (
+        SELECT player_id, points, game_date,
+               ROW_NUMBER() OVER (PARTITION BY player_id ORDER BY game_date DESC) AS rn
+        FROM player_game_stats
+        WHERE player_id = ANY(CAST(:player_ids AS integer[]))
+          AND points IS NOT NULL
+          AND game_date IS NOT NULL
+    )
+    SELECT player_id, AVG(points) AS avg_points
+    FROM ranked
+    WHERE rn <= :n_games
+    GROUP BY player_id
+    """
+)
+
+# One statement text per stat (the column name can't be a bind parameter).
+PLAYER_GAMES_SQL = {
+    stat_type: text(
+        f"""
+        SELECT player_id, game_date, matchup, minutes, {column} AS stat_value
+        FROM player_game_stats
+        WHERE player_id = ANY(CAST(:player_ids AS integer[]))
+          AND game_date IS NOT NULL
+          AND {column} IS NOT NULL
+        """
+    )
+    for stat_type, column in STAT_COLUMNS.items()
+}
+
+# Under-risk profile and the full game history for a stat in one round trip.
+# Players without games come back once with null game columns; players
+# without a profile have null under-risk columns.
+PREDICTION_LOOKUPS_SQL = {
+    stat_type: text(
+        f"""
+        WITH ids AS (
+            SELECT DISTINCT unnest(CAST(:player_ids AS integer[])) AS player_id
+        ),
+        risk AS (
+            SELECT player_id, under_rate, sample_size
+            FROM player_under_risk
+            WHERE stat_type = :stat_type
+              AND player_id = ANY(CAST(:player_ids AS integer[]))
+        )
+        SELECT ids.player_id,
+               risk.under_rate AS under_risk,
+               risk.sample_size AS under_risk_n,
+               g.game_date,
+               g.matchup,
+               g.minutes,
+               g.{column} AS stat_value
+        FROM ids
+        LEFT JOIN risk ON risk.player_id = ids.player_id
+        LEFT JOIN player_game_stats g
+          ON g.player_id = ids.player_id
+         AND g.game_date IS NOT NULL
+         AND g.{column} IS NOT NULL
+        """
+    )
+    for stat_type, column in STAT_COLUMNS.items()
+}
+
+
+def fetch_under_risk_rows(engine, player_ids: Iterable, stat_types: Iterable[str]) -> pd.DataFrame:
+    ids = bind_ids(player_ids)
+    if not ids:
+        return pd.DataFrame(columns=["player_id", "stat_type", "under_rate", "sample_size"])
+    return pd.read_sql(
+        UNDER_RISK_SQL,
+        engine,
+        params={"player_ids": ids, "stat_types": list(stat_types)},
+    )
+
+
+def fetch_recent_points_avgs(engine, player_ids: Iterable, n_games: int = 10) -> dict[int, float]:
+    ids = bind_ids(player_ids)
+    if not ids:
+        return {}
+    with engine.connect() as conn:
+        rows = conn.execute(
+            RECENT_POINTS_AVG_SQL, {"player_ids": ids, "n_games": n_games}
+        ).fetchall()
+    return {int(r[0]): float(r[1]) for r in rows if r[1] is not None}
+
+
+def fetch_player_games_for_stat(engine, stat_type: str, player_ids: Iterable) -> pd.DataFrame:
+    ids = bind_ids(player_ids)
+    if stat_type not in PLAYER_GAMES_SQL or not ids:
+        return pd.DataFrame()
+    return pd.read_sql(PLAYER_GAMES_SQL[stat_type], engine, params={"player_ids": ids})
+
+
+def fetch_prediction_lookups(
+    engine, stat_type: str, player_ids: Iterable
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    (under_risk, games) for one stat from a single query: under_risk has
+    player_id / under_risk / under_risk_n, games has the player_game_stats
+    rows fetch_player_games_for_stat returns.
+    """
+    ids = bind_ids(player_ids)
+    if stat_type not in PREDICTION_LOOKUPS_SQL or not ids:
+        return (
+            pd.DataFrame(columns=["player_id", "under_risk", "under_risk_n"]),
+            pd.DataFrame(),
+        )
+    rows = pd.read_sql(
+        PREDICTION_LOOKUPS_SQL[stat_type],
+        engine,
+        params={"player_ids": ids, "stat_type": stat_type},
+    )
+    rows["player_id"] = rows["player_id"].astype("int64")
+    under_risk = rows.loc[
+        rows["under_risk"].notna() | rows["under_risk_n"].notna(),
+        ["player_id", "under_risk", "under_risk_n"],
+    ].drop_duplicates("player_id")
+    games = rows.loc[
+        rows["game_date"].notna(),
+        ["player_id", "game_date", "matchup", "minutes", "stat_value"],
+    ].reset_index(drop=True)
+    return under_risk.reset_index(drop=True), games
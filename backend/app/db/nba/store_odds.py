@@ -1,5 +1,5 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from app.models.event import Event
 from app.models.bookmaker import Bookmaker
 from app.models.market import Market
@@ -7,110 +7,138 @@ from app.models.player_prop import PlayerProp
 from datetime import datetime
 
 
+MAX_QUERY_ARGS = 32767
+QUERY_ARG_HEADROOM = 512
+
+
+def _parse_timestamp(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+# flatten the nested event/odds json into event, bookmaker, market and prop rows.
+# Markets and props are keyed by their parent's natural key until IDs are known.
+def flatten_event_odds(event_data: dict):
+    event_row = {
+        "id": event_data["id"],
+        "sport_key": event_data["sport_key"],
+        "sport_title": event_data.get("sport_title"),
+        "commence_time": _parse_timestamp(event_data["commence_time"]),
+        "home_team": event_data["home_team"],
+        "away_team": event_data["away_team"],
+    }
+
+    # dicts keyed on the natural unique key: a repeated key keeps the last value,
+    # since one upsert statement cannot touch the same row twice.
+    bookmaker_rows: dict[str, dict] = {}
+    market_rows: dict[tuple, dict] = {}
+    prop_rows: dict[tuple, dict] = {}
+
+    for b in event_data.get("bookmakers", []):
+        bookmaker_rows[b["key"]] = {
+            "event_id": event_row["id"],
+            "key": b["key"],
+            "title": b["title"],
+        }
+        for m in b.get("markets", []):
+            market_rows[(b["key"], m["key"])] = {
+                "bookmaker_key": b["key"],
+                "key": m["key"],
+                "last_update": _parse_timestamp(
+                    m.get("last_update", datetime.utcnow().isoformat())
+                ),
+            }
+            for o in m.get("outcomes", []):
+                line = o.get("point")
+                if line is None or not o.get("description"):
+                    continue
+                prop_rows[(b["key"], m["key"], o["description"], o["name"], line)] = {
+                    "bookmaker_key": b["key"],
+                    "market_key": m["key"],
+                    "player_name": o["description"],
+                    "side": o["name"],
+                    "price": o["price"],
+                    "line": line,
+                }
+
+    return (
+        event_row,
+        list(bookmaker_rows.values()),
+        list(market_rows.values()),
+        list(prop_rows.values()),
+    )
+
+
 # extract the event odds data from the json returned from the event/odds call
+# and write it with one upsert per table, keyed on natural unique keys.
 async def save_event_odds(event_data: dict, db: AsyncSession):
+    event_row, bookmaker_rows, market_rows, prop_rows = flatten_event_odds(event_data)
+
     # --- Event ---
-    # check if event exists
-    event = await db.get(Event, event_data["id"])
-    if not event:
-        event = Event(
-            id=event_data["id"],
-            sport_key=event_data["sport_key"],
-            sport_title=event_data.get("sport_title"),
-            commence_time=datetime.fromisoformat(
-                event_data["commence_time"].replace("Z", "+00:00")
-            ),
-            home_team=event_data["home_team"],
-            away_team=event_data["away_team"],
-        )
-        db.add(event)
-        await db.commit()
-        await db.refresh(event)
-    else:
-        # update existing event
-        event.sport_key = event_data["sport_key"]
-        event.sport_title = event_data.get("sport_title")
-        event.commence_time = datetime.fromisoformat(
-            event_data["commence_time"].replace("Z", "+00:00")
-        )
-        event.home_team = event_data["home_team"]
-        event.away_team = event_data["away_team"]
-        await db.commit()
-        await db.refresh(event)
+    event_stmt = insert(Event).values(event_row)
+    event_stmt = event_stmt.on_conflict_do_update(
+        index_elements=["id"],
+        set_={
+            col: getattr(event_stmt.excluded, col)
+            for col in event_row
+            if col != "id"
+        },
+    )
+    await db.execute(event_stmt)
 
     # --- Bookmakers ---
-    for b in event_data.get("bookmakers", []):
-        # check if bookmaker exists
-        stmt = select(Bookmaker).where(
-            Bookmaker.event_id == event.id, Bookmaker.key == b["key"]
-        )
-        res = await db.execute(stmt)
-        bookmaker = res.scalar_one_or_none()
-
-        if not bookmaker:
-            bookmaker = Bookmaker(
-                event_id=event.id,
-                key=b["key"],
-                title=b["title"],
-            )
-            db.add(bookmaker)
-            await db.flush()  # assign an ID without committing
-        else:
-            bookmaker.title = b["title"]
-            await db.flush()
+    bookmaker_ids: dict[str, int] = {}
+    if bookmaker_rows:
+        stmt = insert(Bookmaker).values(bookmaker_rows)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_bookmaker_event_key",
+            set_={"title": stmt.excluded.title},
+        ).returning(Bookmaker.id, Bookmaker.key)
+        result = await db.execute(stmt)
+        bookmaker_ids = {key: bookmaker_id for bookmaker_id, key in result.all()}
 
-        # --- Markets ---
-        for m in b.get("markets", []):
-            stmt = select(Market).where(
-                Market.bookmaker_id == bookmaker.id, Market.key == m["key"]
+    # --- Markets ---
+    market_ids: dict[tuple, int] = {}
+    if market_rows:
+        values = [
+            {
+                "bookmaker_id": bookmaker_ids[row["bookmaker_key"]],
+                "key": row["key"],
+                "last_update": row["last_update"],
+            }
+            for row in market_rows
+        ]
+        stmt = insert(Market).values(values)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_market_bookmaker_key",
+            set_={"last_update": stmt.excluded.last_update},
+        ).returning(Market.id, Market.bookmaker_id, Market.key)
+        result = await db.execute(stmt)
+        key_by_bookmaker_id = {v: k for k, v in bookmaker_ids.items()}
+        market_ids = {
+            (key_by_bookmaker_id[bookmaker_id], key): market_id
+            for market_id, bookmaker_id, key in result.all()
+        }
+
+    # --- Player Props ---
+    if prop_rows:
+        values = [
+            {
+                "market_id": market_ids[(row["bookmaker_key"], row["market_key"])],
+                "player_name": row["player_name"],
+                "side": row["side"],
+                "price": row["price"],
+                "line": row["line"],
+            }
+            for row in prop_rows
+        ]
+        rows_per_batch = (MAX_QUERY_ARGS - QUERY_ARG_HEADROOM) // 5
+        for start in range(0, len(values), rows_per_batch):
+            stmt = insert(PlayerProp).values(values[start : start + rows_per_batch])
+            stmt = stmt.on_conflict_do_update(
+                constraint="uq_player_prop_outcome",
+                set_={"price": stmt.excluded.price},
             )
-            res = await db.execute(stmt)
-            market = res.scalar_one_or_none()
-
-            if not market:
-                market = Market(
-                    bookmaker_id=bookmaker.id,
-                    key=m["key"],
-                    last_update=datetime.fromisoformat(
-                        m.get("last_update", datetime.utcnow().isoformat()).replace(
-                            "Z", "+00:00"
-                        )
-                    ),
-                )
-                db.add(market)
-                await db.flush()
-            else:
-                market.last_update = datetime.fromisoformat(
-                    m.get("last_update", datetime.utcnow().isoformat()).replace(
-                        "Z", "+00:00"
-                    )
-                )
-                await db.flush()
-
-            # --- Player Props ---
-            for o in m.get("outcomes", []):
-                line = o.get("point")
-                stmt = select(PlayerProp).where(
-                    PlayerProp.market_id == market.id,
-                    PlayerProp.player_name == o["description"],
-                    PlayerProp.side == o["name"],
-                    PlayerProp.line == line,
-                )
-                res = await db.execute(stmt)
-                prop = res.scalar_one_or_none()
-
-                if not prop:
-                    prop = PlayerProp(
-                        market_id=market.id,
-                        player_name=o["description"],
-                        side=o["name"],
-                        price=o["price"],
-                        line=line,
-                    )
-                    db.add(prop)
-                else:
-                    prop.price = o["price"]
-                    prop.line = line
-
-    # final commit after all children added/updated
+            await db.execute(stmt)
+
+    # single commit for the whole event
     await db.commit()
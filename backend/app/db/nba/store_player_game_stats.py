@@ -1,108 +1,196 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
-from datetime import datetime
+from sqlalchemy import select, func, text
+from sqlalchemy.dialects.postgresql import insert
+import pandas as pd
 from app.models.player import Player
 from app.models.player_game_stat import PlayerGameStat
 from app.core.constants import MAX_GAMES_PER_PLAYER
 
 
-# Save the last n games (N takes on the value of MAX_GAMES_PER_PLAYER constant)
-# If player data already exists in the db, insert only missing games
-# Remove old records until each player has MAX_GAMES_PER_PLAYER records
-async def save_last_n_games(
-    player_id: int,
-    player_name: str,
-    team_abbr: str,
-    df,
+MAX_QUERY_ARGS = 32767
+QUERY_ARG_HEADROOM = 512
+
+# nba_api PlayerGameLog column -> player_game_stats column
+GAME_LOG_COLUMNS = {
+    "Game_ID": "game_id",
+    "GAME_DATE": "game_date",
+    "MATCHUP": "matchup",
+    "MIN": "minutes",
+    "PTS": "points",
+    "AST": "assists",
+    "REB": "rebounds",
+    "STL": "steals",
+    "BLK": "blocks",
+    "TOV": "turnovers",
+    "FGM": "fgm",
+    "FGA": "fga",
+    "FG3M": "fg3m",
+    "FG3A": "fg3a",
+}
+SHOOTING_COLUMNS = ["fgm", "fga", "fg3m", "fg3a"]
+
+
+def _game_log_frame(player_id: int, df) -> pd.DataFrame:
+    frame = pd.DataFrame(
+        {
+            target: df[source] if source in df.columns else None
+            for source, target in GAME_LOG_COLUMNS.items()
+        },
+        index=df.index,
+    )
+    frame.insert(0, "player_id", int(player_id))
+    frame["game_id"] = frame["game_id"].astype(str)
+    # Column-wise date parse instead of strptime per row.
+    frame["game_date"] = pd.to_datetime(
+        frame["game_date"], format="%b %d, %Y"
+    ).dt.date
+    return frame
+
+
+# Save the last n games for many players at once (N takes on the value of
+# MAX_GAMES_PER_PLAYER). Incoming rows are diffed against existing rows on
+# (player_id, game_id) in pandas; new games and missing shooting fields are
+# written with one INSERT ... ON CONFLICT DO UPDATE per batch.
+# Returns {player_id: inserted + updated}.
+async def save_last_n_games_many(
+    entries: list[dict],
     db: AsyncSession,
-):
-    # Ensure player exists
-    player = await db.get(Player, player_id)
-    if not player:
-        player = Player(
-            id=player_id,
-            full_name=player_name,
-            team_abbreviation=team_abbr,
-        )
-        db.add(player)
-        await db.flush()
-    elif team_abbr and player.team_abbreviation != team_abbr:
-        player.team_abbreviation = team_abbr
-
-    # Normalize API dates
-    df["GAME_DATE"] = df["GAME_DATE"].apply(
-        lambda d: datetime.strptime(d, "%b %d, %Y").date()
+) -> dict[int, int]:
+    entries = [e for e in entries if e.get("df") is not None and not e["df"].empty]
+    if not entries:
+        return {}
+
+    player_rows = {
+        int(e["player_id"]): {
+            "id": int(e["player_id"]),
+            "full_name": e["player_name"],
+            "team_abbreviation": e.get("team_abbr") or None,
+        }
+        for e in entries
+    }
+    player_stmt = insert(Player).values(list(player_rows.values()))
+    player_stmt = player_stmt.on_conflict_do_update(
+        index_elements=["id"],
+        set_={
+            "team_abbreviation": func.coalesce(
+                player_stmt.excluded.team_abbreviation,
+                Player.team_abbreviation,
+            )
+        },
     )
+    await db.execute(player_stmt)
+
+    incoming = pd.concat(
+        [_game_log_frame(e["player_id"], e["df"]) for e in entries],
+        ignore_index=True,
+    ).drop_duplicates(subset=["player_id", "game_id"], keep="first")
 
-    # Load existing games for update checks
-    existing_rows_result = await db.execute(
-        select(PlayerGameStat).where(PlayerGameStat.player_id == player_id)
+    player_ids = list(player_rows)
+    existing_result = await db.execute(
+        select(
+            PlayerGameStat.player_id,
+            PlayerGameStat.game_id,
+            *[getattr(PlayerGameStat, col) for col in SHOOTING_COLUMNS],
+        ).where(PlayerGameStat.player_id.in_(player_ids))
+    )
+    existing = pd.DataFrame(
+        existing_result.all(),
+        columns=["player_id", "game_id", *SHOOTING_COLUMNS],
     )
-    existing_rows = {row[0].game_id: row[0] for row in existing_rows_result.all()}
 
-    if df.empty:
-        return 0  # nothing to process
+    merged = incoming.merge(
+        existing,
+        on=["player_id", "game_id"],
+        how="left",
+        suffixes=("", "_existing"),
+        indicator=True,
+    )
+    is_new = merged["_merge"] == "left_only"
+    fills_missing = pd.Series(False, index=merged.index)
+    for col in SHOOTING_COLUMNS:
+        fills_missing |= merged[col].notna() & merged[f"{col}_existing"].isna()
+    changed = merged[is_new | (~is_new & fills_missing)]
 
-    inserted = 0
-    updated = 0
-    # Insert new games or update missing shooting fields
-    for _, row in df.iterrows():
-        game_id = row["Game_ID"]
-        existing = existing_rows.get(game_id)
-        if existing:
-            has_updates = False
-            for col, key in [
-                ("fgm", "FGM"),
-                ("fga", "FGA"),
-                ("fg3m", "FG3M"),
-                ("fg3a", "FG3A"),
-            ]:
-                value = row.get(key)
-                if value is not None and getattr(existing, col) is None:
-                    setattr(existing, col, value)
-                    has_updates = True
-            if has_updates:
-                updated += 1
-            continue
-
-        db.add(
-            PlayerGameStat(
-                player_id=player_id,
-                game_id=game_id,
-                game_date=row["GAME_DATE"],
-                matchup=row["MATCHUP"],
-                minutes=row["MIN"],
-                points=row["PTS"],
-                assists=row["AST"],
-                rebounds=row["REB"],
-                steals=row["STL"],
-                blocks=row["BLK"],
-                turnovers=row["TOV"],
-                fgm=row.get("FGM"),
-                fga=row.get("FGA"),
-                fg3m=row.get("FG3M"),
-                fg3a=row.get("FG3A"),
-            )
+    if not changed.empty:
+        write_columns = ["player_id", *GAME_LOG_COLUMNS.values()]
+        write_frame = changed[write_columns].astype(object)
+        write_rows = write_frame.where(write_frame.notna(), None).to_dict(
+            orient="records"
+        )
+        rows_per_batch = max(
+            1, (MAX_QUERY_ARGS - QUERY_ARG_HEADROOM) // len(write_columns)
         )
-        inserted += 1
+        for start in range(0, len(write_rows), rows_per_batch):
+            stmt = insert(PlayerGameStat).values(
+                write_rows[start : start + rows_per_batch]
+            )
+            # Existing games only gain shooting columns that are still NULL.
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["player_id", "game_id"],
+                set_={
+                    col: func.coalesce(
+                        getattr(PlayerGameStat, col),
+                        getattr(stmt.excluded, col),
+                    )
+                    for col in SHOOTING_COLUMNS
+                },
+            )
+            await db.execute(stmt)
 
     await db.commit()
 
-    # Enforce rolling window (keep newest N and delete old)
+    # Enforce rolling window (keep newest N per player and delete old)
     if MAX_GAMES_PER_PLAYER and MAX_GAMES_PER_PLAYER > 0:
         await db.execute(
-            delete(PlayerGameStat)
-            .where(PlayerGameStat.player_id == player_id)
-            .where(
-                PlayerGameStat.game_id.notin_(
-                    select(PlayerGameStat.game_id)
-                    .where(PlayerGameStat.player_id == player_id)
-                    .order_by(PlayerGameStat.game_date.desc())
-                    .limit(MAX_GAMES_PER_PLAYER)
+            text(
+                """
+                DELETE FROM player_game_stats
+                WHERE id IN (
+                    SELECT id
+                    FROM (
+                        SELECT id,
+                               ROW_NUMBER() OVER (
+                                   PARTITION BY player_id
+                                   ORDER BY game_date DESC
+                               ) AS rn
+                        FROM player_game_stats
+                        WHERE player_id = ANY(:player_ids)
+                    ) ranked
+                    WHERE rn > :max_games
                 )
-            )
+                """
+            ),
+            {"player_ids": player_ids, "max_games": MAX_GAMES_PER_PLAYER},
         )
 
         await db.commit()
 
-    return inserted + updated
+    counts = changed.groupby("player_id").size()
+    return {pid: int(counts.get(pid, 0)) for pid in player_ids}
+
+
+# Save the last n games (N takes on the value of MAX_GAMES_PER_PLAYER constant)
+# If player data already exists in the db, insert only missing games
+# Remove old records until each player has MAX_GAMES_PER_PLAYER records
+async def save_last_n_games(
+    player_id: int,
+    player_name: str,
+    team_abbr: str,
+    df,
+    db: AsyncSession,
+):
+    if df is None or df.empty:
+        return 0  # nothing to process
+
+    counts = await save_last_n_games_many(
+        [
+            {
+                "player_id": player_id,
+                "player_name": player_name,
+                "team_abbr": team_abbr,
+                "df": df,
+            }
+        ],
+        db,
+    )
+    return counts.get(int(player_id), 0)
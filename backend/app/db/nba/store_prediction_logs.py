@@ -114,38 +114,64 @@ def log_predictions(
     return inserted
 
 
-def update_prediction_actuals(engine, stat_type: str):
-    stat_column = {
-        "points": "points",
-        "assists": "assists",
-        "rebounds": "rebounds",
-        "minutes": "minutes",
-        "threept": "fg3m",
-        "threepa": "fg3a",
-    }.get(stat_type)
-
-    if not stat_column:
-        raise ValueError(
-            "stat_type must be one of: points, assists, rebounds, minutes, threept, threepa"
-        )
+STAT_ACTUAL_COLUMNS = {
+    "points": "points",
+    "assists": "assists",
+    "rebounds": "rebounds",
+    "minutes": "minutes",
+    "threept": "fg3m",
+    "threepa": "fg3a",
+}
+
+
+def update_prediction_actuals_all(engine, stat_types: list[str] | None = None):
+    """
+    Fill actual_value/abs_error for every requested stat type in a single
+    UPDATE ... FROM player_game_stats. Returns rows updated per stat type.
+    """
+    stat_types = list(stat_types or STAT_ACTUAL_COLUMNS)
+    for stat_type in stat_types:
+        if stat_type not in STAT_ACTUAL_COLUMNS:
+            raise ValueError(
+                "stat_type must be one of: points, assists, rebounds, minutes, threept, threepa"
+            )
+
+    # Column names come from STAT_ACTUAL_COLUMNS, never from user input.
+    whens = " ".join(
+        f"WHEN '{stat_type}' THEN pgs.{STAT_ACTUAL_COLUMNS[stat_type]}"
+        for stat_type in stat_types
+    )
+    actual_expr = f"(CASE pl.stat_type {whens} END)"
 
     with engine.begin() as conn:
         result = conn.execute(
             text(
                 f"""
-                UPDATE prediction_logs pl
-                SET actual_value = pgs.{stat_column},
-                    abs_error = ABS(pgs.{stat_column} - pl.pred_value)
-                FROM player_game_stats pgs
-                WHERE pl.actual_value IS NULL
-                  AND pl.stat_type = :stat_type
-                  AND pl.player_id = pgs.player_id
-                  AND pl.game_id = pgs.game_id
+                WITH updated AS (
+                    UPDATE prediction_logs pl
+                    SET actual_value = {actual_expr},
+                        abs_error = ABS({actual_expr} - pl.pred_value)
+                    FROM player_game_stats pgs
+                    WHERE pl.actual_value IS NULL
+                      AND pl.stat_type = ANY(:stat_types)
+                      AND pl.player_id = pgs.player_id
+                      AND pl.game_id = pgs.game_id
+                    RETURNING pl.stat_type
+                )
+                SELECT stat_type, COUNT(*) AS rows_updated
+                FROM updated
+                GROUP BY stat_type
                 """
             ),
-            {"stat_type": stat_type},
+            {"stat_types": stat_types},
         )
-        return result.rowcount
+        counts = {row.stat_type: int(row.rows_updated) for row in result}
+
+    return {stat_type: counts.get(stat_type, 0) for stat_type in stat_types}
+
+
+def update_prediction_actuals(engine, stat_type: str):
+    return update_prediction_actuals_all(engine, [stat_type])[stat_type]
 
 
 def delete_walkforward_logs(engine, stat_type: str):
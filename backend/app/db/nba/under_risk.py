@@ -4,82 +4,78 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 
 STAT_TYPES = {"points", "assists", "rebounds", "threept", "threepa"}
+UNDER_RISK_STAT_ORDER = ["points", "assists", "rebounds", "threept", "threepa"]
 
 
 def _threshold_type_for_stat(stat_type: str) -> str:
     return "midpoint" if stat_type == "points" else "pred_p10"
 
 
-async def compute_under_risk(
-    db: AsyncSession,
-    stat_type: str,
-    window_n: int = 20,
-):
-    if stat_type not in STAT_TYPES:
-        raise ValueError(
-            "stat_type must be one of: points, assists, rebounds, threept, threepa"
-        )
-
-    threshold_type = _threshold_type_for_stat(stat_type)
-
-    result = await db.execute(
-        text(
-            """
-            WITH ranked AS (
-                SELECT player_id, game_date, actual_value, pred_value, pred_p10,
-                       ROW_NUMBER() OVER (PARTITION BY player_id ORDER BY game_date DESC) AS rn
-                FROM prediction_logs
-                WHERE stat_type = :stat_type
-                  AND actual_value IS NOT NULL
-                  AND game_date IS NOT NULL
-                  AND (
-                        (:threshold_type = 'midpoint' AND pred_value IS NOT NULL AND pred_p10 IS NOT NULL)
-                     OR (:threshold_type = 'pred_p10' AND pred_p10 IS NOT NULL)
-                  )
-            ),
-            windowed AS (
-                SELECT *
-                FROM ranked
-                WHERE rn <= :window_n
+def _validate_stat_types(stat_types: list[str]) -> None:
+    for stat_type in stat_types:
+        if stat_type not in STAT_TYPES:
+            raise ValueError(
+                "stat_type must be one of: points, assists, rebounds, threept, threepa"
             )
-            SELECT player_id,
-                   COUNT(*) AS sample_size,
-                   SUM(
-                       CASE
-                           WHEN actual_value < (
-                               CASE
-                                   WHEN :threshold_type = 'midpoint' THEN (pred_p10 + pred_value) / 2.0
-                                   ELSE pred_p10
-                               END
-                           ) THEN 1
-                           ELSE 0
-                       END
-                   ) AS under_count,
-                   MAX(game_date) AS as_of_date
-            FROM windowed
-            GROUP BY player_id
-            """
-        ),
-        {
-            "stat_type": stat_type,
-            "window_n": window_n,
-            "threshold_type": threshold_type,
-        },
-    )
 
-    rows = result.mappings().all()
-    if not rows:
-        return {"status": "no_data", "stat_type": stat_type, "window_n": window_n}
 
-    computed_at = datetime.utcnow()
-    upsert_stmt = text(
-        """
+# Windowing, threshold selection, under-rate math and the upsert all run in a
+# single statement; the outer SELECT reports how many players each stat touched.
+UNDER_RISK_UPSERT_SQL = text(
+    """
+    WITH thresholds AS (
+        SELECT t.stat_type, t.threshold_type
+        FROM unnest(
+            CAST(:stat_types AS text[]),
+            CAST(:threshold_types AS text[])
+        ) AS t(stat_type, threshold_type)
+    ),
+    ranked AS (
+        SELECT pl.player_id,
+               pl.stat_type,
+               t.threshold_type,
+               pl.game_date,
+               pl.actual_value,
+               CASE
+                   WHEN t.threshold_type = 'midpoint' THEN (pl.pred_p10 + pl.pred_value) / 2.0
+                   ELSE pl.pred_p10
+               END AS threshold,
+               ROW_NUMBER() OVER (
+                   PARTITION BY pl.player_id, pl.stat_type
+                   ORDER BY pl.game_date DESC
+               ) AS rn
+        FROM prediction_logs pl
+        JOIN thresholds t ON t.stat_type = pl.stat_type
+        WHERE pl.actual_value IS NOT NULL
+          AND pl.game_date IS NOT NULL
+          AND pl.pred_p10 IS NOT NULL
+          AND (t.threshold_type <> 'midpoint' OR pl.pred_value IS NOT NULL)
+    ),
+    aggregated AS (
+        SELECT player_id,
+               stat_type,
+               threshold_type,
+               COUNT(*) AS sample_size,
+               SUM(CASE WHEN actual_value < threshold THEN 1 ELSE 0 END) AS under_count,
+               MAX(game_date) AS as_of_date
+        FROM ranked
+        WHERE rn <= :window_n
+        GROUP BY player_id, stat_type, threshold_type
+    ),
+    upserted AS (
         INSERT INTO player_under_risk
         (player_id, stat_type, window_n, sample_size, under_count, under_rate,
          threshold_type, as_of_date, computed_at)
-        VALUES
-        (:player_id, :stat_type, :window_n, :sample_size, :under_count, :under_rate,
-         :threshold_type, :as_of_date, :computed_at)
+        SELECT player_id,
+               stat_type,
+               CAST(:window_n AS integer),
+               sample_size,
+               under_count,
+               CAST(under_count AS double precision) / sample_size,
+               threshold_type,
+               as_of_date,
+               CAST(:computed_at AS timestamp)
+        FROM aggregated
         ON CONFLICT (player_id, stat_type)
         DO UPDATE SET
           window_n = EXCLUDED.window_n,
@@ -89,36 +85,76 @@ async def compute_under_risk(
           threshold_type = EXCLUDED.threshold_type,
           as_of_date = EXCLUDED.as_of_date,
           computed_at = EXCLUDED.computed_at
-        """
+        RETURNING stat_type
     )
+    SELECT stat_type, COUNT(*) AS players_updated
+    FROM upserted
+    GROUP BY stat_type
+    """
+)
 
-    saved = 0
-    for row in rows:
-        sample_size = int(row["sample_size"])
-        under_count = int(row["under_count"] or 0)
-        under_rate = float(under_count) / float(sample_size) if sample_size else 0.0
-        await db.execute(
-            upsert_stmt,
-            {
-                "player_id": int(row["player_id"]),
-                "stat_type": stat_type,
-                "window_n": window_n,
-                "sample_size": sample_size,
-                "under_count": under_count,
-                "under_rate": under_rate,
-                "threshold_type": threshold_type,
-                "as_of_date": row["as_of_date"],
-                "computed_at": computed_at,
-            },
-        )
-        saved += 1
 
-    await db.commit()
+async def _upsert_under_risk(
+    db: AsyncSession,
+    stat_types: list[str],
+    window_n: int,
+) -> dict[str, int]:
+    result = await db.execute(
+        UNDER_RISK_UPSERT_SQL,
+        {
+            "stat_types": stat_types,
+            "threshold_types": [_threshold_type_for_stat(s) for s in stat_types],
+            "window_n": window_n,
+            "computed_at": datetime.utcnow(),
+        },
+    )
+    return {
+        row["stat_type"]: int(row["players_updated"])
+        for row in result.mappings().all()
+    }
 
+
+def _under_risk_result(stat_type: str, window_n: int, saved: int) -> dict:
+    if not saved:
+        return {"status": "no_data", "stat_type": stat_type, "window_n": window_n}
     return {
         "status": "completed",
         "stat_type": stat_type,
         "window_n": window_n,
         "players_updated": saved,
-        "threshold_type": threshold_type,
+        "threshold_type": _threshold_type_for_stat(stat_type),
+    }
+
+
+async def compute_under_risk(
+    db: AsyncSession,
+    stat_type: str,
+    window_n: int = 20,
+):
+    _validate_stat_types([stat_type])
+
+    counts = await _upsert_under_risk(db, [stat_type], window_n)
+    await db.commit()
+
+    return _under_risk_result(stat_type, window_n, counts.get(stat_type, 0))
+
+
+async def compute_under_risk_all(
+    db: AsyncSession,
+    window_n: int = 20,
+    stat_types: list[str] | None = None,
+):
+    """
+    Recalculate under-risk for several stat types in one INSERT ... SELECT.
+    Returns per-stat results in the same shape as compute_under_risk.
+    """
+    stat_types = list(stat_types or UNDER_RISK_STAT_ORDER)
+    _validate_stat_types(stat_types)
+
+    counts = await _upsert_under_risk(db, stat_types, window_n)
+    await db.commit()
+
+    return {
+        stat_type: _under_risk_result(stat_type, window_n, counts.get(stat_type, 0))
+        for stat_type in stat_types
     }
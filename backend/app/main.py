@@ -31,6 +31,8 @@ from app.api.mlb import (
 )
 from app.db.base import Base
 from app.db.session import engine
+from app.services.cache import CACHE
+from app.services.http_client import http_clients
 
 import logging
 
@@ -71,6 +73,15 @@ app.include_router(mlb_predictions.router, prefix="/mlb/predictions", tags=["MLB
 app.include_router(mlb_odds.router, prefix="/mlb/odds", tags=["MLB"])
 app.include_router(mlb_db_routes.router, prefix="/mlb/db", tags=["MLB"])
 app.include_router(mlb_simulation.router, prefix="/mlb/simulation", tags=["MLB"])
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    await http_clients.close()
+    CACHE.close()
+    db_routes.nba_ingest_worker.shutdown()
+
+
 # @app.on_event("startup")
 # async def startup():
 #     async with engine.begin() as conn:
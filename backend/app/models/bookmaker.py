@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Text, ForeignKey
+from sqlalchemy import Column, Integer, Text, ForeignKey, UniqueConstraint
 from app.db.base import Base
 
 
@@ -10,3 +10,7 @@ class Bookmaker(Base):
 
     key = Column(Text, nullable=False)  # fanduel
     title = Column(Text, nullable=False)  # FanDuel
+
+    __table_args__ = (
+        UniqueConstraint("event_id", "key", name="uq_bookmaker_event_key"),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Text, TIMESTAMP, ForeignKey
+from sqlalchemy import Column, Integer, Text, TIMESTAMP, ForeignKey, UniqueConstraint
 from app.db.base import Base
 
 
@@ -10,3 +10,7 @@ class Market(Base):
 
     key = Column(Text, nullable=False)  # player_points
     last_update = Column(TIMESTAMP(timezone=True), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("bookmaker_id", "key", name="uq_market_bookmaker_key"),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Text, Float, ForeignKey
+from sqlalchemy import Column, Integer, Text, Float, ForeignKey, UniqueConstraint
 from app.db.base import Base
 
 
@@ -13,3 +13,9 @@ class PlayerProp(Base):
 
     price = Column(Float, nullable=False)
     line = Column(Float, nullable=False)  # points line (22.5 etc)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "market_id", "player_name", "side", "line", name="uq_player_prop_outcome"
+        ),
+    )
@@ -6,10 +6,11 @@ import re
 from io import StringIO
 from typing import Any
 
-import httpx
 import pandas as pd
 from pandas.errors import ParserError
 
+from app.services.http_client import HttpClientManager, http_clients
+
 
 logger = logging.getLogger(__name__)
 
@@ -45,8 +46,9 @@ PITCHER_CUSTOM_SELECTIONS = [
 
 
 class BaseballSavantClient:
-    def __init__(self, timeout: float = 60.0):
+    def __init__(self, timeout: float = 60.0, http: HttpClientManager | None = None):
         self.timeout = timeout
+        self.http = http or http_clients
         self.base_url = "https://baseballsavant.mlb.com"
 
     @staticmethod
@@ -66,11 +68,12 @@ class BaseballSavantClient:
         url = f"{self.base_url}/{path.lstrip('/')}"
         cleaned_params = self._clean_params(params or {})
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(url, params=cleaned_params)
-            response.raise_for_status()
-            logger.info("Baseball Savant GET %s params=%s", url, cleaned_params)
-            return response.text, str(response.request.url)
+        response = await self.http.get(
+            url, params=cleaned_params, timeout=self.timeout, cache=True
+        )
+        response.raise_for_status()
+        logger.info("Baseball Savant GET %s params=%s", url, cleaned_params)
+        return response.text, str(response.request.url)
 
     async def _fetch_csv(
         self,
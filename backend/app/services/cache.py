@@ -1,94 +1,642 @@
+import asyncio
 import time
 import functools
 import inspect
-import hashlib
-import json
 import logging
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime
+from enum import Enum
+
+from app.core.config import settings
 
 logger = logging.getLogger("cache")
 
+# Global bounds; per-namespace bounds can be tighter (see cached()).
+DEFAULT_MAX_ENTRIES = 4096
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+SWEEP_INTERVAL_SECONDS = 60
+
+# Background stale-while-revalidate refreshes for sync functions.
+REFRESH_WORKERS = 4
+
+# How far _estimate_size walks into containers before extrapolating.
+SIZE_SAMPLE_ITEMS = 64
+SIZE_MAX_DEPTH = 3
+
+
+def _estimate_size(value, depth: int = 0) -> int:
+    """Approximate in-memory footprint of a cached value, in bytes."""
+    try:
+        memory_usage = getattr(value, "memory_usage", None)
+        if callable(memory_usage):
+            # pandas DataFrame / Series
+            usage = memory_usage(deep=True)
+            return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+        nbytes = getattr(value, "nbytes", None)
+        if isinstance(nbytes, int):
+            return nbytes
+
+        size = sys.getsizeof(value)
+        if depth >= SIZE_MAX_DEPTH or isinstance(value, (str, bytes, bytearray)):
+            return size
+
+        if isinstance(value, dict):
+            items = list(value.items())
+            sample = items[:SIZE_SAMPLE_ITEMS]
+            child = sum(
+                _estimate_size(k, depth + 1) + _estimate_size(v, depth + 1)
+                for k, v in sample
+            )
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            items = list(value)
+            sample = items[:SIZE_SAMPLE_ITEMS]
+            child = sum(_estimate_size(v, depth + 1) for v in sample)
+        elif hasattr(type(value), "__slots__"):
+            # slots dataclasses: size the field values
+            items = [getattr(value, name, None) for name in type(value).__slots__]
+            sample = items
+            child = sum(_estimate_size(v, depth + 1) for v in sample)
+        else:
+            return size
+
+        if sample:
+            child = child * len(items) // len(sample)
+        return size + child
+    except Exception:
+        return sys.getsizeof(value, 0)
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    value: object
+    expires_at: float
+    stale_until: float
+    size: int
+    namespace: str
+
+
+@dataclass(slots=True)
+class _NamespaceState:
+    keys: OrderedDict
+    size_bytes: int = 0
+    max_entries: int | None = None
+    max_bytes: int | None = None
+
 
 # cache utility
 class SimpleTTLCache:
-    def __init__(self):
-        self._store = {}
+    """
+    Thread-safe TTL cache with LRU eviction.
+
+    Bounded globally by entry count and approximate bytes, and optionally per
+    namespace (one namespace per @cached function by default). Expired entries
+    are dropped on read and by a background sweep thread.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        sweep_interval_seconds: float | None = SWEEP_INTERVAL_SECONDS,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._store: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._namespaces: dict[str, _NamespaceState] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "expired": 0,
+            "evictions": 0,
+            "rejected": 0,
+        }
+        self._sweep_interval = sweep_interval_seconds
+        self._sweeper: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    def _namespace(self, name: str) -> _NamespaceState:
+        state = self._namespaces.get(name)
+        if state is None:
+            state = _NamespaceState(keys=OrderedDict())
+            self._namespaces[name] = state
+        return state
+
+    def _remove(self, key: str) -> _CacheEntry | None:
+        entry = self._store.pop(key, None)
+        if entry is None:
+            return None
+        self._bytes -= entry.size
+        state = self._namespaces.get(entry.namespace)
+        if state is not None:
+            state.keys.pop(key, None)
+            state.size_bytes -= entry.size
+        return entry
+
+    def _evict(self, state: _NamespaceState) -> None:
+        while state.keys and (
+            (state.max_entries is not None and len(state.keys) > state.max_entries)
+            or (state.max_bytes is not None and state.size_bytes > state.max_bytes)
+        ):
+            self._remove(next(iter(state.keys)))
+            self._stats["evictions"] += 1
+        while self._store and (
+            len(self._store) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            self._remove(next(iter(self._store)))
+            self._stats["evictions"] += 1
+
+    # set limits for one namespace (None leaves only the global bound)
+    def configure_namespace(
+        self,
+        namespace: str,
+        *,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+    ):
+        with self._lock:
+            state = self._namespace(namespace)
+            state.max_entries = max_entries
+            state.max_bytes = max_bytes
+            self._evict(state)
 
     # return the cached value if exists
     def get(self, key):
-        item = self._store.get(key)
-        if not item:
-            return None
+        found = self.get_entry(key, allow_stale=False)
+        return None if found is None else found[0]
 
-        value, expires_at = item
-        if time.time() > expires_at:
-            self._store.pop(key, None)
-            return None
+    # return (value, is_fresh); stale values only while inside their stale window
+    def get_entry(self, key, allow_stale: bool = True):
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
 
-        return value
+            now = time.time()
+            fresh = now <= entry.expires_at
+            if not fresh and (not allow_stale or now > entry.stale_until):
+                if now > entry.stale_until:
+                    self._remove(key)
+                    self._stats["expired"] += 1
+                self._stats["misses"] += 1
+                return None
+
+            self._store.move_to_end(key)
+            self._namespaces[entry.namespace].keys.move_to_end(key)
+            self._stats["hits" if fresh else "stale_hits"] += 1
+            return entry.value, fresh
+
+    # set value in cache with a ttl (kept stale_ttl_seconds longer for get_entry)
+    def set(
+        self,
+        key,
+        value,
+        ttl_seconds: int,
+        namespace: str = "default",
+        stale_ttl_seconds: int = 0,
+    ):
+        size = _estimate_size(value)
+        with self._lock:
+            self._remove(key)
+            state = self._namespace(namespace)
+            limit = min(
+                self.max_bytes,
+                state.max_bytes if state.max_bytes is not None else self.max_bytes,
+            )
+            if size > limit:
+                self._stats["rejected"] += 1
+                logger.warning(
+                    f"[CACHE REJECT] {namespace}: value of ~{size} bytes exceeds limit {limit}"
+                )
+                return
+
+            expires_at = time.time() + ttl_seconds
+            self._store[key] = _CacheEntry(
+                value,
+                expires_at,
+                expires_at + stale_ttl_seconds,
+                size,
+                namespace,
+            )
+            state.keys[key] = None
+            state.size_bytes += size
+            self._bytes += size
+            self._evict(state)
+        self._ensure_sweeper()
 
-    # set value in cache with a ttl
-    def set(self, key, value, ttl_seconds: int):
-        self._store[key] = (value, time.time() + ttl_seconds)
+    # drop one key
+    def delete(self, key):
+        with self._lock:
+            self._remove(key)
+
+    # drop every expired entry; returns how many were removed
+    def sweep(self) -> int:
+        now = time.time()
+        with self._lock:
+            expired = [key for key, entry in self._store.items() if now > entry.stale_until]
+            for key in expired:
+                self._remove(key)
+            self._stats["expired"] += len(expired)
+        return len(expired)
 
     # clear all cached items
     def clear(self):
-        self._store.clear()
+        with self._lock:
+            self._store.clear()
+            self._bytes = 0
+            for state in self._namespaces.values():
+                state.keys.clear()
+                state.size_bytes = 0
+
+    # hit/miss/eviction counters plus current occupancy
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                **self._stats,
+                "entries": len(self._store),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "namespaces": {
+                    name: {
+                        "entries": len(state.keys),
+                        "bytes": state.size_bytes,
+                        "max_entries": state.max_entries,
+                        "max_bytes": state.max_bytes,
+                    }
+                    for name, state in self._namespaces.items()
+                    if state.keys
+                },
+            }
+
+    def _ensure_sweeper(self):
+        if not self._sweep_interval or self._sweeper is not None:
+            return
+        with self._lock:
+            if self._sweeper is not None:
+                return
+            self._sweeper = threading.Thread(
+                target=self._sweep_loop,
+                name="cache-sweeper",
+                daemon=True,
+            )
+            self._sweeper.start()
+
+    def _sweep_loop(self):
+        while not self._stop.wait(self._sweep_interval):
+            try:
+                removed = self.sweep()
+                if removed:
+                    logger.debug(f"[CACHE SWEEP] removed {removed} expired entries")
+            except Exception:
+                logger.exception("[CACHE SWEEP] failed")
+
+    # stop the background sweep thread
+    def close(self):
+        self._stop.set()
+        sweeper = self._sweeper
+        if sweeper is not None:
+            sweeper.join(timeout=1)
+        self._sweeper = None
+
+
+class TieredCache:
+    """
+    SimpleTTLCache in front of a shared store (e.g. SQLiteCacheBackend) so
+    several worker processes share one warm cache. Reads try the local LRU
+    first and promote shared hits into it; writes go to both.
+
+    The shared store needs get_record(key) -> (value, expires_at, stale_until,
+    namespace) | None, plus set / delete / sweep / clear / stats / close.
+    """
+
+    def __init__(self, local: SimpleTTLCache, shared, sweep_interval_seconds: float = SWEEP_INTERVAL_SECONDS):
+        self.local = local
+        self.shared = shared
+        self._sweep_interval = sweep_interval_seconds
+        self._last_shared_sweep = time.time()
+
+    def configure_namespace(self, namespace: str, **limits):
+        self.local.configure_namespace(namespace, **limits)
+
+    def get(self, key):
+        found = self.get_entry(key, allow_stale=False)
+        return None if found is None else found[0]
+
+    def get_entry(self, key, allow_stale: bool = True):
+        found = self.local.get_entry(key, allow_stale=allow_stale)
+        if found is not None:
+            return found
+
+        record = self.shared.get_record(key)
+        if record is None:
+            return None
+        value, expires_at, stale_until, namespace = record
+        now = time.time()
+        fresh = now <= expires_at
+        if not fresh and not allow_stale:
+            return None
+        self.local.set(
+            key,
+            value,
+            expires_at - now,
+            namespace=namespace,
+            stale_ttl_seconds=stale_until - expires_at,
+        )
+        return value, fresh
+
+    def set(self, key, value, ttl_seconds: int, namespace: str = "default", stale_ttl_seconds: int = 0):
+        self.local.set(key, value, ttl_seconds, namespace=namespace, stale_ttl_seconds=stale_ttl_seconds)
+        self.shared.set(key, value, ttl_seconds, namespace=namespace, stale_ttl_seconds=stale_ttl_seconds)
+        if time.time() - self._last_shared_sweep > self._sweep_interval:
+            self._last_shared_sweep = time.time()
+            self.shared.sweep()
+
+    def delete(self, key):
+        self.local.delete(key)
+        self.shared.delete(key)
+
+    def sweep(self) -> int:
+        return self.local.sweep() + self.shared.sweep()
+
+    def clear(self):
+        self.local.clear()
+        self.shared.clear()
+
+    def stats(self) -> dict:
+        return {**self.local.stats(), "shared": self.shared.stats()}
+
+    def close(self):
+        self.local.close()
+        self.shared.close()
+
+
+def _build_cache():
+    if settings.CACHE_BACKEND == "memory":
+        return SimpleTTLCache()
+    if settings.CACHE_BACKEND == "sqlite":
+        from app.services.shared_cache import DEFAULT_SHARED_CACHE_PATH, SQLiteCacheBackend
+
+        return TieredCache(
+            SimpleTTLCache(),
+            SQLiteCacheBackend(settings.SHARED_CACHE_PATH or DEFAULT_SHARED_CACHE_PATH),
+        )
+    raise ValueError(f"Unknown CACHE_BACKEND: {settings.CACHE_BACKEND}")
 
 
 # global instance cache (shared)
-CACHE = SimpleTTLCache()
+CACHE = _build_cache()
 
 
 # Helper functions
+# Argument types hashed as-is by make_cache_key. bool and float are left out
+# so that 1, 1.0 and True stay distinct keys (they compare equal in tuples).
+_PLAIN_KEY_TYPES = frozenset({str, int, type(None)})
+
+
+@functools.lru_cache(maxsize=None)
+def _func_key_info(func) -> tuple[str, bool]:
+    """(qualified-name prefix, whether args[0] is self/cls) for a cached function."""
+    prefix = f"{func.__module__}.{func.__qualname__}"
+    try:
+        params = list(inspect.signature(func).parameters)
+    except (TypeError, ValueError):
+        params = []
+    is_method = "." in func.__qualname__ and bool(params) and params[0] in ("self", "cls")
+    return prefix, is_method
+
+
+def _normalize_key_part(value):
+    """Structural, hashable form of an argument for use in a cache key."""
+    if type(value) in _PLAIN_KEY_TYPES:
+        return value
+    if isinstance(value, (bool, float)):
+        return (type(value).__name__, value)
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(_normalize_key_part(v) for v in value))
+    if isinstance(value, dict):
+        return (
+            "dict",
+            tuple(
+                sorted(
+                    ((repr(k), _normalize_key_part(v)) for k, v in value.items()),
+                    key=lambda item: item[0],
+                )
+            ),
+        )
+    if isinstance(value, (set, frozenset)):
+        return ("set", tuple(sorted(repr(_normalize_key_part(v)) for v in value)))
+    if isinstance(value, (datetime, date)):
+        return (type(value).__name__, value.isoformat())
+    if isinstance(value, Enum):
+        return (type(value).__name__, _normalize_key_part(value.value))
+    return (type(value).__name__, str(value))
+
+
 # make a unique cache key
 def make_cache_key(func, args, kwargs):
     """
-    Generate a deterministic cache key based on:
-    - function module + name
-    - args and kwargs
+    Generate a deterministic, hashable cache key based on:
+    - function module + qualified name (computed once per function)
+    - args and kwargs, normalized structurally
+
+    For methods, `self`/`cls` is left out so equivalent calls from different
+    instances share entries. Instances whose results depend on their own state
+    can define `__cache_key__()` returning a hashable scope for their entries.
     """
-    raw = {
-        "func": f"{func.__module__}.{func.__qualname__}",
-        "args": args,
-        "kwargs": kwargs,
-    }
-    encoded = json.dumps(raw, sort_keys=True, default=str).encode()
-    return hashlib.sha256(encoded).hexdigest()
+    prefix, is_method = _func_key_info(func)
+    scope = None
+    if is_method and args:
+        owner, args = args[0], args[1:]
+        cache_scope = getattr(owner, "__cache_key__", None)
+        if cache_scope is not None:
+            scope = _normalize_key_part(cache_scope())
+
+    # fast path: only plain str/int/None arguments, hash the tuple directly
+    if all(type(v) in _PLAIN_KEY_TYPES for v in args) and all(
+        type(v) in _PLAIN_KEY_TYPES for v in kwargs.values()
+    ):
+        return (prefix, scope, args, tuple(sorted(kwargs.items())))
+
+    return (
+        prefix,
+        scope,
+        tuple(_normalize_key_part(v) for v in args),
+        tuple(sorted((k, _normalize_key_part(v)) for k, v in kwargs.items())),
+    )
+
+
+# Single-flight bookkeeping: one in-progress computation per cache key.
+# Async flights are tasks (per event loop); sync flights are _SyncFlight.
+class _SyncFlight:
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+_flights_lock = threading.Lock()
+_sync_flights: dict[str, _SyncFlight] = {}
+_async_flights: dict[tuple[int, str], asyncio.Task] = {}
+_refresh_executor = ThreadPoolExecutor(
+    max_workers=REFRESH_WORKERS,
+    thread_name_prefix="cache-refresh",
+)
+
+
+def _run_sync_flight(key, compute):
+    """Run compute() once per key across threads; returns (value, was_leader)."""
+    with _flights_lock:
+        flight = _sync_flights.get(key)
+        leader = flight is None
+        if leader:
+            flight = _SyncFlight()
+            _sync_flights[key] = flight
+
+    if not leader:
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.value, False
+
+    try:
+        flight.value = compute()
+        return flight.value, True
+    except BaseException as exc:
+        flight.error = exc
+        raise
+    finally:
+        with _flights_lock:
+            _sync_flights.pop(key, None)
+        flight.done.set()
+
+
+def _async_flight(key, compute):
+    """
+    Return (task, started) for the shared task computing `key` on this loop,
+    starting it if none is running.
+    """
+    flight_key = (id(asyncio.get_running_loop()), key)
+    with _flights_lock:
+        task = _async_flights.get(flight_key)
+        started = task is None
+        if started:
+            task = asyncio.ensure_future(compute())
+            _async_flights[flight_key] = task
+
+            def _done(_task):
+                with _flights_lock:
+                    if _async_flights.get(flight_key) is _task:
+                        del _async_flights[flight_key]
+
+            task.add_done_callback(_done)
+    return task, started
+
+
+def _log_refresh_failure(name):
+    def _callback(future):
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            logger.warning(f"[CACHE REFRESH FAILED] {name}: {error}")
+
+    return _callback
 
 
 # Decorators
-def cached(ttl_seconds: int):
+def cached(
+    ttl_seconds: int,
+    *,
+    namespace: str | None = None,
+    max_entries: int | None = None,
+    max_bytes: int | None = None,
+    stale_ttl_seconds: int = 0,
+    ignore_kwargs: tuple[str, ...] = (),
+):
     """
     Decorator to cache any function (sync or async) in the global CACHE.
 
+    Each function gets its own namespace (its qualified name unless given);
+    max_entries / max_bytes bound that namespace on top of the global limits.
+
+    Concurrent misses on the same key are coalesced: one caller computes and
+    the others wait for its result. With stale_ttl_seconds, an expired value
+    is still served for that long while a single background refresh runs.
+
+    Keyword arguments named in ignore_kwargs are passed through but left out
+    of the key; use it for inputs already determined by the keyed arguments.
+
     Example usage:
         @cached(ttl_seconds=300)
         async def fetch_player_props(...):
             ...
 
-        @cached(ttl_seconds=1800)
+        @cached(ttl_seconds=1800, stale_ttl_seconds=600)
         def fetch_top_players(...):
             ...
     """
 
     def decorator(func):
         is_async = inspect.iscoroutinefunction(func)
+        cache_namespace = namespace or f"{func.__module__}.{func.__qualname__}"
+        if max_entries is not None or max_bytes is not None:
+            CACHE.configure_namespace(
+                cache_namespace,
+                max_entries=max_entries,
+                max_bytes=max_bytes,
+            )
+
+        def cache_key(args, kwargs):
+            if ignore_kwargs:
+                kwargs = {k: v for k, v in kwargs.items() if k not in ignore_kwargs}
+            return make_cache_key(func, args, kwargs)
+
+        def store(key, value):
+            if value is not None:
+                CACHE.set(
+                    key,
+                    value,
+                    ttl_seconds,
+                    namespace=cache_namespace,
+                    stale_ttl_seconds=stale_ttl_seconds,
+                )
+            return value
 
         if is_async:
 
             @functools.wraps(func)
             async def async_wrapper(*args, **kwargs):
-                key = make_cache_key(func, args, kwargs)
-                cached_value = CACHE.get(key)
+                key = cache_key(args, kwargs)
+
+                async def compute():
+                    return store(key, await func(*args, **kwargs))
 
-                if cached_value is not None:
-                    logger.info(f"[CACHE HIT] {func.__qualname__}")
+                found = CACHE.get_entry(key, allow_stale=stale_ttl_seconds > 0)
+                if found is not None:
+                    cached_value, fresh = found
+                    if fresh:
+                        logger.info(f"[CACHE HIT] {func.__qualname__}")
+                    else:
+                        logger.info(f"[CACHE STALE] {func.__qualname__}")
+                        task, started = _async_flight(key, compute)
+                        if started:
+                            task.add_done_callback(_log_refresh_failure(func.__qualname__))
                     return cached_value
 
                 logger.info(f"[CACHE MISS] {func.__qualname__}")
-                value = await func(*args, **kwargs)
-                CACHE.set(key, value, ttl_seconds)
-                return value
+                # shield: a cancelled caller must not cancel the shared computation
+                task, _ = _async_flight(key, compute)
+                return await asyncio.shield(task)
 
             return async_wrapper
 
@@ -96,16 +644,27 @@ def cached(ttl_seconds: int):
 
             @functools.wraps(func)
             def sync_wrapper(*args, **kwargs):
-                key = make_cache_key(func, args, kwargs)
-                cached_value = CACHE.get(key)
+                key = cache_key(args, kwargs)
+
+                def compute():
+                    return store(key, func(*args, **kwargs))
 
-                if cached_value is not None:
-                    logger.info(f"[CACHE HIT] {func.__qualname__}")
+                found = CACHE.get_entry(key, allow_stale=stale_ttl_seconds > 0)
+                if found is not None:
+                    cached_value, fresh = found
+                    if fresh:
+                        logger.info(f"[CACHE HIT] {func.__qualname__}")
+                    else:
+                        logger.info(f"[CACHE STALE] {func.__qualname__}")
+                        with _flights_lock:
+                            refreshing = key in _sync_flights
+                        if not refreshing:
+                            future = _refresh_executor.submit(_run_sync_flight, key, compute)
+                            future.add_done_callback(_log_refresh_failure(func.__qualname__))
                     return cached_value
 
                 logger.info(f"[CACHE MISS] {func.__qualname__}")
-                value = func(*args, **kwargs)
-                CACHE.set(key, value, ttl_seconds)
+                value, _ = _run_sync_flight(key, compute)
                 return value
 
             return sync_wrapper
@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+
+logger = logging.getLogger(__name__)
+
+ROOT_DIR = Path(__file__).resolve().parents[3]
+DEFAULT_CACHE_PATH = ROOT_DIR / "data" / "cache" / "http_cache.sqlite3"
+
+# Freshness windows by response content type (seconds). Stale entries are
+# revalidated with If-None-Match / If-Modified-Since before being re-downloaded.
+CONTENT_TYPE_TTLS = {
+    "application/json": 60 * 5,
+    "text/csv": 60 * 60 * 6,
+    "text/html": 60 * 60,
+}
+DEFAULT_TTL_SECONDS = 60 * 5
+
+# Only headers worth replaying on a cached response.
+STORED_HEADERS = ("content-type", "etag", "last-modified", "cache-control")
+
+# Pinned payloads (final game feeds) are kept this long; the permanent copy
+# lives in the raw archive (app/db/mlb/raw_storage.py).
+PINNED_TTL_SECONDS = 60 * 60 * 24 * 30
+# Expired entries are kept this long for conditional revalidation, then purged.
+PURGE_GRACE_SECONDS = 60 * 60 * 24 * 7
+# Stored (compressed) bodies beyond this are evicted oldest-first.
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+# Purge / size checks run when the cache is opened and then at most this often
+# from writes.
+MAINTENANCE_INTERVAL_SECONDS = 60 * 60
+COMPRESSION_LEVEL = 6
+
+
+def ttl_for_content_type(content_type: str | None) -> float:
+    media_type = (content_type or "").split(";", 1)[0].strip().lower()
+    return CONTENT_TYPE_TTLS.get(media_type, DEFAULT_TTL_SECONDS)
+
+
+def cache_key(method: str, url: str, params: dict[str, Any] | None = None) -> str:
+    # Hash the request so API keys in query strings never land on disk as text.
+    request_url = httpx.URL(url, params=sorted((params or {}).items()))
+    return hashlib.sha256(f"{method.upper()} {request_url}".encode()).hexdigest()
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    key: str
+    url: str
+    status_code: int
+    headers: dict[str, str]
+    body: bytes
+    stored_at: float
+    expires_at: float | None  # None = never expires
+
+    @property
+    def is_fresh(self) -> bool:
+        return self.expires_at is None or self.expires_at > time.time()
+
+    def validators(self) -> dict[str, str]:
+        headers = {}
+        if self.headers.get("etag"):
+            headers["If-None-Match"] = self.headers["etag"]
+        if self.headers.get("last-modified"):
+            headers["If-Modified-Since"] = self.headers["last-modified"]
+        return headers
+
+    def to_response(self, method: str = "GET") -> httpx.Response:
+        return httpx.Response(
+            self.status_code,
+            headers=self.headers,
+            content=self.body,
+            request=httpx.Request(method, self.url),
+        )
+
+
+class HttpResponseCache:
+    """
+    Persistent response cache backed by a local SQLite file, so cached
+    upstream payloads survive restarts. Blocking SQLite calls are run on a
+    worker thread.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_CACHE_PATH,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._last_maintenance = 0.0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS http_cache (
+                    key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    status_code INTEGER NOT NULL,
+                    headers TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    stored_at REAL NOT NULL,
+                    expires_at REAL
+                )
+                """
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(http_cache)")}
+            if "encoding" not in columns:
+                # caches written before bodies were compressed
+                conn.execute(
+                    "ALTER TABLE http_cache ADD COLUMN encoding TEXT NOT NULL DEFAULT 'identity'"
+                )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_http_cache_stored_at ON http_cache (stored_at)"
+            )
+            conn.commit()
+            self._conn = conn
+            self._maintain_locked(conn)
+        return self._conn
+
+    def _maintain_locked(self, conn: sqlite3.Connection) -> None:
+        """Purge long-expired entries and enforce max_bytes; caller holds _lock."""
+        self._last_maintenance = time.time()
+        try:
+            purged = conn.execute(
+                "DELETE FROM http_cache WHERE expires_at IS NOT NULL AND expires_at < ?",
+                (time.time() - PURGE_GRACE_SECONDS,),
+            ).rowcount
+            evicted = 0
+            total = conn.execute(
+                "SELECT coalesce(sum(length(body)), 0) FROM http_cache"
+            ).fetchone()[0]
+            if total > self.max_bytes:
+                excess = total - self.max_bytes
+                doomed = []
+                for key, size in conn.execute(
+                    "SELECT key, length(body) FROM http_cache ORDER BY stored_at"
+                ):
+                    doomed.append((key,))
+                    excess -= size
+                    if excess <= 0:
+                        break
+                conn.executemany("DELETE FROM http_cache WHERE key = ?", doomed)
+                evicted = len(doomed)
+            conn.commit()
+        except sqlite3.Error as exc:
+            logger.warning("HTTP cache maintenance failed: %s", exc)
+            return
+        if purged or evicted:
+            logger.info(
+                "HTTP cache maintenance: purged %s expired, evicted %s over size cap",
+                purged,
+                evicted,
+            )
+
+    def _get_sync(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT key, url, status_code, headers, body, stored_at, expires_at, encoding "
+                "FROM http_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        return CachedResponse(
+            key=row[0],
+            url=row[1],
+            status_code=row[2],
+            headers=json.loads(row[3]),
+            body=zlib.decompress(row[4]) if row[7] == "deflate" else row[4],
+            stored_at=row[5],
+            expires_at=row[6],
+        )
+
+    def _put_sync(self, entry: CachedResponse) -> None:
+        body = zlib.compress(entry.body, COMPRESSION_LEVEL)
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO http_cache "
+                "(key, url, status_code, headers, body, stored_at, expires_at, encoding) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, 'deflate')",
+                (
+                    entry.key,
+                    entry.url,
+                    entry.status_code,
+                    json.dumps(entry.headers),
+                    body,
+                    entry.stored_at,
+                    entry.expires_at,
+                ),
+            )
+            conn.commit()
+            if time.time() - self._last_maintenance >= MAINTENANCE_INTERVAL_SECONDS:
+                self._maintain_locked(conn)
+
+    def _set_expiry_sync(self, key: str, expires_at: float | None) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "UPDATE http_cache SET expires_at = ?, stored_at = ? WHERE key = ?",
+                (expires_at, time.time(), key),
+            )
+            conn.commit()
+
+    def _maintain_sync(self) -> None:
+        with self._lock:
+            self._maintain_locked(self._connection())
+
+    def _purge_expired_sync(self, older_than_seconds: float) -> int:
+        cutoff = time.time() - older_than_seconds
+        with self._lock:
+            conn = self._connection()
+            cursor = conn.execute(
+                "DELETE FROM http_cache WHERE expires_at IS NOT NULL AND expires_at < ?",
+                (cutoff,),
+            )
+            conn.commit()
+            return cursor.rowcount
+
+    async def get(self, key: str) -> CachedResponse | None:
+        return await asyncio.to_thread(self._get_sync, key)
+
+    async def store(
+        self,
+        key: str,
+        response: httpx.Response,
+        ttl_seconds: float | None,
+    ) -> CachedResponse:
+        now = time.time()
+        entry = CachedResponse(
+            key=key,
+            url=str(response.request.url),
+            status_code=response.status_code,
+            headers={
+                name: response.headers[name]
+                for name in STORED_HEADERS
+                if name in response.headers
+            },
+            body=response.content,
+            stored_at=now,
+            expires_at=None if ttl_seconds is None else now + ttl_seconds,
+        )
+        await asyncio.to_thread(self._put_sync, entry)
+        return entry
+
+    async def refresh(self, key: str, ttl_seconds: float | None) -> None:
+        expires_at = None if ttl_seconds is None else time.time() + ttl_seconds
+        await asyncio.to_thread(self._set_expiry_sync, key, expires_at)
+
+    async def pin(self, key: str) -> None:
+        """Keep an entry for PINNED_TTL_SECONDS (e.g. a finalized game feed)."""
+        await asyncio.to_thread(self._set_expiry_sync, key, time.time() + PINNED_TTL_SECONDS)
+
+    async def purge_expired(self, older_than_seconds: float = PURGE_GRACE_SECONDS) -> int:
+        return await asyncio.to_thread(self._purge_expired_sync, older_than_seconds)
+
+    async def maintain(self) -> None:
+        """Purge long-expired entries and evict oldest entries over max_bytes."""
+        await asyncio.to_thread(self._maintain_sync)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
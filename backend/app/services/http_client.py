@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from app.services.http_cache import HttpResponseCache, cache_key, ttl_for_content_type
+from app.services.rate_limit import TokenBucket
+
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional `h2` package (httpx[http2]); fall back to HTTP/1.1
+# keep-alive pools when it is not installed.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@dataclass(slots=True)
+class HostPolicy:
+    max_connections: int = 10
+    max_keepalive_connections: int = 10
+    rate_per_second: float | None = None
+    burst: int = 1
+    timeout: float = 30.0
+    connect_timeout: float = 10.0
+
+
+DEFAULT_HOST_POLICY = HostPolicy()
+
+HOST_POLICIES: dict[str, HostPolicy] = {
+    "statsapi.mlb.com": HostPolicy(
+        max_connections=16, max_keepalive_connections=16, rate_per_second=20.0, burst=20
+    ),
+    "baseballsavant.mlb.com": HostPolicy(
+        max_connections=4, max_keepalive_connections=4, rate_per_second=2.0, burst=2, timeout=60.0
+    ),
+    "api.open-meteo.com": HostPolicy(
+        max_connections=4, max_keepalive_connections=4, rate_per_second=8.0, burst=8
+    ),
+    "historical-forecast-api.open-meteo.com": HostPolicy(
+        max_connections=4, max_keepalive_connections=4, rate_per_second=8.0, burst=8
+    ),
+    "api.the-odds-api.com": HostPolicy(
+        max_connections=4, max_keepalive_connections=4, rate_per_second=5.0, burst=5, timeout=20.0
+    ),
+    "api.prop-line.com": HostPolicy(
+        max_connections=4, max_keepalive_connections=4, rate_per_second=5.0, burst=5, timeout=20.0
+    ),
+    "api.sportsdata.io": HostPolicy(
+        max_connections=4, max_keepalive_connections=4, rate_per_second=5.0, burst=5, timeout=20.0
+    ),
+}
+
+
+class HttpClientManager:
+    """
+    Shared, pooled httpx clients for the external data clients: one keep-alive
+    AsyncClient per host with per-host connection limits, rate limits and
+    timeout budgets. Created lazily, closed on app shutdown.
+
+    Requests made with `cache=True` go through the on-disk response cache:
+    fresh entries skip the network, stale ones are revalidated with
+    If-None-Match / If-Modified-Since and only re-downloaded on a 200.
+    """
+
+    def __init__(
+        self,
+        host_policies: dict[str, HostPolicy] | None = None,
+        default_policy: HostPolicy = DEFAULT_HOST_POLICY,
+        http2: bool = True,
+        response_cache: HttpResponseCache | None = None,
+    ):
+        self.host_policies = dict(host_policies or {})
+        self.default_policy = default_policy
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self.response_cache = response_cache
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._limiters: dict[str, TokenBucket] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def policy_for(self, host: str) -> HostPolicy:
+        return self.host_policies.get(host, self.default_policy)
+
+    def _client_for(self, host: str) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # httpx pools are bound to the loop that opened them; a new loop
+            # (e.g. a CLI asyncio.run) gets fresh pools.
+            self._clients = {}
+            self._limiters = {}
+            self._loop = loop
+
+        client = self._clients.get(host)
+        if client is None or client.is_closed:
+            policy = self.policy_for(host)
+            client = httpx.AsyncClient(
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=policy.max_connections,
+                    max_keepalive_connections=policy.max_keepalive_connections,
+                ),
+                timeout=httpx.Timeout(policy.timeout, connect=policy.connect_timeout),
+            )
+            self._clients[host] = client
+            if policy.rate_per_second:
+                self._limiters[host] = TokenBucket(policy.rate_per_second, policy.burst)
+        return client
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> httpx.Response:
+        host = httpx.URL(url).host
+        client = self._client_for(host)
+        limiter = self._limiters.get(host)
+        if limiter is not None:
+            await limiter.acquire()
+        return await client.request(
+            method,
+            url,
+            params=params,
+            headers=headers,
+            timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+        )
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        cache: bool = False,
+        cache_ttl: float | None = None,
+    ) -> httpx.Response:
+        """
+        `cache_ttl` overrides the content-type freshness window for this
+        request; 0 means "always revalidate".
+        """
+        if not cache or self.response_cache is None or method.upper() != "GET":
+            return await self._send(
+                method, url, params=params, headers=headers, timeout=timeout
+            )
+
+        key = cache_key(method, url, params)
+        try:
+            cached = await self.response_cache.get(key)
+        except Exception as exc:
+            logger.warning("HTTP cache read failed for %s: %s", url, exc)
+            cached = None
+
+        if cached is not None and cached.is_fresh:
+            return cached.to_response(method)
+
+        request_headers = dict(headers or {})
+        if cached is not None:
+            request_headers.update(cached.validators())
+
+        response = await self._send(
+            method, url, params=params, headers=request_headers, timeout=timeout
+        )
+
+        try:
+            if response.status_code == 304 and cached is not None:
+                ttl = cache_ttl if cache_ttl is not None else ttl_for_content_type(
+                    cached.headers.get("content-type")
+                )
+                await self.response_cache.refresh(key, ttl)
+                return cached.to_response(method)
+            if response.status_code == 200:
+                ttl = cache_ttl if cache_ttl is not None else ttl_for_content_type(
+                    response.headers.get("content-type")
+                )
+                await self.response_cache.store(key, response, ttl)
+        except Exception as exc:
+            logger.warning("HTTP cache write failed for %s: %s", url, exc)
+        return response
+
+    async def pin(
+        self,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        method: str = "GET",
+    ) -> None:
+        """Keep a cached response for PINNED_TTL_SECONDS (payloads that can no longer change)."""
+        if self.response_cache is None:
+            return
+        try:
+            await self.response_cache.pin(cache_key(method, url, params))
+        except Exception as exc:
+            logger.warning("HTTP cache pin failed for %s: %s", url, exc)
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def close(self) -> None:
+        clients = list(self._clients.values())
+        self._clients = {}
+        self._limiters = {}
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as exc:
+                logger.warning("Failed closing HTTP client: %s", exc)
+        if self.response_cache is not None:
+            self.response_cache.close()
+
+
+# global shared instance, closed on app shutdown
+http_clients = HttpClientManager(HOST_POLICIES, response_cache=HttpResponseCache())
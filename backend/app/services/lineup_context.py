@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+import json
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -330,3 +332,12 @@ def build_expected_lineup_sets(
                     excluded.setdefault(team_abbr, set()).add(pid)
 
     return expected, excluded
+
+
+def lineup_sets_fingerprint(expected_map: dict, excluded_map: dict) -> str:
+    """Stable digest of build_expected_lineup_sets output, for cache keys."""
+    raw = {
+        "expected": {team: sorted(ids) for team, ids in sorted(expected_map.items())},
+        "excluded": {team: sorted(ids) for team, ids in sorted(excluded_map.items())},
+    }
+    return hashlib.sha256(json.dumps(raw, sort_keys=True).encode()).hexdigest()
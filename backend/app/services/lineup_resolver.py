@@ -33,7 +33,11 @@ class LineupResolver:
     def __init__(self, engine: Engine):
         self.engine = engine
 
-    @cached(ttl_seconds=60 * 5)
+    # cached lookups are shared by every resolver on the same database
+    def __cache_key__(self) -> str:
+        return str(self.engine.url)
+
+    @cached(ttl_seconds=60 * 5, stale_ttl_seconds=60 * 5)
     def _load_players_by_team(self) -> dict[str, list[dict[str, Any]]]:
         df = pd.read_sql(
             """
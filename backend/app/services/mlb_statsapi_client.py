@@ -3,15 +3,18 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-import httpx
+from app.services.http_client import HttpClientManager, http_clients
 
 
 logger = logging.getLogger(__name__)
 
+FINAL_GAME_STATE = "Final"
+
 
 class MlbStatsApiClient:
-    def __init__(self, timeout: float = 30.0):
+    def __init__(self, timeout: float = 30.0, http: HttpClientManager | None = None):
         self.timeout = timeout
+        self.http = http or http_clients
         self.base_url = "https://statsapi.mlb.com/api/v1"
         self.feed_base_url = "https://statsapi.mlb.com/api/v1.1"
 
@@ -29,16 +32,22 @@ class MlbStatsApiClient:
         *,
         params: dict[str, Any] | None = None,
         feed_version: bool = False,
+        cache_ttl: float | None = None,
     ) -> tuple[dict[str, Any], str]:
         base_url = self.feed_base_url if feed_version else self.base_url
         url = f"{base_url}/{path.lstrip('/')}"
         cleaned_params = self._clean_params(params or {})
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(url, params=cleaned_params)
-            response.raise_for_status()
-            logger.info("MLB StatsAPI GET %s params=%s", url, cleaned_params)
-            return response.json(), str(response.request.url)
+        response = await self.http.get(
+            url,
+            params=cleaned_params,
+            timeout=self.timeout,
+            cache=True,
+            cache_ttl=cache_ttl,
+        )
+        response.raise_for_status()
+        logger.info("MLB StatsAPI GET %s params=%s", url, cleaned_params)
+        return response.json(), str(response.request.url)
 
     async def get_teams(
         self,
@@ -103,14 +112,30 @@ class MlbStatsApiClient:
         timecode: str | None = None,
         hydrate: str | None = None,
     ) -> tuple[dict[str, Any], str]:
-        return await self._get_json(
-            f"game/{game_pk}/feed/live",
-            params={
-                "timecode": timecode,
-                "hydrate": hydrate,
-            },
+        path = f"game/{game_pk}/feed/live"
+        params = {
+            "timecode": timecode,
+            "hydrate": hydrate,
+        }
+        # Live feeds are always revalidated; once a game is final (or the
+        # request is pinned to a timecode) the payload can no longer change,
+        # so the cached copy is pinned for PINNED_TTL_SECONDS. The raw archive
+        # keeps the permanent copy.
+        payload, request_url = await self._get_json(
+            path,
+            params=params,
             feed_version=True,
+            cache_ttl=0,
+        )
+        game_state = (
+            payload.get("gameData", {}).get("status", {}).get("abstractGameState")
         )
+        if timecode or game_state == FINAL_GAME_STATE:
+            await self.http.pin(
+                f"{self.feed_base_url}/{path}",
+                params=self._clean_params(params),
+            )
+        return payload, request_url
 
     async def get_umpires(
         self,
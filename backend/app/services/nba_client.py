@@ -18,8 +18,8 @@ class NBAClient:
     def __init__(self, timeout=30):
         self.timeout = timeout
 
-    # cache for 30 mins
-    @cached(ttl_seconds=60 * 30)
+    # cache for 30 mins, serve stale for 10 more while refreshing
+    @cached(ttl_seconds=60 * 30, stale_ttl_seconds=60 * 10)
     def fetch_top_players(self, top_n=30, per_mode="PerGame"):
         stats = leaguedashplayerstats.LeagueDashPlayerStats(
             per_mode_detailed=per_mode,
@@ -0,0 +1,150 @@
+import asyncio
+import logging
+import random
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from app.services.nba_client import NBAClient
+from app.services.rate_limit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class PlayerGameLogResult:
+    player_id: int
+    player_name: str
+    df: object = None
+    team_abbr: str | None = None
+    error: Exception | None = None
+
+
+class NBAIngestWorker:
+    """
+    Runs blocking nba_api calls on a dedicated thread pool so the event loop
+    stays free for API traffic. Calls share one token bucket (upstream rate)
+    and one semaphore (in-flight window), and retry with jittered backoff.
+    """
+
+    def __init__(
+        self,
+        client: NBAClient,
+        max_workers: int = 4,
+        rate_per_second: float = 2.0,
+        burst: int = 4,
+        max_attempts: int = 3,
+        backoff_base_seconds: float = 0.5,
+        backoff_cap_seconds: float = 8.0,
+        backoff_jitter_seconds: float = 0.5,
+    ):
+        self.client = client
+        self.max_workers = max_workers
+        self.max_attempts = max_attempts
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_cap_seconds = backoff_cap_seconds
+        self.backoff_jitter_seconds = backoff_jitter_seconds
+        self._bucket = TokenBucket(rate_per_second, burst)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="nba-ingest",
+        )
+        self._window = asyncio.Semaphore(max_workers)
+
+    def _backoff_seconds(self, attempt_index: int) -> float:
+        delay = min(
+            self.backoff_cap_seconds,
+            self.backoff_base_seconds * (2 ** attempt_index),
+        )
+        return delay + random.uniform(0.0, self.backoff_jitter_seconds)
+
+    async def call(self, label: str, fn, *args, max_attempts: int | None = None):
+        attempts = max_attempts or self.max_attempts
+        loop = asyncio.get_running_loop()
+        for attempt in range(attempts):
+            try:
+                async with self._window:
+                    await self._bucket.acquire()
+                    return await loop.run_in_executor(self._executor, fn, *args)
+            except Exception as e:
+                if attempt + 1 >= attempts:
+                    logger.warning(f"Attempt {attempt + 1}/{attempts} failed for {label}: {e}")
+                    raise
+                wait_seconds = self._backoff_seconds(attempt)
+                logger.warning(
+                    f"Attempt {attempt + 1}/{attempts} failed for {label}: {e}. "
+                    f"Retrying in {wait_seconds:.2f}s"
+                )
+                await asyncio.sleep(wait_seconds)
+
+    async def fetch_player_game_log(
+        self,
+        player_id: int,
+        player_name: str,
+        season: str,
+        resolve_team: bool = True,
+    ) -> PlayerGameLogResult:
+        result = PlayerGameLogResult(player_id=player_id, player_name=player_name)
+        try:
+            result.df = await self.call(
+                player_name, self.client.fetch_player_game_log, player_id, season
+            )
+        except Exception as e:
+            logger.error(f"All retries failed for {player_name}")
+            result.error = e
+            return result
+
+        df = result.df
+        if df is None or df.empty:
+            return result
+
+        if "TEAM_ABBREVIATION" in df.columns:
+            result.team_abbr = df.iloc[0]["TEAM_ABBREVIATION"]
+        if not result.team_abbr and resolve_team:
+            try:
+                info_df, _ = await self.call(
+                    f"player info {player_name}",
+                    self.client.fetch_player_info,
+                    player_id,
+                    max_attempts=2,
+                )
+                if not info_df.empty and "TEAM_ABBREVIATION" in info_df.columns:
+                    result.team_abbr = info_df.iloc[0]["TEAM_ABBREVIATION"]
+            except Exception:
+                pass
+        return result
+
+    async def iter_player_game_logs(
+        self,
+        active_players: list[dict],
+        season: str,
+        chunk_size: int = 25,
+        resolve_team: bool = True,
+    ):
+        """
+        Fetch game logs for every player concurrently and yield completed
+        results in chunks of `chunk_size`, so callers can write a chunk to the
+        DB while the next one is still downloading.
+        """
+        tasks = [
+            asyncio.create_task(
+                self.fetch_player_game_log(
+                    p["id"], p["full_name"], season, resolve_team
+                )
+            )
+            for p in active_players
+        ]
+        chunk: list[PlayerGameLogResult] = []
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                chunk.append(await next_done)
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -3,9 +3,8 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-import httpx
-
 from app.core.config import settings
+from app.services.http_client import HttpClientManager, http_clients
 
 
 logger = logging.getLogger(__name__)
@@ -31,9 +30,14 @@ DEFAULT_HOURLY_VARIABLES = [
 ]
 
 
+# Historical forecasts for past dates do not change once published.
+HISTORICAL_FORECAST_CACHE_TTL = 60 * 60 * 24 * 7
+
+
 class OpenMeteoClient:
-    def __init__(self, timeout: float = 30.0):
+    def __init__(self, timeout: float = 30.0, http: HttpClientManager | None = None):
         self.timeout = timeout
+        self.http = http or http_clients
         self.base_url = settings.OPEN_METEO_BASE_URL.rstrip("/")
         self.historical_base_url = settings.OPEN_METEO_HISTORICAL_BASE_URL.rstrip("/")
 
@@ -51,15 +55,21 @@ class OpenMeteoClient:
         path: str,
         *,
         params: dict[str, Any] | None = None,
+        cache_ttl: float | None = None,
     ) -> tuple[dict[str, Any], str]:
         url = f"{base_url}/{path.lstrip('/')}"
         cleaned_params = self._clean_params(params or {})
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(url, params=cleaned_params)
-            response.raise_for_status()
-            logger.info("Open-Meteo GET %s params=%s", url, cleaned_params)
-            return response.json(), str(response.request.url)
+        response = await self.http.get(
+            url,
+            params=cleaned_params,
+            timeout=self.timeout,
+            cache=True,
+            cache_ttl=cache_ttl,
+        )
+        response.raise_for_status()
+        logger.info("Open-Meteo GET %s params=%s", url, cleaned_params)
+        return response.json(), str(response.request.url)
 
     async def get_forecast(
         self,
@@ -109,4 +119,5 @@ class OpenMeteoClient:
                 "start_date": start_date,
                 "end_date": end_date,
             },
+            cache_ttl=HISTORICAL_FORECAST_CACHE_TTL,
         )
@@ -9,6 +9,7 @@ import httpx
 
 from app.core.config import settings
 from app.services.cache import cached
+from app.services.http_client import HttpClientManager, http_clients
 
 
 logger = logging.getLogger(__name__)
@@ -16,7 +17,8 @@ logging.getLogger("httpx").setLevel(logging.WARNING)
 
 
 class PropLineClient:
-    def __init__(self):
+    def __init__(self, http: HttpClientManager | None = None):
+        self.http = http or http_clients
         self.base_url = settings.PROPLINE_BASE_URL.rstrip("/")
         self.api_key = settings.PROPLINE_API_KEY
         if not self.api_key:
@@ -28,11 +30,10 @@ class PropLineClient:
 
     async def _get(self, path: str, params: dict[str, Any] | None = None) -> Any:
         query = self._clean_params({"apiKey": self.api_key, **(params or {})})
-        async with httpx.AsyncClient(timeout=20) as client:
-            response = await client.get(f"{self.base_url}/{path.lstrip('/')}", params=query)
-            response.raise_for_status()
-            logger.info("PropLine GET %s params=%s", path, {**query, "apiKey": "***"})
-            return response.json()
+        response = await self.http.get(f"{self.base_url}/{path.lstrip('/')}", params=query)
+        response.raise_for_status()
+        logger.info("PropLine GET %s params=%s", path, {**query, "apiKey": "***"})
+        return response.json()
 
     @cached(ttl_seconds=60)
     async def get_events(self, sport: str = "baseball_mlb") -> list[dict[str, Any]]:
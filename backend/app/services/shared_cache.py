@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import io
+import logging
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+ROOT_DIR = Path(__file__).resolve().parents[3]
+DEFAULT_SHARED_CACHE_PATH = ROOT_DIR / "data" / "cache" / "shared_cache.sqlite3"
+
+# Wait this long for another worker's write lock before giving up on an op.
+BUSY_TIMEOUT_SECONDS = 5
+
+PARQUET_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+
+class _FramePickler(pickle.Pickler):
+    """Pickler that writes DataFrames (top-level or nested) as Parquet bytes."""
+
+    def persistent_id(self, obj):
+        if PARQUET_AVAILABLE and type(obj) is pd.DataFrame:
+            buffer = io.BytesIO()
+            try:
+                obj.to_parquet(buffer)
+            except Exception:
+                # non-string column names, mixed object columns, ...
+                return None
+            return ("parquet", buffer.getvalue())
+        return None
+
+
+class _FrameUnpickler(pickle.Unpickler):
+    def persistent_load(self, pid):
+        kind, payload = pid
+        if kind == "parquet":
+            return pd.read_parquet(io.BytesIO(payload))
+        raise pickle.UnpicklingError(f"Unknown persistent id: {kind}")
+
+
+def serialize_value(value: Any) -> bytes:
+    buffer = io.BytesIO()
+    _FramePickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(value)
+    return buffer.getvalue()
+
+
+def deserialize_value(payload: bytes) -> Any:
+    return _FrameUnpickler(io.BytesIO(payload)).load()
+
+
+def shared_key(key: Any) -> str:
+    # make_cache_key returns tuples of primitives, whose repr is stable across
+    # processes (unlike hash()).
+    return hashlib.sha256(repr(key).encode()).hexdigest()
+
+
+class SQLiteCacheBackend:
+    """
+    Cache store shared by every worker process on the host, backed by a
+    SQLite file in WAL mode. Values are pickled, with DataFrames stored as
+    Parquet when pyarrow is installed.
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_SHARED_CACHE_PATH):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._stats = {"hits": 0, "misses": 0, "writes": 0, "errors": 0}
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self.path,
+                timeout=BUSY_TIMEOUT_SECONDS,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache_entries (
+                    key TEXT PRIMARY KEY,
+                    namespace TEXT NOT NULL,
+                    value BLOB NOT NULL,
+                    stored_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    stale_until REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_cache_entries_stale_until "
+                "ON cache_entries (stale_until)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def get_record(self, key: Any) -> tuple[Any, float, float, str] | None:
+        """(value, expires_at, stale_until, namespace) for a live entry, else None."""
+        try:
+            with self._lock:
+                row = self._connection().execute(
+                    "SELECT value, expires_at, stale_until, namespace FROM cache_entries "
+                    "WHERE key = ? AND stale_until >= ?",
+                    (shared_key(key), time.time()),
+                ).fetchone()
+            if row is None:
+                self._stats["misses"] += 1
+                return None
+            value = deserialize_value(row[0])
+        except Exception as exc:
+            self._stats["errors"] += 1
+            logger.warning("Shared cache read failed: %s", exc)
+            return None
+        self._stats["hits"] += 1
+        return value, row[1], row[2], row[3]
+
+    def set(
+        self,
+        key: Any,
+        value: Any,
+        ttl_seconds: float,
+        namespace: str = "default",
+        stale_ttl_seconds: float = 0,
+    ) -> None:
+        now = time.time()
+        try:
+            payload = serialize_value(value)
+            with self._lock:
+                conn = self._connection()
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache_entries "
+                    "(key, namespace, value, stored_at, expires_at, stale_until) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        shared_key(key),
+                        namespace,
+                        payload,
+                        now,
+                        now + ttl_seconds,
+                        now + ttl_seconds + stale_ttl_seconds,
+                    ),
+                )
+                conn.commit()
+        except Exception as exc:
+            self._stats["errors"] += 1
+            logger.warning("Shared cache write failed for %s: %s", namespace, exc)
+            return
+        self._stats["writes"] += 1
+
+    def delete(self, key: Any) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM cache_entries WHERE key = ?", (shared_key(key),))
+            conn.commit()
+
+    def sweep(self) -> int:
+        with self._lock:
+            conn = self._connection()
+            cursor = conn.execute(
+                "DELETE FROM cache_entries WHERE stale_until < ?",
+                (time.time(),),
+            )
+            conn.commit()
+            return cursor.rowcount
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM cache_entries")
+            conn.commit()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            entries, size = self._connection().execute(
+                "SELECT count(*), coalesce(sum(length(value)), 0) FROM cache_entries"
+            ).fetchone()
+        return {**self._stats, "entries": entries, "bytes": size, "path": str(self.path)}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -1,10 +1,11 @@
-import httpx
 from app.core.config import settings
 from app.services.cache import cached
+from app.services.http_client import HttpClientManager, http_clients
 
 
 class SportsDataClient:
-    def __init__(self):
+    def __init__(self, http: HttpClientManager | None = None):
+        self.http = http or http_clients
         self.base_url = settings.SPORTSDATA_BASE_URL
         self.api_key = settings.SPORTSDATA_API_KEY
 
@@ -13,7 +14,6 @@ class SportsDataClient:
         url = f"{self.base_url}/odds/json/BettingPlayerPropsByGameID/{game_id}"
         params = {"key": self.api_key}
 
-        async with httpx.AsyncClient(timeout=20) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
+        response = await self.http.get(url, params=params)
+        response.raise_for_status()
+        return response.json()
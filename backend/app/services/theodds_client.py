@@ -4,12 +4,14 @@ import logging
 from typing import Any
 from app.core.config import settings
 from app.services.cache import cached
+from app.services.http_client import HttpClientManager, http_clients
 
 logger = logging.getLogger(__name__)
 
 
 class TheOddsClient:
-    def __init__(self):
+    def __init__(self, http: HttpClientManager | None = None):
+        self.http = http or http_clients
         self.base_url = settings.THEODDS_BASE_URL
         self.api_key = settings.THEODDS_API_KEY
         self._latest_usage: dict[str, int | None] = {
@@ -76,11 +78,10 @@ class TheOddsClient:
         url = f"{self.base_url}/sports"
         params = {"api_key": self.api_key}
 
-        async with httpx.AsyncClient(timeout=15) as client:
-            res = await client.get(url, params=params)
-            res.raise_for_status()
-            self._extract_usage(res)
-            return res.json()
+        res = await self.http.get(url, params=params)
+        res.raise_for_status()
+        self._extract_usage(res)
+        return res.json()
 
     @cached(ttl_seconds=60 * 5)  # 5 minutes
     async def get_odds(
@@ -118,29 +119,27 @@ class TheOddsClient:
         if bookmakers:
             params["bookmakers"] = bookmakers
 
-        async with httpx.AsyncClient(timeout=20) as client:
-            res = await client.get(url, params=params)
-            res.raise_for_status()
-            usage = self._extract_usage(res)
+        res = await self.http.get(url, params=params)
+        res.raise_for_status()
+        usage = self._extract_usage(res)
 
-            return {
-                "data": res.json(),
-                "usage": usage,
-                "estimated_cost": estimated_cost,
-            }
+        return {
+            "data": res.json(),
+            "usage": usage,
+            "estimated_cost": estimated_cost,
+        }
 
     @cached(ttl_seconds=60 * 5)  # 5 minutes (events endpoint is free; keep it fresh)
     async def get_events(self, sport: str):
         logger.info("THE ODDS API CALLED: get_events")
 
-        async with httpx.AsyncClient(timeout=15) as client:
-            res = await client.get(
-                f"{self.base_url}/sports/{sport}/events",
-                params={"api_key": self.api_key},
-            )
-            res.raise_for_status()
-            self._extract_usage(res)
-            return res.json()
+        res = await self.http.get(
+            f"{self.base_url}/sports/{sport}/events",
+            params={"api_key": self.api_key},
+        )
+        res.raise_for_status()
+        self._extract_usage(res)
+        return res.json()
 
     # event odds (eg. player props)
     @cached(ttl_seconds=60 * 60)
@@ -179,15 +178,14 @@ class TheOddsClient:
         if bookmakers:
             params["bookmakers"] = bookmakers
 
-        async with httpx.AsyncClient(timeout=20) as client:
-            res = await client.get(
-                f"{self.base_url}/sports/{sport}/events/{event_id}/odds",
-                params=params,
-            )
-            res.raise_for_status()
-            usage = self._extract_usage(res)
-            return {
-                "data": res.json(),
-                "usage": usage,
-                "estimated_cost": estimated_cost,
-            }
+        res = await self.http.get(
+            f"{self.base_url}/sports/{sport}/events/{event_id}/odds",
+            params=params,
+        )
+        res.raise_for_status()
+        usage = self._extract_usage(res)
+        return {
+            "data": res.json(),
+            "usage": usage,
+            "estimated_cost": estimated_cost,
+        }
@@ -0,0 +1,16 @@
+import os
+import sys
+from pathlib import Path
+
+# The backend imports itself as `app`, as when uvicorn runs from backend/.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# app.core.config requires these at import time; tests never reach the services.
+for name, value in {
+    "DATABASE_URL": "postgresql+asyncpg://test@localhost/test",
+    "ML_DATABASE_URL": "postgresql://test@localhost/test",
+    "SPORTSDATA_API_KEY": "test",
+    "THEODDS_BASE_URL": "http://localhost",
+    "THEODDS_API_KEY": "test",
+}.items():
+    os.environ.setdefault(name, value)
@@ -0,0 +1,57 @@
+import pandas as pd
+
+from app.api.nba.player_stats import _apply_lineup_filters
+
+
+def _lineups(games: list[dict]) -> dict:
+    return {"games_count": len(games), "games": games}
+
+
+def _game(game_id: str, starters: list[dict], may_not_play: list[dict] | None = None) -> dict:
+    return {
+        "game_id": game_id,
+        "away": {"status": "Expected", "starters": starters, "may_not_play": may_not_play or []},
+        "home": {"status": "Expected", "starters": [], "may_not_play": []},
+    }
+
+
+def _preds() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "game_id": ["1", "1", "2", "2"],
+            "player_id": [10, 11, 20, 21],
+            "pred_value": [20.0, 15.0, 10.0, 8.0],
+        }
+    )
+
+
+def test_game_without_resolved_players_keeps_all_rows():
+    payload = _lineups(
+        [
+            _game("1", [{"resolved_player_id": None, "injury_tag": None}]),
+            _game("2", [{"resolved_player_id": 20, "injury_tag": None}]),
+        ]
+    )
+
+    result = _apply_lineup_filters(_preds(), "today", payload)
+
+    assert result["player_id"].tolist() == [10, 11, 20]
+    assert result["pred_value"].tolist() == [20.0, 15.0, 10.0]
+
+
+def test_listed_players_are_scaled_and_out_players_dropped():
+    payload = _lineups(
+        [
+            _game(
+                "2",
+                [{"resolved_player_id": 20, "injury_tag": None, "play_pct": 50}],
+                [{"resolved_player_id": 21, "injury_tag": "Out"}],
+            ),
+        ]
+    )
+
+    result = _apply_lineup_filters(_preds(), "today", payload)
+
+    assert result["player_id"].tolist() == [10, 11, 20]
+    assert result["pred_value"].tolist() == [20.0, 15.0, 5.0]
+    assert result["lineup_play_pct"].tolist()[2] == 50
@@ -183,6 +183,7 @@ export type BestBetsResponse = {
   top_single_legs?: BestBetLeg[];
   recommended_parlays?: BestBetParlay[];
   message?: string;
+  warnings?: string[];
   debug?: Record<string, number>;
 };
 
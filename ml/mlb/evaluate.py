@@ -16,17 +16,30 @@ from sklearn.metrics import (
 )
 
 from .artifacts import load_latest_model, score_frame
-from .features import build_batter_training_frame, build_pitcher_training_frame, get_engine
+from .feature_cache import load_training_frame
+from .features import compact_training_frame, get_engine
 from .training import MARKETS
 
 
-def _load_frame_for_market(market: str, engine) -> pd.DataFrame:
-    frame_kind = MARKETS[market]["frame"]
-    if frame_kind == "batter":
-        return build_batter_training_frame(engine=engine)
-    if frame_kind == "pitcher":
-        return build_pitcher_training_frame(engine=engine)
-    raise ValueError(f"Unknown frame kind: {frame_kind}")
+IDENTITY_COLUMNS = [
+    "game_date",
+    "game_pk",
+    "player_id",
+    "player_name",
+    "team_id",
+    "team_abbreviation",
+    "opponent_team_id",
+    "opponent_team_abbreviation",
+    "batting_order",
+]
+
+
+def _load_frame_for_market(market: str, engine, feature_columns: list[str]) -> pd.DataFrame:
+    frame = load_training_frame(MARKETS[market]["frame"], engine=engine, copy=False)
+    return compact_training_frame(
+        frame,
+        columns=[*IDENTITY_COLUMNS, MARKETS[market]["target"], *feature_columns],
+    )
 
 
 def _metrics(kind: str, y_true: pd.Series, y_pred: pd.Series) -> dict[str, float]:
@@ -121,7 +134,7 @@ def score_completed_games(
 
     artifact = load_latest_model(market)
     engine = get_engine(database_url)
-    df = _load_frame_for_market(market, engine).replace([np.inf, -np.inf], np.nan)
+    df = _load_frame_for_market(market, engine, artifact["feature_columns"])
     if df.empty:
         raise ValueError(f"No historical rows found for {market}.")
 
@@ -153,20 +166,9 @@ def score_completed_games(
         else {}
     )
 
-    identity_cols = [
-        "game_date",
-        "game_pk",
-        "player_id",
-        "player_name",
-        "team_id",
-        "team_abbreviation",
-        "opponent_team_id",
-        "opponent_team_abbreviation",
-        "batting_order",
-        target,
-        prediction_col,
+    sample_cols = [
+        col for col in [*IDENTITY_COLUMNS, target, prediction_col] if col in scored.columns
     ]
-    sample_cols = [col for col in identity_cols if col in scored.columns]
     top_rows = scored[sample_cols].head(limit).copy()
     top_rows["game_date"] = pd.to_datetime(top_rows["game_date"]).dt.date.astype(str)
 
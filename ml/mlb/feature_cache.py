@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import fcntl
+import importlib.util
+import json
+import os
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from .features import (
+    build_batter_training_frame,
+    build_pitcher_training_frame,
+    get_engine,
+)
+
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+FEATURE_CACHE_DIR = BASE_DIR / "data" / "mlb" / "feature_cache"
+
+# Bump when feature definitions change so stale caches are rebuilt in full.
+FEATURE_CACHE_VERSION = 1
+
+# History re-read before the watermark when extending the cache. Long enough
+# to reach last season's tail (offseason gap + 20-game windows); rows after the
+# watermark for players with sparser history than this can differ slightly
+# from a full rebuild, so the cache is fully rebuilt every FULL_REBUILD_DAYS.
+FEATURE_LOOKBACK_DAYS = 240
+FULL_REBUILD_DAYS = 7
+
+FINAL_STATES = ("Final", "Game Over", "Completed Early")
+
+FRAME_BUILDERS = {
+    "batter": build_batter_training_frame,
+    "pitcher": build_pitcher_training_frame,
+}
+
+PARQUET_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+_memory_lock = threading.Lock()
+_memory_frames: dict[tuple[str, str], tuple[dict[str, Any], pd.DataFrame]] = {}
+
+
+def _frame_dir(kind: str) -> Path:
+    return FEATURE_CACHE_DIR / kind
+
+
+def _meta_path(kind: str) -> Path:
+    return _frame_dir(kind) / "meta.json"
+
+
+def _tmp_path(path: Path) -> Path:
+    # Unique per writer so concurrent refreshes never share a scratch file.
+    return path.with_name(f"{path.name}.{os.getpid()}-{uuid.uuid4().hex[:8]}.tmp")
+
+
+@contextmanager
+def _refresh_lock(kind: str):
+    """Exclusive cross-process lock around a refresh of one frame kind."""
+    frame_dir = _frame_dir(kind)
+    frame_dir.mkdir(parents=True, exist_ok=True)
+    with open(frame_dir / ".lock", "a+") as handle:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def _partition_suffix() -> str:
+    return ".parquet" if PARQUET_AVAILABLE else ".pkl"
+
+
+def _write_partition(frame: pd.DataFrame, path: Path) -> None:
+    tmp_path = _tmp_path(path)
+    try:
+        if path.suffix == ".parquet":
+            frame.to_parquet(tmp_path, index=False)
+        else:
+            frame.to_pickle(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _read_partition(path: Path) -> pd.DataFrame:
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path)
+    return pd.read_pickle(path)
+
+
+def _load_meta(kind: str) -> dict[str, Any] | None:
+    path = _meta_path(kind)
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _source_watermark(engine) -> dict[str, Any]:
+    """Latest final game date plus the number of final games (catches late finals)."""
+    row = pd.read_sql(
+        """
+        select max(official_date) as latest_game_date, count(*) as final_games
+        from mlb_games
+        where detailed_state in %(final_states)s
+        """,
+        engine,
+        params={"final_states": FINAL_STATES},
+    ).iloc[0]
+    latest = row["latest_game_date"]
+    return {
+        "latest_game_date": pd.Timestamp(latest).date().isoformat() if pd.notna(latest) else None,
+        "final_games": int(row["final_games"] or 0),
+    }
+
+
+def _read_cached_frame(kind: str) -> pd.DataFrame:
+    partitions = sorted(_frame_dir(kind).glob("season=*"))
+    partitions = [path for path in partitions if not path.name.endswith(".tmp")]
+    if not partitions:
+        return pd.DataFrame()
+    return pd.concat([_read_partition(path) for path in partitions], ignore_index=True)
+
+
+def _write_seasons(kind: str, frame: pd.DataFrame, seasons: set[int]) -> None:
+    """
+    Swap in the given seasons' partitions. Each new partition replaces the old
+    one atomically; other files for a season (e.g. the other format) are only
+    removed once the replacement is in place.
+    """
+    frame_dir = _frame_dir(kind)
+    frame_dir.mkdir(parents=True, exist_ok=True)
+    for season in sorted(seasons):
+        target = frame_dir / f"season={season}{_partition_suffix()}"
+        season_frame = frame[frame["season"] == season]
+        if not season_frame.empty:
+            _write_partition(season_frame.reset_index(drop=True), target)
+        for stale in frame_dir.glob(f"season={season}.*"):
+            if stale != target and not stale.name.endswith(".tmp"):
+                stale.unlink(missing_ok=True)
+
+
+def _write_meta(kind: str, watermark: dict[str, Any], *, full_rebuild_at: str) -> dict[str, Any]:
+    meta = {
+        "version": FEATURE_CACHE_VERSION,
+        "kind": kind,
+        "latest_game_date": watermark["latest_game_date"],
+        "final_games": watermark["final_games"],
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+        "full_rebuild_at": full_rebuild_at,
+    }
+    path = _meta_path(kind)
+    tmp_path = _tmp_path(path)
+    try:
+        tmp_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return meta
+
+
+def _needs_full_rebuild(meta: dict[str, Any] | None) -> bool:
+    if meta is None or meta.get("version") != FEATURE_CACHE_VERSION:
+        return True
+    if not meta.get("latest_game_date") or not meta.get("full_rebuild_at"):
+        return True
+    rebuilt_at = datetime.fromisoformat(meta["full_rebuild_at"])
+    return datetime.now(timezone.utc) - rebuilt_at > timedelta(days=FULL_REBUILD_DAYS)
+
+
+def refresh_training_frame(
+    kind: str,
+    *,
+    engine=None,
+    database_url: str | None = None,
+    full: bool = False,
+) -> tuple[dict[str, Any], pd.DataFrame]:
+    """
+    Bring the persisted feature frame up to the latest final game. Rows on or
+    after the cached watermark date are rebuilt from a lookback window and
+    replace the cached rows; older rows are reused as-is. Refreshes of the
+    same kind are serialised across processes with a file lock.
+    """
+    if kind not in FRAME_BUILDERS:
+        raise ValueError(f"Unknown frame kind: {kind}")
+    engine = engine or get_engine(database_url)
+    with _refresh_lock(kind):
+        return _refresh_training_frame_locked(kind, engine=engine, full=full)
+
+
+def _refresh_training_frame_locked(
+    kind: str, *, engine, full: bool
+) -> tuple[dict[str, Any], pd.DataFrame]:
+    builder = FRAME_BUILDERS[kind]
+    watermark = _source_watermark(engine)
+    meta = _load_meta(kind)
+
+    if full or _needs_full_rebuild(meta):
+        frame = builder(engine=engine)
+        seasons = set(frame["season"].dropna().astype(int)) if not frame.empty else set()
+        _write_seasons(kind, frame, seasons)
+        # Only now drop seasons the rebuild no longer produces (and scratch
+        # files left behind by an interrupted writer).
+        current = {f"season={season}{_partition_suffix()}" for season in seasons}
+        for stale in _frame_dir(kind).glob("season=*"):
+            if stale.name not in current:
+                stale.unlink(missing_ok=True)
+        meta = _write_meta(
+            kind, watermark, full_rebuild_at=datetime.now(timezone.utc).isoformat()
+        )
+        return meta, frame
+
+    cached = _read_cached_frame(kind)
+    if (
+        meta["latest_game_date"] == watermark["latest_game_date"]
+        and meta["final_games"] == watermark["final_games"]
+    ):
+        return meta, cached
+
+    # Re-derive from the cached watermark date (inclusive: more games from that
+    # date may have gone final since) and splice the new rows in.
+    watermark_date = date.fromisoformat(meta["latest_game_date"])
+    since = watermark_date - timedelta(days=FEATURE_LOOKBACK_DAYS)
+    recent = builder(engine=engine, since=since)
+    if not recent.empty:
+        recent = recent[recent["game_date"] >= pd.Timestamp(watermark_date)]
+
+    keep = cached[cached["game_date"] < pd.Timestamp(watermark_date)] if not cached.empty else cached
+    frame = pd.concat([keep, recent], ignore_index=True) if not recent.empty else keep
+    touched_seasons = set(recent["season"].dropna().astype(int)) if not recent.empty else set()
+    if not cached.empty:
+        touched_seasons |= set(
+            cached.loc[cached["game_date"] >= pd.Timestamp(watermark_date), "season"]
+            .dropna()
+            .astype(int)
+        )
+    _write_seasons(kind, frame, touched_seasons)
+    meta = _write_meta(kind, watermark, full_rebuild_at=meta["full_rebuild_at"])
+    return meta, frame
+
+
+def load_training_frame(
+    kind: str,
+    *,
+    engine=None,
+    database_url: str | None = None,
+    full: bool = False,
+    copy: bool = True,
+    memoize: bool = True,
+) -> pd.DataFrame:
+    """
+    Return the cached training frame for `kind` ("batter" or "pitcher"),
+    extending it first if new final games exist. Frames are also memoised
+    in-process per watermark, so repeated slate scoring skips the disk read.
+    Callers get a copy they may modify; with copy=False they get the shared
+    frame and must treat it as read-only (e.g. to build a compact copy).
+    With memoize=False a freshly loaded frame is not kept in-process, so
+    one-off batch callers (training) can free it once they are done with it.
+    """
+    engine = engine or get_engine(database_url)
+    memo_key = (kind, str(engine.url))
+    with _memory_lock:
+        memo = _memory_frames.get(memo_key)
+    if memo is not None and not full:
+        meta, frame = memo
+        watermark = _source_watermark(engine)
+        if (
+            meta.get("latest_game_date") == watermark["latest_game_date"]
+            and meta.get("final_games") == watermark["final_games"]
+            and not _needs_full_rebuild(meta)
+        ):
+            return frame.copy() if copy else frame
+
+    meta, frame = refresh_training_frame(kind, engine=engine, full=full)
+    if not memoize:
+        return frame.copy() if copy else frame
+    with _memory_lock:
+        _memory_frames[memo_key] = (meta, frame)
+    return frame.copy() if copy else frame
+
+
+def clear_memory_cache() -> None:
+    with _memory_lock:
+        _memory_frames.clear()
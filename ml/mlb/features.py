@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from datetime import date
 from pathlib import Path
 from typing import Iterable
 
@@ -39,20 +40,59 @@ def _add_group_rolling(
     prefix: str,
     add_sums: bool = True,
 ) -> pd.DataFrame:
+    """
+    Trailing per-group rolling means (and sums) over the previous `window`
+    rows, excluding the current row; equivalent to
+    `groupby.shift(1).rolling(window, min_periods=1)` per column.
+
+    All columns and windows are computed in one pass: rows are sorted so each
+    group is contiguous, and every window sum is a difference of two rows of a
+    running cumulative sum, clipped at the group start.
+    """
     group_cols = [group_cols] if isinstance(group_cols, str) else group_cols
-    df = df.sort_values(group_cols + ["game_date", "game_pk"]).copy()
-    grouped = df.groupby(group_cols, sort=False)
-    for col in value_cols:
-        shifted = grouped[col].shift(1)
+    value_cols = list(value_cols)
+    windows = list(windows)
+    df = df.sort_values(group_cols + ["game_date", "game_pk"])
+    if df.empty or not value_cols:
+        return df.copy()
+
+    row_count = len(df)
+    group_ids = df.groupby(group_cols, sort=False).ngroup().to_numpy()
+    positions = np.arange(row_count)
+    is_group_start = np.r_[True, group_ids[1:] != group_ids[:-1]]
+    group_start = np.maximum.accumulate(np.where(is_group_start, positions, 0))
+
+    values = df[value_cols].to_numpy(dtype="float64", na_value=np.nan)
+    observed = ~np.isnan(values)
+    # prefix sums with a leading zero row: rows [lo, hi) sum to cum[hi] - cum[lo]
+    cum_values = np.zeros((row_count + 1, len(value_cols)))
+    np.cumsum(np.where(observed, values, 0.0), axis=0, out=cum_values[1:])
+    cum_counts = np.zeros((row_count + 1, len(value_cols)), dtype=np.int64)
+    np.cumsum(observed, axis=0, out=cum_counts[1:])
+    # rows with a missing group key get no history, as with groupby(dropna=True)
+    missing_group = group_ids < 0
+
+    window_stats = {}
+    for window in windows:
+        window_start = np.maximum(group_start, positions - window)
+        counts = cum_counts[positions] - cum_counts[window_start]
+        sums = cum_values[positions] - cum_values[window_start]
+        has_history = (counts > 0) & ~missing_group[:, None]
+        sums = np.where(has_history, sums, np.nan)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = sums / counts
+        window_stats[window] = (means, sums)
+
+    new_columns = {}
+    for col_index, col in enumerate(value_cols):
         for window in windows:
-            df[f"{prefix}_{col}_avg_last{window}"] = shifted.groupby(
-                [df[group_col] for group_col in group_cols], sort=False
-            ).transform(lambda series: series.rolling(window, min_periods=1).mean())
+            means, sums = window_stats[window]
+            new_columns[f"{prefix}_{col}_avg_last{window}"] = means[:, col_index]
             if add_sums:
-                df[f"{prefix}_{col}_sum_last{window}"] = shifted.groupby(
-                    [df[group_col] for group_col in group_cols], sort=False
-                ).transform(lambda series: series.rolling(window, min_periods=1).sum())
-    return df
+                new_columns[f"{prefix}_{col}_sum_last{window}"] = sums[:, col_index]
+
+    base = df.drop(columns=[col for col in new_columns if col in df.columns])
+    return pd.concat([base, pd.DataFrame(new_columns, index=df.index)], axis=1)
 
 
 def _add_player_schedule_features(df: pd.DataFrame, player_col: str) -> pd.DataFrame:
@@ -65,7 +105,7 @@ def _add_player_schedule_features(df: pd.DataFrame, player_col: str) -> pd.DataF
     return df
 
 
-def _load_weather_features(engine) -> pd.DataFrame:
+def _load_weather_features(engine, since: date | None = None) -> pd.DataFrame:
     return _read_sql(
         """
         with ranked as (
@@ -89,12 +129,17 @@ def _load_weather_features(engine) -> pd.DataFrame:
                     order by abs(coalesce(game_time_offset_hours, 9999))
                 ) as rn
             from mlb_weather_snapshots
+            where cast(%(since)s as date) is null
+               or game_pk in (
+                   select g.game_pk from mlb_games g where g.official_date >= cast(%(since)s as date)
+               )
         )
         select *
         from ranked
         where rn = 1
         """,
         engine,
+        params={"since": since},
     ).drop(columns=["rn"], errors="ignore")
 
 
@@ -120,7 +165,7 @@ def _load_park_features(engine) -> pd.DataFrame:
     )
 
 
-def _load_batter_batted_ball_history(engine) -> pd.DataFrame:
+def _load_batter_batted_ball_history(engine, since: date | None = None) -> pd.DataFrame:
     history = _read_sql(
         """
         select
@@ -145,9 +190,11 @@ def _load_batter_batted_ball_history(engine) -> pd.DataFrame:
         from mlb_batted_ball_events bb
         join mlb_games g on g.game_pk = bb.game_pk
         where bb.batter_id is not null
+          and (cast(%(since)s as date) is null or g.official_date >= cast(%(since)s as date))
         group by bb.game_pk, bb.batter_id, g.official_date
         """,
         engine,
+        params={"since": since},
     )
     if history.empty:
         return history
@@ -187,7 +234,7 @@ def _load_batter_batted_ball_history(engine) -> pd.DataFrame:
     return history[keep_cols]
 
 
-def _load_pitcher_pitch_history(engine) -> pd.DataFrame:
+def _load_pitcher_pitch_history(engine, since: date | None = None) -> pd.DataFrame:
     history = _read_sql(
         """
         select
@@ -219,9 +266,11 @@ def _load_pitcher_pitch_history(engine) -> pd.DataFrame:
         from mlb_pitch_events pe
         join mlb_games g on g.game_pk = pe.game_pk
         where pe.pitcher_id is not null
+          and (cast(%(since)s as date) is null or g.official_date >= cast(%(since)s as date))
         group by pe.game_pk, pe.pitcher_id, g.official_date
         """,
         engine,
+        params={"since": since},
     )
     if history.empty:
         return history
@@ -268,7 +317,7 @@ def _load_pitcher_pitch_history(engine) -> pd.DataFrame:
     return history[keep_cols]
 
 
-def _load_pitcher_batted_ball_allowed_history(engine) -> pd.DataFrame:
+def _load_pitcher_batted_ball_allowed_history(engine, since: date | None = None) -> pd.DataFrame:
     history = _read_sql(
         """
         select
@@ -293,9 +342,11 @@ def _load_pitcher_batted_ball_allowed_history(engine) -> pd.DataFrame:
         from mlb_batted_ball_events bb
         join mlb_games g on g.game_pk = bb.game_pk
         where bb.pitcher_id is not null
+          and (cast(%(since)s as date) is null or g.official_date >= cast(%(since)s as date))
         group by bb.game_pk, bb.pitcher_id, g.official_date
         """,
         engine,
+        params={"since": since},
     )
     if history.empty:
         return history
@@ -335,7 +386,7 @@ def _load_pitcher_batted_ball_allowed_history(engine) -> pd.DataFrame:
     return history[keep_cols]
 
 
-def _load_bullpen_history(engine) -> pd.DataFrame:
+def _load_bullpen_history(engine, since: date | None = None) -> pd.DataFrame:
     relief = _read_sql(
         """
         select
@@ -354,9 +405,11 @@ def _load_bullpen_history(engine) -> pd.DataFrame:
         from mlb_player_game_pitching p
         join mlb_games g on g.game_pk = p.game_pk
         where p.is_starter = false
+          and (cast(%(since)s as date) is null or g.official_date >= cast(%(since)s as date))
         group by p.game_pk, p.team_id, g.official_date
         """,
         engine,
+        params={"since": since},
     )
     if relief.empty:
         return relief
@@ -423,9 +476,11 @@ def _load_bullpen_history(engine) -> pd.DataFrame:
             on p.game_pk = bb.game_pk and p.player_id = bb.pitcher_id
         join mlb_games g on g.game_pk = bb.game_pk
         where p.is_starter = false
+          and (cast(%(since)s as date) is null or g.official_date >= cast(%(since)s as date))
         group by bb.game_pk, p.team_id, g.official_date
         """,
         engine,
+        params={"since": since},
     )
     if not relief_bbe.empty:
         relief_bbe["game_date"] = pd.to_datetime(relief_bbe["game_date"])
@@ -633,7 +688,7 @@ def _add_matchup_and_venue_features(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def _load_starting_pitchers(engine) -> pd.DataFrame:
+def _load_starting_pitchers(engine, since: date | None = None) -> pd.DataFrame:
     starters = _read_sql(
         """
         select
@@ -654,8 +709,10 @@ def _load_starting_pitchers(engine) -> pd.DataFrame:
         join mlb_games g on g.game_pk = p.game_pk
         left join mlb_players sp on sp.id = p.player_id
         where p.is_starter = true
+          and (cast(%(since)s as date) is null or g.official_date >= cast(%(since)s as date))
         """,
         engine,
+        params={"since": since},
     )
     if starters.empty:
         return starters
@@ -679,7 +736,7 @@ def _load_starting_pitchers(engine) -> pd.DataFrame:
         windows=(5, 10, 20),
         prefix="opp_starter",
     )
-    for extra in (_load_pitcher_pitch_history(engine), _load_pitcher_batted_ball_allowed_history(engine)):
+    for extra in (_load_pitcher_pitch_history(engine, since), _load_pitcher_batted_ball_allowed_history(engine, since)):
         if not extra.empty:
             starters = starters.merge(extra, on=["game_pk", "starter_pitcher_id"], how="left")
     keep_cols = [
@@ -693,7 +750,15 @@ def _load_starting_pitchers(engine) -> pd.DataFrame:
     return starters[keep_cols]
 
 
-def build_batter_training_frame(engine=None, database_url: str | None = None) -> pd.DataFrame:
+def build_batter_training_frame(
+    engine=None,
+    database_url: str | None = None,
+    since: date | None = None,
+) -> pd.DataFrame:
+    """
+    `since` limits every history read to games on or after that date; the
+    feature cache uses it to rebuild only a recent window.
+    """
     engine = engine or get_engine(database_url)
     df = _read_sql(
         """
@@ -740,9 +805,11 @@ def build_batter_training_frame(engine=None, database_url: str | None = None) ->
         left join mlb_venues v on v.id = g.venue_id
         where b.plate_appearances is not null
           and b.plate_appearances > 0
+          and (cast(%(since)s as date) is null or g.official_date >= cast(%(since)s as date))
           and g.detailed_state in ('Final', 'Game Over', 'Completed Early')
         """,
         engine,
+        params={"since": since},
     )
     if df.empty:
         return df
@@ -838,19 +905,19 @@ def build_batter_training_frame(engine=None, database_url: str | None = None) ->
     ]
     df = df.merge(opponent_team[opponent_cols], on=["game_pk", "opponent_team_id"], how="left")
 
-    starters = _load_starting_pitchers(engine)
+    starters = _load_starting_pitchers(engine, since)
     if not starters.empty:
         starters = starters.rename(columns={"team_id": "opponent_team_id"})
         df = df.merge(starters, on=["game_pk", "opponent_team_id"], how="left")
 
-    bullpen = _load_bullpen_history(engine)
+    bullpen = _load_bullpen_history(engine, since)
     if not bullpen.empty:
         df = df.merge(bullpen, on=["game_pk", "opponent_team_id"], how="left")
 
-    for extra in (_load_batter_context(engine), _load_weather_features(engine), _load_park_features(engine)):
+    for extra in (_load_batter_context(engine), _load_weather_features(engine, since), _load_park_features(engine)):
         keys = ["season", "player_id"] if "player_id" in extra.columns else ["game_pk"] if "game_pk" in extra.columns else ["season", "venue_id"]
         df = df.merge(extra, on=keys, how="left")
-    batter_bbe = _load_batter_batted_ball_history(engine)
+    batter_bbe = _load_batter_batted_ball_history(engine, since)
     if not batter_bbe.empty:
         df = df.merge(batter_bbe, on=["game_pk", "player_id"], how="left")
     df["weather_available"] = df["temperature_2m_c"].notna().astype(int)
@@ -861,7 +928,11 @@ def build_batter_training_frame(engine=None, database_url: str | None = None) ->
     return df
 
 
-def build_pitcher_training_frame(engine=None, database_url: str | None = None) -> pd.DataFrame:
+def build_pitcher_training_frame(
+    engine=None,
+    database_url: str | None = None,
+    since: date | None = None,
+) -> pd.DataFrame:
     engine = engine or get_engine(database_url)
     df = _read_sql(
         """
@@ -893,10 +964,12 @@ def build_pitcher_training_frame(engine=None, database_url: str | None = None) -
         join mlb_games g on g.game_pk = p.game_pk
         left join mlb_venues v on v.id = g.venue_id
         where p.is_starter = true
+          and (cast(%(since)s as date) is null or g.official_date >= cast(%(since)s as date))
           and p.strikeouts is not null
           and g.detailed_state in ('Final', 'Game Over', 'Completed Early')
         """,
         engine,
+        params={"since": since},
     )
     if df.empty:
         return df
@@ -948,9 +1021,11 @@ def build_pitcher_training_frame(engine=None, database_url: str | None = None) -
         from mlb_player_game_batting b
         join mlb_games g on g.game_pk = b.game_pk
         where b.plate_appearances is not null
+          and (cast(%(since)s as date) is null or g.official_date >= cast(%(since)s as date))
         group by b.game_pk, b.team_id, g.official_date
         """,
         engine,
+        params={"since": since},
     )
     if not batting.empty:
         batting["game_date"] = pd.to_datetime(batting["game_date"])
@@ -977,7 +1052,7 @@ def build_pitcher_training_frame(engine=None, database_url: str | None = None) -
                 df[f"opponent_batting_opp_pa_sum_last{window}"],
             )
 
-    for extra in (_load_pitcher_context(engine), _load_weather_features(engine), _load_park_features(engine)):
+    for extra in (_load_pitcher_context(engine), _load_weather_features(engine, since), _load_park_features(engine)):
         keys = ["season", "player_id"] if "player_id" in extra.columns else ["game_pk"] if "game_pk" in extra.columns else ["season", "venue_id"]
         df = df.merge(extra, on=keys, how="left")
     df["weather_available"] = df["temperature_2m_c"].notna().astype(int)
@@ -985,45 +1060,103 @@ def build_pitcher_training_frame(engine=None, database_url: str | None = None) -
     return df
 
 
+NON_FEATURE_COLUMNS = {
+    "game_pk",
+    "player_id",
+    "team_id",
+    "home_team_id",
+    "away_team_id",
+    "opponent_team_id",
+    "venue_id",
+    "game_date",
+    "day_night",
+    "target_home_run",
+    "target_hits",
+    "target_total_bases",
+    "target_strikeouts",
+    "plate_appearances",
+    "at_bats",
+    "hits",
+    "doubles",
+    "triples",
+    "home_runs",
+    "total_bases",
+    "walks",
+    "strikeouts",
+    "hit_by_pitch",
+    "outs_recorded",
+    "batters_faced",
+    "pitches_thrown",
+    "strikes",
+    "balls",
+    "hits_allowed",
+    "home_runs_allowed",
+    "earned_runs",
+}
+
+# low-cardinality identity strings stored as pandas categoricals in compact frames
+CATEGORICAL_COLUMNS = (
+    "team_abbreviation",
+    "opponent_team_abbreviation",
+    "batter_bat_side",
+    "starter_pitcher_pitch_hand",
+    "day_night",
+)
+
+
+def _is_numeric_column(series: pd.Series) -> bool:
+    return pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series)
+
+
 def model_feature_columns(df: pd.DataFrame, target_col: str) -> list[str]:
-    excluded = {
-        "game_pk",
-        "player_id",
-        "team_id",
-        "home_team_id",
-        "away_team_id",
-        "opponent_team_id",
-        "venue_id",
-        "game_date",
-        "day_night",
-        "target_home_run",
-        "target_hits",
-        "target_total_bases",
-        "target_strikeouts",
-        "plate_appearances",
-        "at_bats",
-        "hits",
-        "doubles",
-        "triples",
-        "home_runs",
-        "total_bases",
-        "walks",
-        "strikeouts",
-        "hit_by_pitch",
-        "outs_recorded",
-        "batters_faced",
-        "pitches_thrown",
-        "strikes",
-        "balls",
-        "hits_allowed",
-        "home_runs_allowed",
-        "earned_runs",
-    }
     numeric_cols = []
     for col in df.columns:
-        if col in excluded or col == target_col:
+        if col in NON_FEATURE_COLUMNS or col == target_col:
             continue
-        if pd.api.types.is_numeric_dtype(df[col]) or pd.api.types.is_bool_dtype(df[col]):
+        if _is_numeric_column(df[col]):
             if df[col].notna().mean() >= 0.05:
                 numeric_cols.append(col)
     return sorted(numeric_cols)
+
+
+def market_input_columns(df: pd.DataFrame, target_col: str) -> list[str]:
+    """Columns a market's training run reads: target, split/filter keys and candidate features."""
+    columns = [target_col, "game_date", "player_games_played_season"]
+    columns += [
+        col
+        for col in df.columns
+        if col not in NON_FEATURE_COLUMNS
+        and col not in columns
+        and _is_numeric_column(df[col])
+    ]
+    return [col for col in columns if col in df.columns]
+
+
+def compact_training_frame(
+    df: pd.DataFrame,
+    *,
+    columns: Iterable[str] | None = None,
+    float_dtype=np.float32,
+) -> pd.DataFrame:
+    """
+    Return a memory-lean copy of `df`: optionally only `columns`, floats
+    downcast to `float_dtype` (with +/-inf mapped to NaN) and identity strings
+    as categoricals. The input frame is left untouched.
+    """
+    if columns is not None:
+        selected = [col for col in columns if col in df.columns]
+    else:
+        selected = list(df.columns)
+
+    compact_columns = {}
+    for col in selected:
+        series = df[col]
+        if pd.api.types.is_float_dtype(series):
+            values = series.to_numpy(dtype=float_dtype, copy=True)
+            values[np.isinf(values)] = np.nan
+            compact_columns[col] = values
+        elif col in CATEGORICAL_COLUMNS and not isinstance(series.dtype, pd.CategoricalDtype):
+            compact_columns[col] = series.astype("category")
+        else:
+            compact_columns[col] = series
+    return pd.DataFrame(compact_columns, index=df.index)
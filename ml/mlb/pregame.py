@@ -1,7 +1,11 @@
 from __future__ import annotations
 
-from datetime import date, datetime, timedelta
-from functools import lru_cache
+import hashlib
+import json
+import os
+import threading
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
 from typing import Any
 from zoneinfo import ZoneInfo
 
@@ -9,6 +13,7 @@ import numpy as np
 import pandas as pd
 
 from .artifacts import score_frame
+from .feature_cache import _source_watermark, _tmp_path, load_training_frame
 from .features import (
     _add_calendar_features,
     _add_matchup_and_venue_features,
@@ -16,8 +21,6 @@ from .features import (
     _load_park_features,
     _load_weather_features,
     _read_sql,
-    build_batter_training_frame,
-    build_pitcher_training_frame,
     get_engine,
 )
 
@@ -52,15 +55,23 @@ IDENTITY_COLUMNS = {
     "starter_pitcher_pitch_hand",
 }
 
+BASE_DIR = Path(__file__).resolve().parents[1]
+PREGAME_SNAPSHOT_DIR = BASE_DIR / "data" / "mlb" / "pregame_snapshots"
 
-@lru_cache(maxsize=4)
-def _cached_batter_training_history(database_url: str) -> pd.DataFrame:
-    return build_batter_training_frame(database_url=database_url)
+# Bump when the pregame builders change so stored snapshots are rebuilt.
+PREGAME_SNAPSHOT_VERSION = 1
 
+PREGAME_MARKET_FRAMES = {
+    "batter_home_runs": "batter",
+    "batter_hits": "batter",
+    "batter_total_bases": "batter",
+    "pitcher_strikeouts": "pitcher",
+}
 
-@lru_cache(maxsize=4)
-def _cached_pitcher_training_history(database_url: str) -> pd.DataFrame:
-    return build_pitcher_training_frame(database_url=database_url)
+_snapshot_lock = threading.Lock()
+# (kind, database url) -> (date, fingerprint, frame); one date per kind, so
+# the memo does not grow with every date served over the process lifetime.
+_memory_snapshots: dict[tuple[str, str], tuple[str, str, pd.DataFrame]] = {}
 
 
 def resolve_prediction_date(day: str = "tomorrow", target_date: str | date | None = None) -> date:
@@ -294,7 +305,6 @@ def build_batter_home_run_pregame_frame(
     day: str = "tomorrow",
     target_date: str | date | None = None,
 ) -> pd.DataFrame:
-    provided_engine = engine is not None
     engine = engine or get_engine(database_url)
     resolved_date = resolve_prediction_date(day=day, target_date=target_date)
     candidates = _load_candidate_batters(engine, resolved_date)
@@ -304,11 +314,7 @@ def build_batter_home_run_pregame_frame(
         return candidates
 
     candidates["game_date"] = pd.to_datetime(candidates["game_date"])
-    history = (
-        _cached_batter_training_history(database_url).copy()
-        if database_url and not provided_engine
-        else build_batter_training_frame(engine=engine)
-    )
+    history = load_training_frame("batter", engine=engine)
     if history.empty:
         candidates.attrs["prediction_date"] = resolved_date.isoformat()
         candidates.attrs["missing_model_features"] = []
@@ -544,7 +550,6 @@ def build_pitcher_pregame_frame(
     day: str = "tomorrow",
     target_date: str | date | None = None,
 ) -> pd.DataFrame:
-    provided_engine = engine is not None
     engine = engine or get_engine(database_url)
     resolved_date = resolve_prediction_date(day=day, target_date=target_date)
     candidates = _load_candidate_pitchers(engine, resolved_date)
@@ -554,11 +559,7 @@ def build_pitcher_pregame_frame(
         return candidates
 
     candidates["game_date"] = pd.to_datetime(candidates["game_date"])
-    history = (
-        _cached_pitcher_training_history(database_url).copy()
-        if database_url and not provided_engine
-        else build_pitcher_training_frame(engine=engine)
-    )
+    history = load_training_frame("pitcher", engine=engine)
     if history.empty:
         candidates.attrs["prediction_date"] = resolved_date.isoformat()
         candidates.attrs["missing_model_features"] = []
@@ -621,6 +622,173 @@ def build_pitcher_pregame_frame(
     return frame
 
 
+def _snapshot_inputs(engine, target_date: date) -> dict[str, Any]:
+    """Cheap summary of everything a pregame frame for `target_date` reads."""
+    row = _read_sql(
+        """
+        with games as (
+            select *
+            from mlb_games
+            where official_date = %(target_date)s
+        )
+        select
+            (
+                select md5(coalesce(string_agg(
+                    concat_ws(
+                        '|', game_pk, detailed_state, start_time_utc, day_night, venue_id,
+                        probable_home_pitcher_id, probable_away_pitcher_id,
+                        weather_condition, temperature_f, wind_text
+                    ),
+                    ',' order by game_pk
+                ), ''))
+                from games
+            ) as games_hash,
+            (
+                select concat_ws('|', count(*), max(s.id))
+                from mlb_game_snapshots s
+                join games g on g.game_pk = s.game_pk
+            ) as lineup_state,
+            (
+                select concat_ws('|', count(*), max(r.roster_date), max(r.captured_at))
+                from mlb_roster_snapshots r
+                where r.roster_type = 'active'
+                  and r.roster_date <= %(target_date)s
+            ) as roster_state,
+            (
+                select concat_ws('|', count(*), max(w.pulled_at))
+                from mlb_weather_snapshots w
+                join games g on g.game_pk = w.game_pk
+            ) as weather_state
+        """,
+        engine,
+        params={"target_date": target_date},
+    ).iloc[0]
+    return {
+        "games": row["games_hash"],
+        "lineups": row["lineup_state"],
+        "rosters": row["roster_state"],
+        "weather": row["weather_state"],
+        "history": _source_watermark(engine),
+    }
+
+
+def _snapshot_fingerprint(kind: str, inputs: dict[str, Any]) -> str:
+    payload = json.dumps(
+        {"version": PREGAME_SNAPSHOT_VERSION, "kind": kind, **inputs},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _snapshot_paths(kind: str, target_date: date, fingerprint: str) -> tuple[Path, Path]:
+    # The fingerprint is part of the frame's name, so a frame file can only
+    # ever be read back for the inputs it was built from.
+    stem = f"date={target_date.isoformat()}"
+    frame_dir = PREGAME_SNAPSHOT_DIR / kind
+    return frame_dir / f"{stem}.{fingerprint[:16]}.pkl", frame_dir / f"{stem}.json"
+
+
+def _read_snapshot(kind: str, target_date: date, fingerprint: str) -> pd.DataFrame | None:
+    frame_path, _ = _snapshot_paths(kind, target_date, fingerprint)
+    try:
+        return pd.read_pickle(frame_path)
+    except FileNotFoundError:
+        return None
+
+
+def _write_snapshot(
+    kind: str,
+    target_date: date,
+    frame: pd.DataFrame,
+    *,
+    fingerprint: str,
+    inputs: dict[str, Any],
+) -> None:
+    frame_path, meta_path = _snapshot_paths(kind, target_date, fingerprint)
+    frame_path.parent.mkdir(parents=True, exist_ok=True)
+    # Pickle rather than parquet: recent_games holds nested JSON payloads.
+    tmp_path = _tmp_path(frame_path)
+    try:
+        frame.to_pickle(tmp_path)
+        os.replace(tmp_path, frame_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    meta = {
+        "version": PREGAME_SNAPSHOT_VERSION,
+        "kind": kind,
+        "prediction_date": target_date.isoformat(),
+        "fingerprint": fingerprint,
+        "inputs": inputs,
+        "rows": int(len(frame)),
+        "built_at": datetime.now(timezone.utc).isoformat(),
+    }
+    tmp_path = _tmp_path(meta_path)
+    try:
+        tmp_path.write_text(json.dumps(meta, indent=2, default=str), encoding="utf-8")
+        os.replace(tmp_path, meta_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    # frames built from superseded inputs for this date are no longer reachable
+    for stale in frame_path.parent.glob(f"date={target_date.isoformat()}.*.pkl"):
+        if stale != frame_path:
+            stale.unlink(missing_ok=True)
+
+
+def load_pregame_frame(
+    kind: str,
+    engine=None,
+    *,
+    database_url: str | None = None,
+    day: str = "tomorrow",
+    target_date: str | date | None = None,
+    refresh: bool = False,
+) -> pd.DataFrame:
+    """
+    Return the score-ready pregame frame for `kind` ("batter" or "pitcher")
+    from the per-date snapshot, rebuilding it only when that date's games,
+    lineups, rosters or weather (or the feature history) have changed.
+    Callers get a copy they may modify.
+    """
+    if kind == "batter":
+        builder = build_batter_pregame_frame
+    elif kind == "pitcher":
+        builder = build_pitcher_pregame_frame
+    else:
+        raise ValueError(f"Unknown pregame frame kind: {kind}")
+
+    engine = engine or get_engine(database_url)
+    resolved_date = resolve_prediction_date(day=day, target_date=target_date)
+    inputs = _snapshot_inputs(engine, resolved_date)
+    fingerprint = _snapshot_fingerprint(kind, inputs)
+    memo_key = (kind, str(engine.url))
+
+    frame = None
+    if not refresh:
+        with _snapshot_lock:
+            memo = _memory_snapshots.get(memo_key)
+        if memo is not None and memo[:2] == (resolved_date.isoformat(), fingerprint):
+            frame = memo[2]
+        else:
+            frame = _read_snapshot(kind, resolved_date, fingerprint)
+
+    if frame is None:
+        frame = builder(engine=engine, target_date=resolved_date)
+        _write_snapshot(kind, resolved_date, frame, fingerprint=fingerprint, inputs=inputs)
+
+    with _snapshot_lock:
+        _memory_snapshots[memo_key] = (resolved_date.isoformat(), fingerprint, frame)
+    result = frame.copy()
+    result.attrs["prediction_date"] = resolved_date.isoformat()
+    result.attrs["missing_model_features"] = []
+    return result
+
+
+def clear_pregame_snapshot_cache() -> None:
+    with _snapshot_lock:
+        _memory_snapshots.clear()
+
+
 def score_batter_home_run_pregame(
     engine=None,
     *,
@@ -629,7 +797,8 @@ def score_batter_home_run_pregame(
     target_date: str | date | None = None,
     limit: int | None = None,
 ) -> pd.DataFrame:
-    frame = build_batter_home_run_pregame_frame(
+    frame = load_pregame_frame(
+        "batter",
         engine=engine,
         database_url=database_url,
         day=day,
@@ -654,22 +823,15 @@ def score_market_pregame(
     target_date: str | date | None = None,
     limit: int | None = None,
 ) -> pd.DataFrame:
-    if market in {"batter_home_runs", "batter_hits", "batter_total_bases"}:
-        frame = build_batter_pregame_frame(
-            engine=engine,
-            database_url=database_url,
-            day=day,
-            target_date=target_date,
-        )
-    elif market == "pitcher_strikeouts":
-        frame = build_pitcher_pregame_frame(
-            engine=engine,
-            database_url=database_url,
-            day=day,
-            target_date=target_date,
-        )
-    else:
+    if market not in PREGAME_MARKET_FRAMES:
         raise ValueError(f"Unsupported pregame MLB market: {market}")
+    frame = load_pregame_frame(
+        PREGAME_MARKET_FRAMES[market],
+        engine=engine,
+        database_url=database_url,
+        day=day,
+        target_date=target_date,
+    )
 
     prediction_date = resolve_prediction_date(day=day, target_date=target_date).isoformat()
     if frame.empty:
@@ -695,7 +857,8 @@ def score_pregame_slate(
     prediction_date = resolve_prediction_date(day=day, target_date=target_date).isoformat()
     results: dict[str, pd.DataFrame] = {}
 
-    batter_frame = build_batter_pregame_frame(
+    batter_frame = load_pregame_frame(
+        "batter",
         engine=engine,
         day=day,
         target_date=target_date,
@@ -711,7 +874,8 @@ def score_pregame_slate(
             scored.attrs["missing_model_features"] = scored.attrs.get("missing_model_features", [])
         results[market] = scored
 
-    pitcher_frame = build_pitcher_pregame_frame(
+    pitcher_frame = load_pregame_frame(
+        "pitcher",
         engine=engine,
         day=day,
         target_date=target_date,
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ml.mlb.features import _add_group_rolling
+
+
+def _reference_group_rolling(
+    df: pd.DataFrame,
+    *,
+    group_cols,
+    value_cols,
+    windows=(5, 10, 20),
+    prefix: str,
+    add_sums: bool = True,
+) -> pd.DataFrame:
+    """The per-column groupby/shift/rolling implementation the prefix-sum version replaced."""
+    group_cols = [group_cols] if isinstance(group_cols, str) else group_cols
+    df = df.sort_values(group_cols + ["game_date", "game_pk"]).copy()
+    grouped = df.groupby(group_cols, sort=False)
+    for col in value_cols:
+        shifted = grouped[col].shift(1)
+        for window in windows:
+            df[f"{prefix}_{col}_avg_last{window}"] = shifted.groupby(
+                [df[group_col] for group_col in group_cols], sort=False
+            ).transform(lambda series: series.rolling(window, min_periods=1).mean())
+            if add_sums:
+                df[f"{prefix}_{col}_sum_last{window}"] = shifted.groupby(
+                    [df[group_col] for group_col in group_cols], sort=False
+                ).transform(lambda series: series.rolling(window, min_periods=1).sum())
+    return df
+
+
+def _random_frame(seed: int, rows: int = 400) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    player = rng.integers(0, 12, rows).astype("float64")
+    player[rng.random(rows) < 0.05] = np.nan
+    season = rng.choice([2023.0, 2024.0], rows)
+    season[rng.random(rows) < 0.03] = np.nan
+    hits = rng.poisson(1.2, rows).astype("float64")
+    hits[rng.random(rows) < 0.15] = np.nan
+    woba = rng.normal(0.32, 0.08, rows)
+    woba[rng.random(rows) < 0.3] = np.nan
+    return pd.DataFrame(
+        {
+            "player_id": player,
+            "season": season,
+            "game_date": pd.Timestamp("2024-04-01")
+            + pd.to_timedelta(rng.integers(0, 150, rows), unit="D"),
+            "game_pk": rng.permutation(rows),
+            "hits": hits,
+            "woba": woba,
+        }
+    )
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("group_cols", ["player_id", ["player_id", "season"]])
+@pytest.mark.parametrize("add_sums", [True, False])
+def test_add_group_rolling_matches_reference(seed, group_cols, add_sums):
+    frame = _random_frame(seed)
+    kwargs = dict(
+        group_cols=group_cols,
+        value_cols=["hits", "woba"],
+        windows=(1, 3, 5, 20),
+        prefix="bat",
+        add_sums=add_sums,
+    )
+
+    expected = _reference_group_rolling(frame, **kwargs)
+    actual = _add_group_rolling(frame, **kwargs)
+
+    assert list(actual.columns) == list(expected.columns)
+    pd.testing.assert_frame_equal(actual, expected, check_exact=False, rtol=1e-9, atol=1e-12)
+
+
+def test_add_group_rolling_empty_frame():
+    frame = _random_frame(0).iloc[:0]
+    result = _add_group_rolling(frame, group_cols="player_id", value_cols=["hits"], prefix="bat")
+    assert result.empty
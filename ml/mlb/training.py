@@ -2,6 +2,10 @@ from __future__ import annotations
 
 import argparse
 import json
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -9,7 +13,13 @@ from typing import Any
 import joblib
 import numpy as np
 import pandas as pd
-from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
+from sklearn.base import clone
+from sklearn.ensemble import (
+    HistGradientBoostingClassifier,
+    HistGradientBoostingRegressor,
+    RandomForestClassifier,
+    RandomForestRegressor,
+)
 from sklearn.impute import SimpleImputer
 from sklearn.metrics import (
     average_precision_score,
@@ -20,6 +30,7 @@ from sklearn.metrics import (
     roc_auc_score,
 )
 from sklearn.pipeline import Pipeline
+from threadpoolctl import threadpool_limits
 
 try:
     from xgboost import XGBClassifier, XGBRegressor
@@ -27,10 +38,11 @@ except Exception:  # pragma: no cover - optional dependency at runtime
     XGBClassifier = None
     XGBRegressor = None
 
+from .feature_cache import load_training_frame
 from .features import (
-    build_batter_training_frame,
-    build_pitcher_training_frame,
+    compact_training_frame,
     get_engine,
+    market_input_columns,
     model_feature_columns,
 )
 
@@ -39,6 +51,19 @@ BASE_DIR = Path(__file__).resolve().parents[1]
 MODELS_DIR = BASE_DIR / "models" / "mlb"
 REPORTS_DIR = BASE_DIR / "reports" / "mlb"
 
+# threads per candidate fit when train_all runs fits on a process pool
+TRAIN_THREADS_PER_JOB = 4
+
+# model search: successive halving with SEARCH_ETA-fold cuts per rung
+SEARCH_ETA = 3
+SEARCH_MAX_RUNGS = 3
+SEARCH_MIN_ROWS = 2000
+# forests have no early stopping, so early rungs also grow fewer trees
+FOREST_ESTIMATORS = 250
+SEARCH_MIN_FOREST_ESTIMATORS = 50
+XGB_MAX_ESTIMATORS = 2000
+XGB_EARLY_STOPPING_ROUNDS = 50
+
 
 MARKETS = {
     "batter_home_runs": {
@@ -69,88 +94,124 @@ MARKETS = {
 
 
 def _time_split(df: pd.DataFrame, valid_fraction: float = 0.2) -> tuple[pd.Series, pd.Series, str]:
-    dates = sorted(pd.to_datetime(df["game_date"]).dt.date.unique())
+    game_days = pd.to_datetime(df["game_date"]).dt.normalize()
+    dates = np.sort(game_days.unique())
     if len(dates) < 5:
         raise ValueError("Not enough distinct game dates for time-based validation.")
     split_idx = max(1, min(len(dates) - 1, int(len(dates) * (1 - valid_fraction))))
-    split_date = dates[split_idx]
-    train_mask = pd.to_datetime(df["game_date"]).dt.date < split_date
+    split_date = pd.Timestamp(dates[split_idx])
+    train_mask = game_days < split_date
     valid_mask = ~train_mask
     if train_mask.sum() == 0 or valid_mask.sum() == 0:
         raise ValueError("Time split produced an empty train or validation set.")
-    return train_mask, valid_mask, split_date.isoformat()
-
+    return train_mask, valid_mask, split_date.date().isoformat()
+
+
+def _param_grid(grid: dict[str, list[Any]]) -> list[dict[str, Any]]:
+    configs = [{}]
+    for key, values in grid.items():
+        configs = [{**config, key: value} for config in configs for value in values]
+    return configs
+
+
+def _candidate_models(kind: str, y_train: pd.Series) -> dict[str, list[tuple[dict[str, Any], Any]]]:
+    """
+    Search space per model family: a list of (searched params, unfitted
+    estimator). XGBoost configs early-stop on the time-split validation set,
+    so n_estimators is only an upper bound.
+    """
+    xgb_grid = {
+        "max_depth": [3, 4, 6],
+        "learning_rate": [0.03, 0.08],
+        "min_child_weight": [3, 10],
+    }
+    xgb_base = {
+        "n_estimators": XGB_MAX_ESTIMATORS,
+        "early_stopping_rounds": XGB_EARLY_STOPPING_ROUNDS,
+        "tree_method": "hist",
+        "subsample": 0.85,
+        "colsample_bytree": 0.85,
+        "reg_alpha": 0.1,
+        "reg_lambda": 2.0,
+        "random_state": 42,
+        "n_jobs": 4,
+    }
+    hist_grid = {
+        "learning_rate": [0.05, 0.1],
+        "max_leaf_nodes": [15, 31, 63],
+    }
+    hist_base = {
+        "max_iter": 1000,
+        "early_stopping": True,
+        "validation_fraction": 0.1,
+        "n_iter_no_change": 30,
+        "l2_regularization": 1.0,
+        "random_state": 42,
+    }
+    forest_grid = {
+        "min_samples_leaf": [5, 10, 25],
+        "max_features": ["sqrt", 0.3],
+    }
 
-def _candidate_models(kind: str, y_train: pd.Series) -> dict[str, Any]:
-    models: dict[str, Any] = {}
+    models: dict[str, list[tuple[dict[str, Any], Any]]] = {}
     if kind == "classification":
         positives = max(float((y_train == 1).sum()), 1.0)
         negatives = max(float((y_train == 0).sum()), 1.0)
         scale_pos_weight = negatives / positives
         if XGBClassifier is not None:
-            models["xgboost"] = XGBClassifier(
-                n_estimators=500,
-                learning_rate=0.03,
-                max_depth=4,
-                subsample=0.85,
-                colsample_bytree=0.85,
-                min_child_weight=3,
-                reg_alpha=0.1,
-                reg_lambda=2.0,
-                objective="binary:logistic",
-                eval_metric="logloss",
-                random_state=42,
-                n_jobs=4,
+            xgb_base = {**xgb_base, "objective": "binary:logistic", "eval_metric": "logloss"}
+            models["xgboost"] = [
+                (params, XGBClassifier(**xgb_base, **params)) for params in _param_grid(xgb_grid)
+            ]
+            models["xgboost_balanced"] = [
+                (params, XGBClassifier(**xgb_base, **params, scale_pos_weight=scale_pos_weight))
+                for params in _param_grid(xgb_grid)
+            ]
+        models["hist_gradient_boosting"] = [
+            (params, HistGradientBoostingClassifier(**hist_base, **params))
+            for params in _param_grid(hist_grid)
+        ]
+        models["random_forest"] = [
+            (
+                params,
+                RandomForestClassifier(
+                    n_estimators=FOREST_ESTIMATORS, random_state=42, n_jobs=-1, **params
+                ),
             )
-            models["xgboost_balanced"] = XGBClassifier(
-                n_estimators=500,
-                learning_rate=0.03,
-                max_depth=4,
-                subsample=0.85,
-                colsample_bytree=0.85,
-                min_child_weight=3,
-                reg_alpha=0.1,
-                reg_lambda=2.0,
-                objective="binary:logistic",
-                eval_metric="logloss",
-                scale_pos_weight=scale_pos_weight,
-                random_state=42,
-                n_jobs=4,
+            for params in _param_grid(forest_grid)
+        ]
+        models["random_forest_balanced"] = [
+            (
+                params,
+                RandomForestClassifier(
+                    n_estimators=FOREST_ESTIMATORS,
+                    class_weight="balanced_subsample",
+                    random_state=42,
+                    n_jobs=-1,
+                    **params,
+                ),
             )
-        models["random_forest"] = RandomForestClassifier(
-            n_estimators=250,
-            min_samples_leaf=10,
-            random_state=42,
-            n_jobs=-1,
-        )
-        models["random_forest_balanced"] = RandomForestClassifier(
-            n_estimators=250,
-            min_samples_leaf=10,
-            class_weight="balanced_subsample",
-            random_state=42,
-            n_jobs=-1,
-        )
+            for params in _param_grid(forest_grid)
+        ]
     else:
         if XGBRegressor is not None:
-            models["xgboost"] = XGBRegressor(
-                n_estimators=500,
-                learning_rate=0.03,
-                max_depth=4,
-                subsample=0.85,
-                colsample_bytree=0.85,
-                min_child_weight=3,
-                reg_alpha=0.1,
-                reg_lambda=2.0,
-                objective="reg:squarederror",
-                random_state=42,
-                n_jobs=4,
+            xgb_base = {**xgb_base, "objective": "reg:squarederror"}
+            models["xgboost"] = [
+                (params, XGBRegressor(**xgb_base, **params)) for params in _param_grid(xgb_grid)
+            ]
+        models["hist_gradient_boosting"] = [
+            (params, HistGradientBoostingRegressor(**hist_base, **params))
+            for params in _param_grid(hist_grid)
+        ]
+        models["random_forest"] = [
+            (
+                params,
+                RandomForestRegressor(
+                    n_estimators=FOREST_ESTIMATORS, random_state=42, n_jobs=-1, **params
+                ),
             )
-        models["random_forest"] = RandomForestRegressor(
-            n_estimators=250,
-            min_samples_leaf=5,
-            random_state=42,
-            n_jobs=-1,
-        )
+            for params in _param_grid(forest_grid)
+        ]
     return models
 
 
@@ -195,37 +256,38 @@ def _baseline_metrics(kind: str, y_train: pd.Series, y_valid: pd.Series) -> dict
     return _evaluate(kind, y_valid, prediction)
 
 
-def _load_frame(market: str, engine) -> pd.DataFrame:
-    frame_kind = MARKETS[market]["frame"]
-    if frame_kind == "batter":
-        return build_batter_training_frame(engine=engine)
-    if frame_kind == "pitcher":
-        return build_pitcher_training_frame(engine=engine)
-    raise ValueError(f"Unknown frame kind: {frame_kind}")
+def _load_frame(market: str, engine, frame: pd.DataFrame | None = None) -> pd.DataFrame:
+    """
+    Float32 copy of the market's input columns: the target, split/filter keys
+    and every numeric candidate feature; identity strings are dropped. The
+    model's features are only chosen after row filtering (by coverage), so
+    candidates are not pruned further here. Pass `frame` to reuse an already
+    loaded frame of the market's kind.
+    """
+    if frame is None:
+        frame = load_training_frame(
+            MARKETS[market]["frame"], engine=engine, copy=False, memoize=False
+        )
+    if frame.empty:
+        return frame.copy()
+    return compact_training_frame(
+        frame,
+        columns=market_input_columns(frame, MARKETS[market]["target"]),
+    )
 
 
-def train_market(
-    market: str,
-    *,
-    engine=None,
-    database_url: str | None = None,
-    min_player_games: int = 3,
-) -> dict[str, Any]:
-    if market not in MARKETS:
-        raise ValueError(f"Unknown MLB market '{market}'. Choose from: {', '.join(MARKETS)}")
-
-    engine = engine or get_engine(database_url)
+def _prepare_market_data(market: str, df: pd.DataFrame, min_player_games: int) -> dict[str, Any]:
     config = MARKETS[market]
     target_col = config["target"]
     kind = config["kind"]
-    df = _load_frame(market, engine)
     if df.empty:
         raise ValueError(f"No training rows found for {market}.")
 
-    df = df.replace([np.inf, -np.inf], np.nan)
-    df = df.dropna(subset=[target_col, "game_date"]).copy()
+    # one row filter, one copy; inf values were already mapped to NaN
+    row_mask = df[target_col].notna() & df["game_date"].notna()
     if "player_games_played_season" in df.columns:
-        df = df[df["player_games_played_season"].fillna(0) >= min_player_games].copy()
+        row_mask &= df["player_games_played_season"].fillna(0) >= min_player_games
+    df = df.loc[row_mask]
     if df.empty:
         raise ValueError(f"No rows remain for {market} after minimum history filtering.")
 
@@ -234,41 +296,173 @@ def train_market(
         raise ValueError(f"No usable numeric features found for {market}.")
 
     train_mask, valid_mask, split_date = _time_split(df)
-    X_train = df.loc[train_mask, feature_cols]
-    y_train = df.loc[train_mask, target_col].astype(float if kind == "regression" else int)
-    X_valid = df.loc[valid_mask, feature_cols]
-    y_valid = df.loc[valid_mask, target_col].astype(float if kind == "regression" else int)
-
-    baseline = _baseline_metrics(kind, y_train, y_valid)
-    candidates = _candidate_models(kind, y_train)
-    model_results: dict[str, dict[str, Any]] = {"baseline_mean": {"metrics": baseline}}
-    best_name = None
-    best_score = float("inf")
-    best_pipeline = None
+    game_dates = pd.to_datetime(df["game_date"])
+    return {
+        "market": market,
+        "kind": kind,
+        "target": target_col,
+        "feature_cols": feature_cols,
+        "split_date": split_date,
+        "min_player_games": min_player_games,
+        "rows_total": int(len(df)),
+        "date_min": game_dates.min().date().isoformat(),
+        "date_max": game_dates.max().date().isoformat(),
+        "X_train": df.loc[train_mask, feature_cols],
+        "y_train": df.loc[train_mask, target_col].astype(float if kind == "regression" else int),
+        "X_valid": df.loc[valid_mask, feature_cols],
+        "y_valid": df.loc[valid_mask, target_col].astype(float if kind == "regression" else int),
+    }
 
-    for name, model in candidates.items():
-        pipeline = Pipeline(
-            steps=[
-                ("imputer", SimpleImputer(strategy="median")),
-                ("model", model),
-            ]
+
+def _set_model_threads(model: Any, threads: int | None) -> Any:
+    if threads is not None and "n_jobs" in model.get_params():
+        model.set_params(n_jobs=threads)
+    return model
+
+
+def _fit_pipeline(
+    kind: str,
+    model: Any,
+    X_train: pd.DataFrame,
+    y_train: pd.Series,
+    X_valid: pd.DataFrame,
+    y_valid: pd.Series,
+) -> tuple[Pipeline, dict[str, float]]:
+    imputer = SimpleImputer(strategy="median")
+    X_fit = imputer.fit_transform(X_train)
+    if model.get_params().get("early_stopping_rounds"):
+        model.fit(X_fit, y_train, eval_set=[(imputer.transform(X_valid), y_valid)], verbose=False)
+    else:
+        model.fit(X_fit, y_train)
+    pipeline = Pipeline(steps=[("imputer", imputer), ("model", model)])
+    if kind == "classification":
+        prediction = pipeline.predict_proba(X_valid)[:, 1]
+    else:
+        prediction = pipeline.predict(X_valid)
+    return pipeline, _evaluate(kind, y_valid, prediction)
+
+
+def _fitted_rounds(model: Any) -> int | None:
+    best_iteration = getattr(model, "best_iteration", None)
+    if best_iteration is not None:
+        return int(best_iteration) + 1
+    rounds = getattr(model, "n_iter_", None)
+    if rounds is None and isinstance(model, (RandomForestClassifier, RandomForestRegressor)):
+        rounds = len(model.estimators_)
+    return int(rounds) if rounds is not None else None
+
+
+def _rung_model(model: Any, fraction: float) -> Any:
+    """Unfitted copy of `model` sized for a rung that sees `fraction` of the rows."""
+    estimator = clone(model)
+    if isinstance(estimator, (RandomForestClassifier, RandomForestRegressor)) and fraction < 1.0:
+        trees = estimator.get_params()["n_estimators"]
+        estimator.set_params(
+            n_estimators=max(min(trees, SEARCH_MIN_FOREST_ESTIMATORS), int(trees * fraction))
         )
-        pipeline.fit(X_train, y_train)
-        if kind == "classification":
-            prediction = pipeline.predict_proba(X_valid)[:, 1]
-        else:
-            prediction = pipeline.predict(X_valid)
-        metrics = _evaluate(kind, y_valid, prediction)
-        model_results[name] = {"metrics": metrics}
-        score = _score_for_selection(kind, metrics)
+    return estimator
+
+
+def _search_candidate(
+    kind: str,
+    name: str,
+    configs: list[tuple[dict[str, Any], Any]],
+    data: dict[str, Any],
+    threads: int | None = None,
+) -> tuple[str, Pipeline, dict[str, Any]]:
+    """
+    Successive halving over one family's configs: every config is fit on a
+    small random slice of the training rows, the best 1/SEARCH_ETA advance to
+    a SEARCH_ETA-times larger slice, and the last survivor is fit on all rows.
+    Forests, which cannot early-stop, also grow proportionally fewer trees on
+    the partial rungs.
+    Returns the winning pipeline plus its metrics, params and the search trace.
+    """
+    X_train, y_train = data["X_train"], data["y_train"]
+    X_valid, y_valid = data["X_valid"], data["y_valid"]
+    row_count = len(X_train)
+    rung_count = 1
+    while rung_count < SEARCH_MAX_RUNGS and SEARCH_ETA ** rung_count < len(configs):
+        rung_count += 1
+    fractions = [SEARCH_ETA ** -(rung_count - 1 - rung) for rung in range(rung_count)]
+    row_order = np.random.default_rng(42).permutation(row_count)
+
+    survivors = [(index, params, model) for index, (params, model) in enumerate(configs)]
+    trace: list[dict[str, Any]] = []
+    best = None
+    for rung, fraction in enumerate(fractions):
+        if len(survivors) == 1:
+            fraction = 1.0
+        rows = max(min(row_count, SEARCH_MIN_ROWS), int(row_count * fraction))
+        rung_index = np.sort(row_order[:rows])
+        X_rung = X_train.iloc[rung_index]
+        y_rung = y_train.iloc[rung_index]
+
+        scored = []
+        for index, params, model in survivors:
+            entry = {"rung": rung, "rows": int(rows), "config": index, "params": params}
+            try:
+                estimator = _set_model_threads(_rung_model(model, fraction), threads)
+                if threads is not None:
+                    # cap BLAS/OpenMP pools too, so parallel jobs don't oversubscribe cores
+                    with threadpool_limits(limits=threads):
+                        pipeline, metrics = _fit_pipeline(kind, estimator, X_rung, y_rung, X_valid, y_valid)
+                else:
+                    pipeline, metrics = _fit_pipeline(kind, estimator, X_rung, y_rung, X_valid, y_valid)
+            except Exception as exc:
+                entry["error"] = str(exc)
+                trace.append(entry)
+                continue
+            score = _score_for_selection(kind, metrics)
+            entry.update({"score": score, "rounds": _fitted_rounds(pipeline.named_steps["model"])})
+            trace.append(entry)
+            scored.append((score, index, params, model, pipeline, metrics))
+
+        if not scored:
+            raise ValueError(f"Every {name} config failed at rung {rung}.")
+        scored.sort(key=lambda item: item[0])
+        if fraction >= 1.0:
+            best = scored[0]
+            break
+        keep = max(1, -(-len(scored) // SEARCH_ETA))
+        survivors = [(index, params, model) for _, index, params, model, _, _ in scored[:keep]]
+
+    _, index, params, _, pipeline, metrics = best
+    return name, pipeline, {"metrics": metrics, "params": params, "config": index, "search_trace": trace}
+
+
+def _search_candidate_job(
+    data_path: str,
+    kind: str,
+    name: str,
+    configs: list[tuple[dict[str, Any], Any]],
+    threads: int,
+) -> tuple[str, Pipeline, dict[str, Any]]:
+    # market data is shared with workers through a memory-mapped joblib dump
+    data = joblib.load(data_path, mmap_mode="r")
+    return _search_candidate(kind, name, configs, data, threads=threads)
+
+
+def _write_market_artifacts(
+    data: dict[str, Any],
+    model_results: dict[str, dict[str, Any]],
+    fitted: dict[str, Pipeline],
+) -> dict[str, Any]:
+    market = data["market"]
+    kind = data["kind"]
+    best_name = None
+    best_score = float("inf")
+    for name in fitted:
+        score = _score_for_selection(kind, model_results[name]["metrics"])
         if score < best_score:
             best_name = name
             best_score = score
-            best_pipeline = pipeline
-
-    if best_pipeline is None or best_name is None:
+    if best_name is None:
         raise ValueError(f"No candidate model trained for {market}.")
+    best_pipeline = fitted[best_name]
+    feature_cols = data["feature_cols"]
 
+    config = MARKETS[market]
     now = datetime.now(timezone.utc)
     stamp = now.strftime("%Y%m%d_%H%M%S")
     MODELS_DIR.mkdir(parents=True, exist_ok=True)
@@ -279,18 +473,18 @@ def train_market(
     artifact = {
         "market": market,
         "kind": kind,
-        "target": target_col,
+        "target": data["target"],
         "model_name": best_name,
         "model": best_pipeline,
         "feature_columns": feature_cols,
         "trained_at": now.isoformat(),
-        "split_date": split_date,
-        "min_player_games": min_player_games,
-        "rows_total": int(len(df)),
-        "rows_train": int(len(X_train)),
-        "rows_valid": int(len(X_valid)),
-        "date_min": pd.to_datetime(df["game_date"]).min().date().isoformat(),
-        "date_max": pd.to_datetime(df["game_date"]).max().date().isoformat(),
+        "split_date": data["split_date"],
+        "min_player_games": data["min_player_games"],
+        "rows_total": data["rows_total"],
+        "rows_train": int(len(data["X_train"])),
+        "rows_valid": int(len(data["X_valid"])),
+        "date_min": data["date_min"],
+        "date_max": data["date_max"],
     }
     joblib.dump(artifact, model_path)
 
@@ -307,6 +501,35 @@ def train_market(
     return report
 
 
+def train_market(
+    market: str,
+    *,
+    engine=None,
+    database_url: str | None = None,
+    min_player_games: int = 3,
+) -> dict[str, Any]:
+    if market not in MARKETS:
+        raise ValueError(f"Unknown MLB market '{market}'. Choose from: {', '.join(MARKETS)}")
+
+    engine = engine or get_engine(database_url)
+    data = _prepare_market_data(market, _load_frame(market, engine), min_player_games)
+    kind = data["kind"]
+
+    model_results: dict[str, dict[str, Any]] = {
+        "baseline_mean": {"metrics": _baseline_metrics(kind, data["y_train"], data["y_valid"])}
+    }
+    fitted: dict[str, Pipeline] = {}
+    for name, configs in _candidate_models(kind, data["y_train"]).items():
+        try:
+            name, pipeline, result = _search_candidate(kind, name, configs, data)
+        except ValueError as exc:
+            model_results[name] = {"error": str(exc)}
+            continue
+        model_results[name] = result
+        fitted[name] = pipeline
+    return _write_market_artifacts(data, model_results, fitted)
+
+
 def _top_features(pipeline: Pipeline, feature_cols: list[str], limit: int = 30) -> list[dict[str, float | str]]:
     model = pipeline.named_steps["model"]
     values = getattr(model, "feature_importances_", None)
@@ -316,12 +539,79 @@ def _top_features(pipeline: Pipeline, feature_cols: list[str], limit: int = 30)
     return [{"feature": name, "importance": float(value)} for name, value in pairs[:limit]]
 
 
-def train_all(*, database_url: str | None = None, min_player_games: int = 3) -> dict[str, Any]:
+def train_all(
+    *,
+    database_url: str | None = None,
+    min_player_games: int = 3,
+    max_workers: int | None = None,
+    threads_per_job: int = TRAIN_THREADS_PER_JOB,
+) -> dict[str, Any]:
+    """
+    Train every market. Each frame kind is loaded once and shared by its
+    markets; candidate fits for all markets run on a process pool, each job
+    capped at `threads_per_job` threads, and a market's report is written as
+    soon as its last candidate finishes.
+    """
     engine = get_engine(database_url)
-    results = {}
-    for market in MARKETS:
-        results[market] = train_market(market, engine=engine, min_player_games=min_player_games)
-    return results
+    max_workers = max_workers or max(1, (os.cpu_count() or 1) // threads_per_job)
+
+    results: dict[str, Any] = {}
+    market_data: dict[str, dict[str, Any]] = {}
+    for frame_kind in dict.fromkeys(config["frame"] for config in MARKETS.values()):
+        # not memoised, so the full frame is freed once its markets are compacted
+        frame = load_training_frame(frame_kind, engine=engine, copy=False, memoize=False)
+        for market, config in MARKETS.items():
+            if config["frame"] != frame_kind:
+                continue
+            try:
+                market_data[market] = _prepare_market_data(
+                    market, _load_frame(market, engine, frame), min_player_games
+                )
+            except ValueError as exc:
+                results[market] = {"market": market, "status": "failed", "error": str(exc)}
+        del frame
+
+    model_results: dict[str, dict[str, dict[str, Any]]] = {}
+    fitted: dict[str, dict[str, Pipeline]] = {market: {} for market in market_data}
+    pending: dict[str, int] = {}
+
+    with tempfile.TemporaryDirectory(prefix="mlb-train-") as tmp_dir, ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as pool:
+        futures = {}
+        for market, data in market_data.items():
+            kind = data["kind"]
+            data_path = str(Path(tmp_dir) / f"{market}.joblib")
+            joblib.dump(data, data_path)
+            model_results[market] = {
+                "baseline_mean": {"metrics": _baseline_metrics(kind, data["y_train"], data["y_valid"])}
+            }
+            candidates = _candidate_models(kind, data["y_train"])
+            pending[market] = len(candidates)
+            for name, configs in candidates.items():
+                future = pool.submit(_search_candidate_job, data_path, kind, name, configs, threads_per_job)
+                futures[future] = (market, name)
+
+        for future in as_completed(futures):
+            market, name = futures[future]
+            try:
+                _, pipeline, result = future.result()
+                model_results[market][name] = result
+                fitted[market][name] = pipeline
+            except Exception as exc:
+                model_results[market][name] = {"error": str(exc)}
+            pending[market] -= 1
+            if pending[market] == 0:
+                try:
+                    results[market] = _write_market_artifacts(
+                        market_data[market], model_results[market], fitted[market]
+                    )
+                except ValueError as exc:
+                    results[market] = {"market": market, "status": "failed", "error": str(exc)}
+                fitted[market] = {}
+
+    return {market: results[market] for market in MARKETS if market in results}
 
 
 def main() -> None:
@@ -334,10 +624,17 @@ def main() -> None:
     )
     parser.add_argument("--database-url", default=None)
     parser.add_argument("--min-player-games", type=int, default=3)
+    parser.add_argument("--max-workers", type=int, default=None)
+    parser.add_argument("--threads-per-job", type=int, default=TRAIN_THREADS_PER_JOB)
     args = parser.parse_args()
 
     if args.market == "all":
-        results = train_all(database_url=args.database_url, min_player_games=args.min_player_games)
+        results = train_all(
+            database_url=args.database_url,
+            min_player_games=args.min_player_games,
+            max_workers=args.max_workers,
+            threads_per_job=args.threads_per_job,
+        )
     else:
         results = {
             args.market: train_market(
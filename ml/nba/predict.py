@@ -40,6 +40,14 @@ MODELS_DIR = BASE_DIR / "models"
 # Memory savings still come from scoping queries to teams on the target slate.
 HISTORY_WINDOW_DAYS = int(os.getenv("PRED_HISTORY_WINDOW_DAYS", "1600"))
 TEAM_STATS_WINDOW_DAYS = int(os.getenv("PRED_TEAM_STATS_WINDOW_DAYS", "1200"))
+MINUTES_MODEL_PREFIX = "xgb_minutes_model_"
+STAT_MODEL_PREFIXES = {
+    "points": "xgb_points_ensemble_",
+    "assists": "xgb_assists_ensemble_",
+    "rebounds": "xgb_rebounds_ensemble_",
+    "threept": "xgb_threes_ensemble_",
+    "threepa": "xgb_threepa_ensemble_",
+}
 _MODEL_CACHE: dict[str, tuple[str, object]] = {}
 _PLAYER_NAME_CACHE: dict[int, str] | None = None
 _TEAM_ID_CACHE: dict[str, int] | None = None
@@ -60,6 +68,15 @@ def load_latest_model(models_dir: Path, prefix: str, return_path: bool = False):
     return (model, path) if return_path else model
 
 
+def latest_model_versions(stat_type: str, models_dir: Path = MODELS_DIR) -> tuple[str | None, str | None]:
+    """File names of the stat and minutes models predict_<stat> would load now."""
+    versions = []
+    for prefix in (STAT_MODEL_PREFIXES[stat_type], MINUTES_MODEL_PREFIX):
+        models = sorted(models_dir.glob(f"{prefix}*.pkl"))
+        versions.append(models[-1].name if models else None)
+    return versions[0], versions[1]
+
+
 def _load_reference_maps(engine):
     global _PLAYER_NAME_CACHE, _TEAM_ID_CACHE
     if _PLAYER_NAME_CACHE is None:
@@ -282,7 +299,7 @@ def _predict_stat(
     )
 
     if "pred_minutes" in features:
-        minutes_model = load_latest_model(models_dir, "xgb_minutes_model_")
+        minutes_model = load_latest_model(models_dir, MINUTES_MODEL_PREFIX)
         minutes_input = _build_model_input(
             df_next_features, MINUTES_FEATURES, minutes_model
         )
@@ -384,7 +401,7 @@ def predict_points(
         engine,
         day,
         POINTS_FEATURES,
-        "xgb_points_ensemble_",
+        STAT_MODEL_PREFIXES["points"],
         "points",
         models_dir,
         rolling_path,
@@ -407,7 +424,7 @@ def predict_assists(
         engine,
         day,
         ASSISTS_FEATURES,
-        "xgb_assists_ensemble_",
+        STAT_MODEL_PREFIXES["assists"],
         "assists",
         models_dir,
         rolling_path,
@@ -430,7 +447,7 @@ def predict_rebounds(
         engine,
         day,
         REBOUNDS_FEATURES,
-        "xgb_rebounds_ensemble_",
+        STAT_MODEL_PREFIXES["rebounds"],
         "rebounds",
         models_dir,
         rolling_path,
@@ -453,7 +470,7 @@ def predict_threept(
         engine,
         day,
         THREEPT_FEATURES,
-        "xgb_threes_ensemble_",
+        STAT_MODEL_PREFIXES["threept"],
         "threept",
         models_dir,
         rolling_path,
@@ -476,7 +493,7 @@ def predict_threepa(
         engine,
         day,
         THREEPA_FEATURES,
-        "xgb_threepa_ensemble_",
+        STAT_MODEL_PREFIXES["threepa"],
         "threepa",
         models_dir,
         rolling_path,
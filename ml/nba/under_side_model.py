@@ -34,32 +34,59 @@ def _safe_float(value: Any, default: float = 0.0) -> float:
         return default
 
 
+def _float_column(values: list[Any], default: float) -> np.ndarray:
+    return np.fromiter((_safe_float(value, default) for value in values), dtype=float, count=len(values))
+
+
+def _extract_feature_matrix(
+    pred_rows: list[dict],
+    under_profiles: list[dict | None] | None = None,
+) -> np.ndarray:
+    """FEATURES for many prediction rows at once, one row per prediction."""
+    n = len(pred_rows)
+    if under_profiles is None:
+        under_profiles = [None] * n
+
+    center = _float_column(
+        [
+            row.get("pred_p50") if row.get("pred_p50") is not None else row.get("pred_value")
+            for row in pred_rows
+        ],
+        0.0,
+    )
+    p10_raw = [row.get("pred_p10") for row in pred_rows]
+    p90_raw = [row.get("pred_p90") for row in pred_rows]
+    p10 = _float_column(p10_raw, 0.0)
+    p90 = _float_column(p90_raw, 0.0)
+    has_band = np.fromiter(
+        (lo is not None and hi is not None for lo, hi in zip(p10_raw, p90_raw)),
+        dtype=bool,
+        count=n,
+    ) & (p90 > p10)
+    band_width = np.where(has_band, p90 - p10, np.fmax(1.0, np.abs(center) * 0.36))
+
+    confidence = _float_column([row.get("confidence") for row in pred_rows], 65.0)
+
+    has_profile = np.fromiter((bool(profile) for profile in under_profiles), dtype=bool, count=n)
+    under_rate = np.where(
+        has_profile,
+        _float_column([(profile or {}).get("under_rate") for profile in under_profiles], 0.5),
+        0.5,
+    )
+    sample_size = np.maximum(
+        0.0,
+        np.trunc(_float_column([(profile or {}).get("sample_size") for profile in under_profiles], 0.0)),
+    )
+    under_rate_sample = np.where(has_profile, np.minimum(sample_size, 30.0) / 30.0, 0.0)
+
+    return np.column_stack([center, band_width, confidence, under_rate, under_rate_sample])
+
+
 def _extract_feature_row_from_prediction(
     pred_row: dict,
     under_profile: dict | None,
 ) -> list[float]:
-    center = pred_row.get("pred_p50")
-    if center is None:
-        center = pred_row.get("pred_value")
-    center = _safe_float(center, 0.0)
-
-    p10 = pred_row.get("pred_p10")
-    p90 = pred_row.get("pred_p90")
-    if p10 is not None and p90 is not None and _safe_float(p90) > _safe_float(p10):
-        band_width = _safe_float(p90) - _safe_float(p10)
-    else:
-        band_width = max(1.0, abs(center) * 0.36)
-
-    confidence = _safe_float(pred_row.get("confidence"), 65.0)
-
-    under_rate = 0.5
-    under_rate_sample = 0.0
-    if under_profile:
-        under_rate = _safe_float(under_profile.get("under_rate"), 0.5)
-        sample_size = max(0, int(_safe_float(under_profile.get("sample_size"), 0)))
-        under_rate_sample = min(sample_size, 30) / 30.0
-
-    return [center, band_width, confidence, under_rate, under_rate_sample]
+    return _extract_feature_matrix([pred_row], [under_profile])[0].tolist()
 
 
 def _load_training_frame(engine, lookback_days: int | None = None) -> pd.DataFrame:
@@ -239,6 +266,12 @@ def train_under_side_model(
     }
 
 
+def latest_under_side_model_version(models_dir: Path = MODELS_DIR) -> str | None:
+    """File name load_latest_under_side_model would load now, if any."""
+    paths = sorted(models_dir.glob(f"{MODEL_PREFIX}*.pkl"))
+    return paths[-1].name if paths else None
+
+
 def load_latest_under_side_model(models_dir: Path = MODELS_DIR) -> tuple[dict[str, Any], Path]:
     paths = sorted(models_dir.glob(f"{MODEL_PREFIX}*.pkl"))
     if not paths:
@@ -248,17 +281,29 @@ def load_latest_under_side_model(models_dir: Path = MODELS_DIR) -> tuple[dict[st
     return payload, path
 
 
+def predict_under_probabilities(
+    payload: dict[str, Any],
+    stat_type: str,
+    pred_rows: list[dict],
+    under_profiles: list[dict | None] | None = None,
+) -> np.ndarray | None:
+    """Under probabilities for many rows of one stat with a single predict_proba call."""
+    model = payload.get("models", {}).get(stat_type)
+    if model is None:
+        return None
+    if not pred_rows:
+        return np.array([], dtype=float)
+    X = _extract_feature_matrix(pred_rows, under_profiles)
+    return np.clip(model.predict_proba(X)[:, 1], 0.01, 0.99)
+
+
 def predict_under_probability(
     payload: dict[str, Any],
     stat_type: str,
     pred_row: dict,
     under_profile: dict | None = None,
 ) -> float | None:
-    models = payload.get("models", {})
-    model = models.get(stat_type)
-    if model is None:
+    probs = predict_under_probabilities(payload, stat_type, [pred_row], [under_profile])
+    if probs is None:
         return None
-    features = _extract_feature_row_from_prediction(pred_row, under_profile)
-    X = np.array([features], dtype=float)
-    prob = float(model.predict_proba(X)[:, 1][0])
-    return max(0.01, min(0.99, prob))
+    return float(probs[0])